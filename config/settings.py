@@ -47,7 +47,132 @@ class Settings:
         "github_min_stars": 100,
         "tavily_max_results": 10
     }
-    
+
+    # Rate Limits (소스별 토큰 버킷: rate=초당 요청 수, burst=연속 허용 요청 수)
+    RATE_LIMITS = {
+        "arxiv": {"rate": 1 / 3, "burst": 1},  # arXiv API 가이드: 3초당 1회
+        "github": {"rate": 30 / 60, "burst": 5},  # Search API: 인증 시 분당 30회
+        "tavily": {"rate": 100 / 60, "burst": 5},  # Tavily: 분당 100회
+    }
+
+    # GitHub REST API
+    GITHUB_API = {
+        "base_url": "https://api.github.com",
+        "per_page": 50,          # 키워드당 stars 상위 50개 = 1페이지
+        "max_concurrency": 4,    # 키워드 동시 요청 수 (커넥션 풀 크기)
+        "max_rate_wait": 90,     # rate limit 리셋 대기 상한(초), 초과 시 해당 키워드 실패 처리
+        "refresh_pages": 1,      # 증분 모드에서 생성일 조건 없이 다시 보는 stars 상위 페이지 수
+        "num_retries": 2,
+        "timeout": 30
+    }
+
+    # arXiv API
+    ARXIV = {
+        "api_url": "http://export.arxiv.org/api/query",
+        "page_size": 100,       # 요청당 최대 결과 수
+        "num_retries": 3,
+        "timeout": 30
+    }
+
+    # Market Search (Tavily 배치 검색)
+    MARKET_SEARCH = {
+        "max_concurrency": 6,
+        "near_duplicate_threshold": 0.8   # 토큰 Jaccard 유사도 이상이면 같은 쿼리로 취급
+    }
+
+    # Incremental Collection (워터마크 기반 델타 수집)
+    COLLECTION = {
+        "incremental": True,
+        "full_refresh": False,  # True면 코퍼스를 비우고 전체 기간 재수집
+        "corpus_path": "data/processed/corpus.json"
+    }
+
+    # Response Cache (수집 도구 공용 디스크 캐시)
+    CACHE = {
+        "enabled": os.getenv("AI_TRENDS_CACHE", "true").lower() != "false",
+        "dir": "data/raw/cache",
+        "max_size_mb": 500,
+        "ttl_hours": {
+            "arxiv": 24,
+            "github": 12,
+            "trends": 72,
+            "tavily": 72,
+            "translation": 24 * 30,
+            "default": 24
+        }
+    }
+
+    # LLM Response Cache (temperature=0 프롬프트 재사용, 체크포인트 DB와 같은 디렉토리)
+    LLM_CACHE = {
+        "enabled": os.getenv("AI_TRENDS_LLM_CACHE", "true").lower() != "false",
+        "db_path": "outputs/checkpoints/llm_cache.db",
+        "max_size_mb": 200
+    }
+
+    # Embedding Cache (텍스트 해시 → float32 벡터 메모리 맵, 벡터 저장소 빌드/질의 공용)
+    EMBEDDING_CACHE = {
+        "enabled": os.getenv("AI_TRENDS_EMBEDDING_CACHE", "true").lower() != "false",
+        "dir": "data/embedding_cache",   # data/vectorstore 밖 (전체 재생성 때도 유지)
+        "max_entries": 200_000           # MiniLM 384차원 기준 약 300MB
+    }
+
+    # Node Memoization (입력 지문이 같으면 이전 실행(다른 thread 포함)의 노드 결과 재사용, MEMO_NODES 대상)
+    NODE_MEMO = {
+        "enabled": os.getenv("AI_TRENDS_NODE_MEMO", "true").lower() != "false",
+        "db_path": "outputs/checkpoints/node_memo.db",
+        "max_entries": 500,
+        "ttl_hours": {
+            "market_analyzer_agent": 72,   # Tavily 검색 결과 기반 → 응답 캐시와 같은 주기
+            "default": 24 * 30
+        }
+    }
+
+    # Blob Store (큰 상태 필드를 체크포인트 밖 content-addressed 파일로 저장)
+    BLOB_STORE = {
+        "enabled": True,
+        "dir": "outputs/checkpoints/blobs",
+        "min_bytes": 16 * 1024   # 직렬화 크기가 이보다 작으면 상태에 그대로 보관
+    }
+
+    # Weight Sensitivity Sweep (scripts/sweep_weights.py)
+    SWEEP = {
+        "mode": "monte_carlo",   # monte_carlo | grid
+        "samples": 5000,
+        "grid_step": 0.05,
+        "seed": 42,
+        "output_dir": "outputs/sweeps"
+    }
+
+    # Vector Index (RAG 벡터 저장소 백엔드)
+    VECTOR_INDEX = {
+        "backend": os.getenv("AI_TRENDS_VECTOR_BACKEND", "int8"),   # int8 (메모리 맵, 빠른 로드) | chroma
+        "ivf_min_vectors": 100000,  # 청크가 이보다 많으면 IVF 리스트 생성 (미만은 전수 검색)
+        "nprobe": 16                # IVF 검색 시 탐색할 리스트 수
+    }
+
+    # Query Translation (RAG 한국어 질의 → 영어, 응답 캐시 source="translation")
+    TRANSLATION = {
+        "backend": os.getenv("AI_TRENDS_TRANSLATION", "llm"),   # llm | offline (네트워크 없음, 테스트용)
+        "model": "gpt-4o-mini",
+        "max_batch": 16   # LLM 1회 호출당 질의 수
+    }
+
+    # RAG Analysis (per_theme: 예상 Top 테마별 질의 1개씩 / combined: 상위 기술 통합 질의 1개)
+    RAG = {
+        "mode": "per_theme",
+        "max_concurrency": 5,
+        "num_themes": 5,
+        "hybrid": True,     # BM25 + 밀집 검색 RRF 결합 (data/vectorstore/bm25 있을 때)
+        "fetch_k": 20,      # 결합 전 각 검색기에서 가져오는 후보 수
+        "rrf_k": 60
+    }
+
+    # Report Generation (독립 LLM 섹션 동시 호출 수)
+    REPORT = {
+        "max_concurrency": 7,  # Executive Summary + 트렌드 상세 5개 + 전략 제언
+        "spool_dir": "outputs/reports/spool"  # 섹션 단위 체크포인트 (보고서 완성 후 삭제)
+    }
+
     # Paths
     DATA_DIR = "data"
     RAW_DATA_DIR = "data/raw"
@@ -55,5 +180,6 @@ class Settings:
     OUTPUT_DIR = "outputs"
     REPORTS_DIR = "outputs/reports"
     CHECKPOINTS_DIR = "outputs/checkpoints"
+    METRICS_DIR = "outputs/metrics"
 
 settings = Settings()
\ No newline at end of file
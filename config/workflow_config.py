@@ -40,6 +40,43 @@ OPTIONAL_NODES = {
     }
 }
 
+# 결과 재사용 노드 (utils/node_memo.py)
+# - state: 노드가 읽는 GraphState 필드 / settings: 결과에 영향을 주는 Settings 항목
+# - files: 결과에 영향을 주는 파일 (내용 해시)
+# - modules: 노드 로직 모듈 (소스 해시 → 코드가 바뀌면 다시 실행)
+# ※ collector(외부 수집 + 코퍼스 갱신), report(파일 생성)는 부수 효과가 있어 제외
+MEMO_NODES = {
+    "tech_analyzer_agent": {
+        "state": ["papers", "github_repos"],
+        "modules": ["nodes.tech_node", "utils.scoring_engine", "utils.repo_matcher", "config.keywords"],
+    },
+    "market_analyzer_agent": {
+        "state": ["keywords"],
+        "settings": ["LIMITS", "MARKET_SEARCH"],
+        "modules": ["nodes.market_node", "tools.market_tool"],
+    },
+    "rag_analyzer_agent": {
+        "state": ["tech_trends", "market_trends", "market_demands"],
+        "settings": ["RAG", "TRANSLATION", "VECTOR_INDEX"],
+        # 검색 인덱스는 manifest 변경 없이도 다시 생성될 수 있음 → 인덱스 메타 + 청크 ID 목록도 해시
+        "files": [
+            "data/vectorstore/manifest.json",
+            "data/vectorstore/bm25/meta.json",
+            "data/vectorstore/bm25/chunk_ids.json",
+            "data/vectorstore/int8/meta.json",
+            "data/vectorstore/int8/chunk_ids.json",
+        ],
+        "modules": [
+            "nodes.rag_node", "tools.rag_tool", "nodes.cross_node", "utils.scoring_engine", "config.keywords",
+            "utils.translator", "utils.bm25_index", "utils.int8_index", "utils.embedding_cache",
+        ],
+    },
+    "cross_check_agent": {
+        "state": ["tech_trends", "market_trends", "rag_analysis"],
+        "modules": ["nodes.cross_node", "utils.scoring_engine", "config.keywords"],
+    },
+}
+
 # 체크포인트 설정
 CHECKPOINT_CONFIG = {
     "enabled": True,  # False면 메모리만 사용
@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from typing import Literal
 from state.graph_state import GraphState
 from utils.logger import logger
+from utils.blob_store import blob_store
 
 def should_run_rag(state: GraphState) -> Literal["rag_analyzer", "cross_analyzer"]:
     """
@@ -45,21 +46,22 @@ def validate_data_quality(state: GraphState) -> Literal["tech_analyzer", "END"]:
         "tech_analyzer": 분석 계속
         "END": 분석 중단
     """
-    papers = state.get("papers", [])
-    github_repos = state.get("github_repos", [])
+    # blob 참조는 로드 없이 항목 수만 확인
+    num_papers = blob_store.count(state.get("papers"))
+    num_repos = blob_store.count(state.get("github_repos"))
     
     MIN_PAPERS = 50
     MIN_REPOS = 10
     
-    if len(papers) < MIN_PAPERS:
-        logger.error(f"❌ 논문 수 부족: {len(papers)}개 < {MIN_PAPERS}개 (최소)")
+    if num_papers < MIN_PAPERS:
+        logger.error(f"❌ 논문 수 부족: {num_papers}개 < {MIN_PAPERS}개 (최소)")
         logger.error("   분석 중단")
         return "END"
     
-    if len(github_repos) < MIN_REPOS:
-        logger.error(f"❌ GitHub 저장소 부족: {len(github_repos)}개 < {MIN_REPOS}개 (최소)")
+    if num_repos < MIN_REPOS:
+        logger.error(f"❌ GitHub 저장소 부족: {num_repos}개 < {MIN_REPOS}개 (최소)")
         logger.error("   분석 중단")
         return "END"
     
-    logger.info(f"✅ 데이터 품질 검증 통과 (논문 {len(papers)}개, GitHub {len(github_repos)}개)")
+    logger.info(f"✅ 데이터 품질 검증 통과 (논문 {num_papers}개, GitHub {num_repos}개)")
     return "tech_analyzer"
\ No newline at end of file
@@ -2,12 +2,22 @@
 """
 동적 Workflow 생성
 config/workflow_config.py 기반
+- 노드 모듈은 처음 실행될 때 import (LazyNode) → langchain_openai / chromadb / PyMuPDF /
+  pytrends / tavily 등 무거운 의존성은 해당 노드가 실제로 돌 때만 로드
+- MEMO_NODES 노드는 입력 지문이 같으면 이전 결과 재사용 (utils/node_memo.py)
+- create_async_workflow(): AsyncSqliteSaver + 비동기 노드 (app.astream으로 실행)
+  · 노드 모듈에 "<함수>_async" 코루틴이 있으면 사용, 없으면 동기 함수를 스레드에서 실행
+  · 병렬 노드(tech + market)가 같은 이벤트 루프를 공유
 """
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langgraph.checkpoint.memory import MemorySaver
+import asyncio
+import importlib
+import inspect
 import sqlite3
 import sys
+import threading
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -16,47 +26,102 @@ from config.workflow_config import (
     WORKFLOW_NODES,
     WORKFLOW_EDGES,
     PARALLEL_NODES,
+    MEMO_NODES,
     CHECKPOINT_CONFIG
 )
 from utils.logger import logger
+from utils.instrumentation import metrics
+from utils.node_memo import node_memo
+
+class LazyNode:
+    """
+    "모듈:함수" 지연 로딩 노드
+    - 첫 호출 때 모듈을 import하고 함수를 캐시 (import 시간은 해당 노드 계측에 포함)
+    - ainvoke(): 모듈의 "<함수>_async" 코루틴 사용, 없으면 동기 함수를 스레드에서 실행
+    """
+
+    def __init__(self, target: str):
+        self.target = target
+        self.module_name, self.attr = target.split(":")
+        self.__name__ = self.attr
+        self.__qualname__ = self.attr
+        self.__doc__ = f"지연 로딩 노드 ({target})"
+        self._func = None
+        self._async_func = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._func is not None
+
+    def load(self):
+        if self._func is None:
+            with self._lock:
+                if self._func is None:
+                    module = importlib.import_module(self.module_name)
+                    self._async_func = getattr(module, f"{self.attr}_async", None)
+                    self._func = getattr(module, self.attr)
+        return self._func
+
+    def __call__(self, state):
+        return self.load()(state)
+
+    async def ainvoke(self, state):
+        if self._func is None:
+            await asyncio.to_thread(self.load)  # 모듈 import가 이벤트 루프를 막지 않도록
+        if self._async_func is not None:
+            return await self._async_func(state)
+        return await asyncio.to_thread(self._func, state)
+
+    def __repr__(self):
+        return f"LazyNode({self.target!r})"
 
-# ✅ 노드 함수 import
-from nodes.collector_node import data_collector_node
-from nodes.tech_node import tech_analysis_node
-from nodes.market_node import market_analysis_node
-from nodes.rag_node import rag_analysis_node
-from nodes.cross_node import cross_analysis_node
-from nodes.report_node import report_generation_node
 
-# ✅ 노드 이름 → 함수 매핑
+# ✅ 노드 이름 → 함수 매핑 (모듈은 노드 첫 실행 때 import)
 NODE_REGISTRY = {
-    "search_agent": data_collector_node,
-    "tech_analyzer_agent": tech_analysis_node,
-    "market_analyzer_agent": market_analysis_node,
-    "rag_analyzer_agent": rag_analysis_node,
-    "cross_check_agent": cross_analysis_node,
-    "report_writer_agent": report_generation_node,
+    "search_agent": LazyNode("nodes.collector_node:data_collector_node"),
+    "tech_analyzer_agent": LazyNode("nodes.tech_node:tech_analysis_node"),
+    "market_analyzer_agent": LazyNode("nodes.market_node:market_analysis_node"),
+    "rag_analyzer_agent": LazyNode("nodes.rag_node:rag_analysis_node"),
+    "cross_check_agent": LazyNode("nodes.cross_node:cross_analysis_node"),
+    "report_writer_agent": LazyNode("nodes.report_node:report_generation_node"),
 }
 
-def create_workflow():
-    """
-    설정 기반 동적 Workflow 생성
-    """
-    logger.info("="*70)
-    logger.info("🏗️ Workflow 생성 중")
-    logger.info("="*70)
-    
+def _as_async(node_func):
+    """NODE_REGISTRY 항목 → 코루틴 함수"""
+    if isinstance(node_func, LazyNode):
+        return node_func.ainvoke
+    if inspect.iscoroutinefunction(node_func):
+        return node_func
+
+    async def run(state):
+        return await asyncio.to_thread(node_func, state)
+    return run
+
+
+def _build_graph(async_nodes: bool = False) -> StateGraph:
+    """WORKFLOW_NODES / WORKFLOW_EDGES → StateGraph (노드에 재사용 + 계측 래퍼 적용)"""
     workflow = StateGraph(GraphState)
     
-    # 1️⃣ 노드 등록
+    # 1️⃣ 노드 등록 (계측 래퍼 적용)
+    metrics.install_http_hook()
     logger.info("\n📍 노드 등록:")
     for node_name in WORKFLOW_NODES:
         if node_name not in NODE_REGISTRY:
             raise ValueError(f"❌ 노드 '{node_name}'가 NODE_REGISTRY에 없습니다!")
         
         node_func = NODE_REGISTRY[node_name]
+        if async_nodes:
+            node_func = _as_async(node_func)
+            if node_name in MEMO_NODES:
+                node_func = node_memo.wrap_async(node_name, node_func, MEMO_NODES[node_name])
+            node_func = metrics.instrument_async_node(node_name, node_func)
+        else:
+            if node_name in MEMO_NODES:
+                node_func = node_memo.wrap(node_name, node_func, MEMO_NODES[node_name])
+            node_func = metrics.instrument_node(node_name, node_func)
         workflow.add_node(node_name, node_func)
-        logger.info(f"   ✓ {node_name}")
+        logger.info(f"   ✓ {node_name}{' (결과 재사용)' if node_name in MEMO_NODES and node_memo.enabled else ''}")
     
     # 2️⃣ 엣지 연결
     logger.info("\n🔗 엣지 연결:")
@@ -77,6 +142,29 @@ def create_workflow():
         for parallel_group in PARALLEL_NODES:
             logger.info(f"   ✓ {' + '.join(parallel_group)}")
     
+    return workflow
+
+
+def _compile(workflow: StateGraph, checkpointer):
+    app = workflow.compile(checkpointer=checkpointer)
+    
+    logger.info("\n" + "="*70)
+    logger.info("✅ Workflow 생성 완료")
+    logger.info("="*70 + "\n")
+    
+    return app
+
+
+def create_workflow():
+    """
+    설정 기반 동적 Workflow 생성 (동기 노드, app.stream / app.invoke용)
+    """
+    logger.info("="*70)
+    logger.info("🏗️ Workflow 생성 중")
+    logger.info("="*70)
+    
+    workflow = _build_graph(async_nodes=False)
+    
     # 4️⃣ 체크포인터 설정
     if CHECKPOINT_CONFIG["enabled"]:
         db_path = CHECKPOINT_CONFIG["db_path"]
@@ -93,13 +181,52 @@ def create_workflow():
         logger.info(f"\n💾 체크포인트: 메모리만 (재개 불가)")
     
     # 5️⃣ 컴파일
-    app = workflow.compile(checkpointer=checkpointer)
+    return _compile(workflow, checkpointer)
+
+
+async def create_async_workflow():
+    """
+    설정 기반 동적 Workflow 생성 (비동기 노드 + AsyncSqliteSaver, app.astream / app.ainvoke용)
+    - 실행 중인 이벤트 루프 안에서 호출 (AsyncSqliteSaver가 현재 루프에 묶임)
+    - 사용 후 close_workflow(app)로 체크포인트 연결 종료
+    """
+    logger.info("="*70)
+    logger.info("🏗️ Workflow 생성 중 (async)")
+    logger.info("="*70)
     
-    logger.info("\n" + "="*70)
-    logger.info("✅ Workflow 생성 완료")
-    logger.info("="*70 + "\n")
+    workflow = _build_graph(async_nodes=True)
     
-    return app
+    # 4️⃣ 체크포인터 설정 (동기 버전과 같은 DB 파일 → 어느 쪽으로 실행한 thread든 재개 가능)
+    if CHECKPOINT_CONFIG["enabled"]:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        
+        db_path = CHECKPOINT_CONFIG["db_path"]
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        
+        conn = aiosqlite.connect(db_path)
+        await conn  # 연결 스레드 시작
+        checkpointer = AsyncSqliteSaver(conn)
+
+        logger.info(f"\n💾 체크포인트: 활성화 (async)")
+        logger.info(f"   경로: {db_path}")
+        logger.info(f"   → 중단 후 재개 가능")
+    else:
+        checkpointer = MemorySaver()
+        logger.info(f"\n💾 체크포인트: 메모리만 (재개 불가)")
+    
+    # 5️⃣ 컴파일
+    return _compile(workflow, checkpointer)
+
+
+async def close_workflow(app) -> None:
+    """create_async_workflow()의 체크포인트 연결 종료"""
+    conn = getattr(app.checkpointer, "conn", None)
+    if conn is None:
+        return
+    closed = conn.close()
+    if inspect.isawaitable(closed):
+        await closed
 
 # graph/workflow.py
 def visualize_workflow(app, save_image: bool = True):
@@ -3,14 +3,20 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from graph.workflow import create_workflow, visualize_workflow
+from graph.workflow import create_async_workflow, close_workflow, visualize_workflow
 from config.settings import settings
 from utils.logger import logger
-from utils.visualizer import plot_trend_scores, plot_score_breakdown
+from utils.response_cache import response_cache
+from utils.llm_cache import llm_cache
+from utils.embedding_cache import embedding_cache
+from utils.blob_store import blob_store
+from utils.node_memo import node_memo
+from utils.instrumentation import metrics
 from datetime import datetime
+import asyncio
 
-def main():
-    """메인 실행 함수"""
+async def amain():
+    """메인 실행 함수 (비동기 그래프 실행, app.astream)"""
     start_time = datetime.now()
     
     logger.info("="*70)
@@ -22,7 +28,7 @@ def main():
     logger.info(f"🎯 목표: Top {settings.ANALYSIS['num_trends']}개 트렌드 발굴\n")
     
     # 1. Workflow 생성
-    app = create_workflow()
+    app = await create_async_workflow()
     
     # 2. 그래프 시각화
     visualize_workflow(app)
@@ -57,7 +63,7 @@ def main():
     try:
         completed_steps = set()
         
-        for event in app.stream(initial_state, config, stream_mode="values"):
+        async for event in app.astream(initial_state, config, stream_mode="values"):
             # 각 노드별 완료 상태 체크
             if event.get("step_collector") and "collector" not in completed_steps:
                 logger.info("\n" + "="*70)
@@ -96,7 +102,7 @@ def main():
                 completed_steps.add("report")
         
         # 6. 최종 상태 확인
-        final_state = app.get_state(config).values
+        final_state = (await app.aget_state(config)).values
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -109,24 +115,17 @@ def main():
         logger.info(f"\n⏱️  실행 시간: {duration:.1f}초 ({duration/60:.1f}분)")
         
         # 최종 보고서 확인
-        if final_state.get("final_report"):
-            logger.info(f"📄 보고서 길이: {len(final_state['final_report']):,}자")
-            
-            # 생성된 파일 찾기
-            import glob
-            md_files = glob.glob("outputs/reports/AI_TRENDS_*.md")
-            pdf_files = glob.glob("outputs/reports/AI_TRENDS_*.pdf")
+        # 상태에는 보고서 파일 참조만 저장됨 (내용은 utils.report_spool.read_report로 로드)
+        report_ref = final_state.get("final_report")
+        if report_ref:
+            logger.info(f"📄 보고서 길이: {report_ref['chars']:,}자 (섹션 {report_ref['sections']}개)")
+            logger.info(f"\n📝 생성된 파일:")
+            logger.info(f"   - Markdown: {report_ref['path']}")
+            logger.info(f"     크기: {report_ref['bytes'] / 1024:.1f} KB")
             
-            if md_files:
-                latest_md = max(md_files, key=os.path.getctime)
-                logger.info(f"\n📝 생성된 파일:")
-                logger.info(f"   - Markdown: {latest_md}")
-                logger.info(f"     크기: {os.path.getsize(latest_md) / 1024:.1f} KB")
-                
-            if pdf_files:
-                latest_pdf = max(pdf_files, key=os.path.getctime)
-                logger.info(f"   - PDF: {latest_pdf}")
-                logger.info(f"     크기: {os.path.getsize(latest_pdf) / 1024 / 1024:.1f} MB")
+            if report_ref.get("pdf_path") and os.path.exists(report_ref["pdf_path"]):
+                logger.info(f"   - PDF: {report_ref['pdf_path']}")
+                logger.info(f"     크기: {os.path.getsize(report_ref['pdf_path']) / 1024 / 1024:.1f} MB")
         
         # Top 5 트렌드 출력
         if final_state.get("top_5_trends"):
@@ -139,6 +138,8 @@ def main():
             # ✅ 시각화 생성
             logger.info(f"\n📊 시각화 생성 중...")
             try:
+                # matplotlib은 차트를 그릴 때만 로드
+                from utils.visualizer import plot_trend_scores, plot_score_breakdown
                 plot_trend_scores(final_state["top_5_trends"])
                 plot_score_breakdown(final_state["top_5_trends"])
                 logger.info("   ✓ 차트 생성 완료")
@@ -147,12 +148,29 @@ def main():
         
         # 수집된 데이터 통계
         logger.info(f"\n📊 수집 데이터 통계:")
-        logger.info(f"   - 논문: {len(final_state.get('papers', []))}개")
-        logger.info(f"   - GitHub: {len(final_state.get('github_repos', []))}개")
+        logger.info(f"   - 논문: {blob_store.count(final_state.get('papers'))}개")
+        logger.info(f"   - GitHub: {blob_store.count(final_state.get('github_repos'))}개")
         logger.info(f"   - 기술 트렌드: {len(final_state.get('tech_trends', []))}개")
         logger.info(f"   - 시장 수요: {len(final_state.get('market_demands', []))}개")
         logger.info(f"   - RAG 분석: {'완료' if final_state.get('rag_analysis', {}).get('answer') else '없음'}")
         
+        # 응답 캐시 통계 + 용량 정리
+        response_cache.log_stats()
+        response_cache.evict()
+        llm_cache.log_stats()
+        llm_cache.evict()
+        node_memo.log_stats()
+        embedding_cache.log_stats()
+        embedding_cache.flush()
+        
+        # 노드별 계측 요약 + 내보내기 (JSON / Prometheus textfile)
+        metrics.log_summary()
+        try:
+            paths = metrics.export(run_id=config["configurable"]["thread_id"])
+            logger.info(f"   📈 계측 저장: {paths['json']}, {paths['prometheus']}")
+        except OSError as e:
+            logger.warning(f"   ⚠️ 계측 저장 실패: {e}")
+        
         # 에러 로그 확인
         if final_state.get("error_log"):
             logger.info(f"\n⚠️  경고/오류 ({len(final_state['error_log'])}건):")
@@ -168,7 +186,7 @@ def main():
         
         return True
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("\n\n⚠️  사용자에 의해 중단됨")
         logger.info(f"   체크포인트 ID: {config['configurable']['thread_id']}")
         logger.info(f"   재개하려면: python scripts/resume_analysis.py --thread-id {config['configurable']['thread_id']}\n")
@@ -179,6 +197,13 @@ def main():
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        await close_workflow(app)
+
+def main():
+    """동기 진입점 (호환용): amain()을 새 이벤트 루프에서 실행"""
+    return asyncio.run(amain())
 
 if __name__ == "__main__":
     success = main()
@@ -3,15 +3,162 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
 from state.graph_state import GraphState
-from tools.arxiv_tool import search_arxiv_papers
-from tools.github_tool import search_github_repos
+from tools.arxiv_tool import search_arxiv_papers, collect_arxiv_by_keyword, collect_arxiv_papers, merge_papers
+from tools.github_tool import (
+    search_github_repos, get_github_client, dedupe_repos, MAX_REPOS_PER_KEYWORD
+)
 from tools.trends_tool import search_google_trends
 from utils.logger import logger
+from utils.corpus_store import CorpusStore
+from utils.blob_store import blob_store
 from config.settings import settings
 from config.keywords import canonicalize_keywords
 
 
+# ==========================================
+# 소스별 수집 (store가 있으면 워터마크 기반 증분 수집)
+# ==========================================
+def _collect_arxiv(keywords: List[str], store: Optional[CorpusStore]) -> List[Dict]:
+    max_results = settings.LIMITS["arxiv_max_per_keyword"]
+    if store is None:
+        return search_arxiv_papers.invoke({
+            "keywords": keywords,
+            "max_results": max_results
+        })
+
+    # 워터마크(가장 최근 publish_date) 이후만 요청
+    since = {k: store.watermark("arxiv", k) for k in keywords if store.watermark("arxiv", k)}
+    by_keyword = asyncio.run(collect_arxiv_by_keyword(keywords, max_results, since=since))
+    return _merge_arxiv(keywords, store, by_keyword, since, max_results)
+
+
+async def _acollect_arxiv(keywords: List[str], store: Optional[CorpusStore]) -> List[Dict]:
+    """_collect_arxiv 비동기 버전 (노드의 이벤트 루프에서 바로 실행)"""
+    max_results = settings.LIMITS["arxiv_max_per_keyword"]
+    if store is None:
+        return await collect_arxiv_papers(keywords, max_results)
+
+    since = {k: store.watermark("arxiv", k) for k in keywords if store.watermark("arxiv", k)}
+    by_keyword = await collect_arxiv_by_keyword(keywords, max_results, since=since)
+    return _merge_arxiv(keywords, store, by_keyword, since, max_results)
+
+
+def _merge_arxiv(keywords: List[str], store: CorpusStore, by_keyword: Dict, since: Dict, max_results: int) -> List[Dict]:
+    """키워드별 새 논문을 코퍼스에 병합 → 분석 기간 논문 목록"""
+    new_count = sum(store.merge_arxiv(k, by_keyword[k], max_results) for k in keywords)
+    logger.info(f"   ↳ 증분 수집: 새 논문 {new_count}개 (워터마크 보유 키워드 {len(since)}개)")
+
+    date_range = settings.ANALYSIS["date_range"]
+    papers_by_keyword = store.papers_by_keyword(date_range["start"], date_range["end"])
+    return merge_papers([p for k in keywords for p in papers_by_keyword.get(k, [])])
+
+
+def _collect_github(keywords: List[str], store: Optional[CorpusStore]) -> List[Dict]:
+    min_stars = settings.LIMITS["github_min_stars"]
+    if store is None:
+        return search_github_repos.invoke({
+            "keywords": keywords,
+            "min_stars": min_stars
+        })
+
+    # 마지막 수집일(당일 포함) 이후 생성된 저장소 + stars 상위 1페이지 재조회 (tools.github_tool.search_keyword)
+    created_after = {}
+    for keyword in keywords:
+        watermark = store.watermark("github", keyword)
+        if watermark:
+            created_after[keyword] = watermark["collected_at"]
+
+    repos_by_keyword = get_github_client().search_keywords(keywords, min_stars, created_after)
+    collected_at = settings.ANALYSIS["date_range"]["end"]
+    new_count = sum(
+        store.merge_github(keyword, repos, MAX_REPOS_PER_KEYWORD, collected_at)
+        for keyword, repos in repos_by_keyword.items()
+    )
+    logger.info(f"   ↳ 증분 수집: 새 저장소 {new_count}개")
+
+    return dedupe_repos(store.repos_by_keyword(), keywords)
+
+
+def _collect_trends(keywords: List[str], store: Optional[CorpusStore]) -> Dict:
+    timeframe = f"{settings.ANALYSIS['date_range']['start']} {settings.ANALYSIS['date_range']['end']}"
+    if store is None:
+        return search_google_trends.invoke({
+            "keywords": keywords,
+            "timeframe": timeframe
+        })
+
+    # Trends 값은 기간 내 상대값 → 새 월이 생긴 키워드만 전체 기간 재요청
+    current_month = settings.ANALYSIS["date_range"]["end"][:7]
+    stale = [k for k in keywords if (store.watermark("trends", k) or "")[:7] != current_month]
+
+    fetched = {}
+    if stale:
+        fetched = search_google_trends.invoke({
+            "keywords": stale,
+            "timeframe": timeframe
+        })
+        for keyword, monthly in fetched.items():
+            store.set_trends(keyword, monthly)
+    logger.info(f"   ↳ 증분 수집: {len(stale)}개 키워드 갱신, {len(keywords) - len(stale)}개 재사용")
+
+    return {**fetched, **store.trends(keywords)}
+
+
+# 소스 이름 → (로그 라벨, 수집 함수, 실패 시 기본값)
+COLLECTION_SOURCES = {
+    "arxiv": ("arXiv", _collect_arxiv, list),
+    "github": ("GitHub", _collect_github, list),
+    "trends": ("Google Trends", _collect_trends, dict),
+}
+
+# 비동기 노드에서 대신 쓰는 코루틴 수집 함수 (없는 소스는 동기 함수를 스레드에서 실행)
+ASYNC_COLLECTORS = {
+    "arxiv": _acollect_arxiv,
+}
+
+
+def _run_source(label: str, collect_fn, keywords: List[str], store: Optional[CorpusStore]):
+    """
+    소스 1개 수집 (스레드에서 실행)
+
+    Returns:
+        (결과, 소요 시간(초), 에러 메시지 또는 None)
+    """
+    started = time.perf_counter()
+    try:
+        result = collect_fn(keywords, store)
+        elapsed = time.perf_counter() - started
+        logger.info(f"   ✅ [{label}] {len(result)}개 수집 완료 ({elapsed:.1f}초)")
+        return result, elapsed, None
+    except Exception as e:
+        elapsed = time.perf_counter() - started
+        logger.error(f"   ❌ [{label}] 수집 실패 ({elapsed:.1f}초): {e}")
+        return None, elapsed, str(e)
+
+
+async def _arun_source(label: str, collect_fn, keywords: List[str], store: Optional[CorpusStore]):
+    """_run_source 비동기 버전 (비동기 수집 함수는 await, 동기 함수는 스레드에서 실행)"""
+    started = time.perf_counter()
+    try:
+        if asyncio.iscoroutinefunction(collect_fn):
+            result = await collect_fn(keywords, store)
+        else:
+            result = await asyncio.to_thread(collect_fn, keywords, store)
+        elapsed = time.perf_counter() - started
+        logger.info(f"   ✅ [{label}] {len(result)}개 수집 완료 ({elapsed:.1f}초)")
+        return result, elapsed, None
+    except Exception as e:
+        elapsed = time.perf_counter() - started
+        logger.error(f"   ❌ [{label}] 수집 실패 ({elapsed:.1f}초): {e}")
+        return None, elapsed, str(e)
+
+
 def data_collector_node(state: GraphState) -> GraphState:
     """
     Agent 1: 데이터 수집
@@ -22,6 +169,54 @@ def data_collector_node(state: GraphState) -> GraphState:
     logger.info("📊 Agent 1: 데이터 수집 시작")
     logger.info("="*70)
 
+    keywords, store, failed = _prepare_collection(state)
+    if failed is not None:
+        return failed
+
+    # 1~3) arXiv / GitHub / Google Trends 병렬 수집 (소스별 에러 격리)
+    logger.info("⚡ 3개 소스 병렬 수집 시작 (arXiv + GitHub + Google Trends)\n")
+    collection_started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=len(COLLECTION_SOURCES), thread_name_prefix="collector") as executor:
+        futures = {
+            name: executor.submit(_run_source, label, collect_fn, keywords, store)
+            for name, (label, collect_fn, _) in COLLECTION_SOURCES.items()
+        }
+        outcomes = {name: future.result() for name, future in futures.items()}
+
+    return _finish_collection(state, keywords, store, outcomes, collection_started)
+
+
+async def data_collector_node_async(state: GraphState) -> GraphState:
+    """data_collector_node 비동기 버전 (arXiv는 이벤트 루프에서, GitHub / Trends는 스레드에서 동시 수집)"""
+    logger.info("="*70)
+    logger.info("📊 Agent 1: 데이터 수집 시작 (async)")
+    logger.info("="*70)
+
+    keywords, store, failed = _prepare_collection(state)
+    if failed is not None:
+        return failed
+
+    logger.info("⚡ 3개 소스 병렬 수집 시작 (arXiv + GitHub + Google Trends)\n")
+    collection_started = time.perf_counter()
+
+    names = list(COLLECTION_SOURCES)
+    results = await asyncio.gather(*[
+        _arun_source(label, ASYNC_COLLECTORS.get(name, collect_fn), keywords, store)
+        for name, (label, collect_fn, _) in COLLECTION_SOURCES.items()
+    ])
+    outcomes = dict(zip(names, results))
+
+    return _finish_collection(state, keywords, store, outcomes, collection_started)
+
+
+def _prepare_collection(state: GraphState):
+    """
+    키워드 정규화 + 증분 수집 코퍼스 준비
+
+    Returns:
+        (키워드, 코퍼스 또는 None, 실패 시 노드 결과 또는 None)
+    """
     # 0) 키워드 준비 (state 우선, 없으면 settings)
     raw_keywords = state.get("keywords", settings.ANALYSIS["keywords"])
     # 정규화 + 화이트리스트 필터
@@ -29,7 +224,7 @@ def data_collector_node(state: GraphState) -> GraphState:
 
     if not keywords:
         logger.error("❌ 유효한 키워드가 없습니다. (정규화/화이트리스트 결과 비어있음)")
-        return {
+        return None, None, {
             **state,
             "papers": [],
             "github_repos": [],
@@ -44,50 +239,49 @@ def data_collector_node(state: GraphState) -> GraphState:
 
     logger.info(f"\n검색 키워드: {keywords}\n")
 
+    # 증분 수집 준비 (워터마크 + 누적 코퍼스)
+    store = None
+    if settings.COLLECTION["incremental"]:
+        store = CorpusStore(settings.COLLECTION["corpus_path"])
+        store.prepare(
+            params={
+                "start": settings.ANALYSIS["date_range"]["start"],
+                "arxiv_max_per_keyword": settings.LIMITS["arxiv_max_per_keyword"],
+                "github_min_stars": settings.LIMITS["github_min_stars"]
+            },
+            full_refresh=settings.COLLECTION["full_refresh"]
+        )
+
+    return keywords, store, None
+
+
+def _finish_collection(state: GraphState, keywords: List[str], store: Optional[CorpusStore], outcomes: Dict, collection_started: float) -> Dict:
+    """소스별 수집 결과 → 코퍼스 저장 + 요약 로그 + 노드 결과"""
     error_log = state.get("error_log", [])
 
-    # 1) arXiv 논문 수집
-    papers = []
-    try:
-        logger.info("1️⃣ arXiv 논문 검색 중...")
-        papers = search_arxiv_papers.invoke({
-            "keywords": keywords,
-            "max_results": settings.LIMITS["arxiv_max_per_keyword"]
-        })
-        logger.info(f"   ✅ {len(papers)}개 논문 수집 완료\n")
-    except Exception as e:
-        error_msg = f"arXiv 수집 실패: {str(e)}"
-        logger.error(f"   ❌ {error_msg}\n")
-        error_log.append(error_msg)
+    collection_timings = {"total": round(time.perf_counter() - collection_started, 2)}
+    collected = {}
+    for name, (result, elapsed, error) in outcomes.items():
+        label, _, empty = COLLECTION_SOURCES[name]
+        collection_timings[name] = round(elapsed, 2)
+        if error is not None:
+            error_log.append(f"{label} 수집 실패: {error}")
+            collected[name] = empty()
+        else:
+            collected[name] = result
 
-    # 2) GitHub 저장소 수집
-    github_repos = []
-    try:
-        logger.info("2️⃣ GitHub 저장소 검색 중...")
-        github_repos = search_github_repos.invoke({
-            "keywords": keywords,
-            "min_stars": settings.LIMITS["github_min_stars"]
-        })
-        logger.info(f"   ✅ {len(github_repos)}개 저장소 수집 완료\n")
-    except Exception as e:
-        error_msg = f"GitHub 수집 실패: {str(e)}"
-        logger.error(f"   ❌ {error_msg}\n")
-        error_log.append(error_msg)
+    papers = collected["arxiv"]
+    github_repos = collected["github"]
+    google_trends = collected["trends"]
 
-    # 3) Google Trends 수집 (정규화된 키워드만 대상으로)
-    google_trends = {}
-    try:
-        logger.info("3️⃣ Google Trends 검색 중...")
-        timeframe = f"{settings.ANALYSIS['date_range']['start']} {settings.ANALYSIS['date_range']['end']}"
-        google_trends = search_google_trends.invoke({
-            "keywords": keywords,
-            "timeframe": timeframe
-        })
-        logger.info(f"   ✅ {len(google_trends)}개 키워드 트렌드 수집 완료\n")
-    except Exception as e:
-        error_msg = f"Google Trends 수집 실패: {str(e)}"
-        logger.error(f"   ❌ {error_msg}\n")
-        error_log.append(error_msg)
+    # 코퍼스 저장 (다음 실행의 워터마크)
+    if store is not None:
+        try:
+            store.save()
+        except Exception as e:
+            error_msg = f"코퍼스 저장 실패: {str(e)}"
+            logger.error(f"   ❌ {error_msg}\n")
+            error_log.append(error_msg)
 
     # 4) 결과 요약
     logger.info("="*70)
@@ -96,13 +290,21 @@ def data_collector_node(state: GraphState) -> GraphState:
     logger.info(f"   📄 논문: {len(papers)}개")
     logger.info(f"   🐙 GitHub: {len(github_repos)}개")
     logger.info(f"   📊 Trends: {len(google_trends)}개 키워드")
+    logger.info(
+        f"   ⏱️  소요 시간: 전체 {collection_timings['total']:.1f}초 "
+        f"(arXiv {collection_timings['arxiv']:.1f}초, "
+        f"GitHub {collection_timings['github']:.1f}초, "
+        f"Trends {collection_timings['trends']:.1f}초)"
+    )
     logger.info("="*70 + "\n")
 
     return {
         "keywords": keywords,               # 정규화된 키워드로 덮어써서 이후 노드가 사용
-        "papers": papers,
-        "github_repos": github_repos,
-        "google_trends": google_trends,
+        # 큰 수집 결과는 blob 저장소에 1번만 쓰고 상태에는 참조만 보관
+        "papers": blob_store.put(papers),
+        "github_repos": blob_store.put(github_repos),
+        "google_trends": blob_store.put(google_trends),
+        "collection_timings": collection_timings,
         "error_log": error_log,
         "messages": [{
             "role": "assistant",
@@ -11,7 +11,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from state.graph_state import GraphState
 from utils.logger import logger
-from config.keywords import CLUSTER_RULES, COMPETITION_MAP
+from utils.blob_store import blob_store
+from utils.scoring_engine import THEME_WEIGHTS, competition_scores, theme_scores as score_themes
+from config.keywords import CLUSTER_RULES
 
 def estimate_competition(tech_name: str, market_name: str = "") -> float:
     """
@@ -19,21 +21,7 @@ def estimate_competition(tech_name: str, market_name: str = "") -> float:
     - COMPETITION_MAP 기반
     - 기술명과 시장명 모두 고려
     """
-    tech_lower = tech_name.lower()
-    market_lower = market_name.lower()
-    
-    max_score = 50.0  # 기본값
-    
-    # 기술명 매칭
-    for key, score in COMPETITION_MAP.items():
-        if key.lower() in tech_lower:
-            max_score = max(max_score, score)
-    
-    # 시장명 매칭 (추가 보너스)
-    if "sme" in market_lower or "enterprise" in market_lower:
-        max_score = min(max_score + 5, 100)
-    
-    return float(max_score)
+    return float(competition_scores([tech_name], [market_name])[0])
 
 
 def calculate_theme_score(
@@ -51,14 +39,69 @@ def calculate_theme_score(
     - 시장 성장률: 25%
     - 경쟁 강도: -15% (패널티)
     """
-    score = (
-        0.25 * avg_tech_score +
-        0.35 * avg_market_score +
-        0.25 * min(avg_cagr * 100 / 50, 100) +  # CAGR 50% 이상이면 만점
-        -0.15 * competition
-    )
+    # CAGR 50% 이상이면 성장률 만점 (가중치: scoring_engine.THEME_WEIGHTS)
+    return float(score_themes([avg_tech_score], [avg_market_score], [avg_cagr], [competition], THEME_WEIGHTS)[0])
+
+
+def match_theme(rules: dict, tech_trends: list, market_trends: list):
+    """
+    CLUSTER_RULES 1개 테마에 해당하는 기술·시장 찾기 (seed 부분 문자열 매칭)
+    
+    Returns:
+        (related_techs, related_markets)
+    """
+    related_techs = []
+    for tech in tech_trends:
+        tech_name_lower = tech["tech_name"].lower()
+        
+        # CLUSTER_RULES의 tech 키워드와 매칭
+        for seed in rules["tech"]:
+            if seed.lower() in tech_name_lower:
+                related_techs.append(tech)
+                break  # 중복 방지
+    
+    related_markets = []
+    for market in market_trends:
+        market_name_lower = market["demand_name"].lower()
+        
+        # CLUSTER_RULES의 market 키워드와 매칭
+        for seed in rules["market"]:
+            if seed.lower() in market_name_lower:
+                related_markets.append(market)
+                break
+    
+    return related_techs, related_markets
+
+
+def theme_score_inputs(tech_trends: list, market_trends: list) -> dict:
+    """
+    테마별 점수 계산 입력값 (평균 기술/시장 점수, 평균 CAGR, 경쟁 강도 + 매칭된 기술·시장 목록)
+    - cross_analysis_node / rag_node.build_theme_queries / 가중치 스윕이 모두 이 함수를 사용 → 테마 순위가 항상 일치
+    - 로그 없음, 기술 또는 시장이 매칭되지 않은 테마는 제외
+    """
+    inputs = {}
+    for theme_name, rules in CLUSTER_RULES.items():
+        related_techs, related_markets = match_theme(rules, tech_trends, market_trends)
+        if not related_techs or not related_markets:
+            continue
+        inputs[theme_name] = {
+            "avg_tech": sum(t["maturity_score"] for t in related_techs) / len(related_techs),
+            "avg_market": sum(m["opportunity_score"] for m in related_markets) / len(related_markets),
+            "avg_cagr": sum(m.get("cagr", 0.20) for m in related_markets) / len(related_markets),
+            "representative_tech": related_techs[0]["tech_name"],
+            "representative_market": related_markets[0]["demand_name"],
+            "related_techs": related_techs,
+            "related_markets": related_markets,
+        }
     
-    return round(max(score, 0), 1)
+    if inputs:
+        competitions = competition_scores(
+            [x["representative_tech"] for x in inputs.values()],
+            [x["representative_market"] for x in inputs.values()]
+        )
+        for x, competition in zip(inputs.values(), competitions):
+            x["competition"] = float(competition)
+    return inputs
 
 
 def cross_analysis_node(state: GraphState) -> GraphState:
@@ -92,90 +135,30 @@ def cross_analysis_node(state: GraphState) -> GraphState:
     # =================================================================
     logger.info("📊 테마별 데이터 매칭 중...\n")
     
+    # 매칭 / 평균 점수 / 경쟁 강도는 theme_score_inputs 한 곳에서 계산 (rag_node 테마 질의와 같은 순위)
+    theme_inputs = theme_score_inputs(tech_trends, market_trends)
     theme_scores = {}
     
-    for theme_name, rules in CLUSTER_RULES.items():
+    for theme_name in CLUSTER_RULES:
         logger.info(f"🔍 [{theme_name}] 분석 중...")
-        
-        # ---------------------------------------------------------
-        # A. 이 테마에 해당하는 기술들 찾기
-        # ---------------------------------------------------------
-        related_techs = []
-        for tech in tech_trends:
-            tech_name_lower = tech["tech_name"].lower()
-            
-            # CLUSTER_RULES의 tech 키워드와 매칭
-            for seed in rules["tech"]:
-                if seed.lower() in tech_name_lower:
-                    related_techs.append(tech)
-                    break  # 중복 방지
-        
-        # ---------------------------------------------------------
-        # B. 이 테마에 해당하는 시장들 찾기
-        # ---------------------------------------------------------
-        related_markets = []
-        for market in market_trends:
-            market_name_lower = market["demand_name"].lower()
-            
-            # CLUSTER_RULES의 market 키워드와 매칭
-            for seed in rules["market"]:
-                if seed.lower() in market_name_lower:
-                    related_markets.append(market)
-                    break
-        
-        # ---------------------------------------------------------
-        # C. 매칭 결과 확인
-        # ---------------------------------------------------------
-        if not related_techs:
-            logger.warning(f"   ⚠️ 매칭된 기술 없음 → 스킵")
-            continue
-        
-        if not related_markets:
-            logger.warning(f"   ⚠️ 매칭된 시장 없음 → 스킵")
+        x = theme_inputs.get(theme_name)
+        if x is None:
+            logger.warning(f"   ⚠️ 매칭된 기술 또는 시장 없음 → 스킵")
             continue
         
+        related_techs, related_markets = x["related_techs"], x["related_markets"]
         logger.info(f"   ✓ 기술 {len(related_techs)}개 매칭")
         logger.info(f"   ✓ 시장 {len(related_markets)}개 매칭")
         
-        # ---------------------------------------------------------
-        # D. 평균 점수 계산
-        # ---------------------------------------------------------
-        avg_tech_score = sum(t["maturity_score"] for t in related_techs) / len(related_techs)
-        avg_market_score = sum(m["opportunity_score"] for m in related_markets) / len(related_markets)
-        
-        # 시장 성장률 (CAGR) 평균
-        avg_cagr = sum(m.get("cagr", 0.20) for m in related_markets) / len(related_markets)
-        
-        # 경쟁 강도 (대표 기술 기준)
-        representative_tech = related_techs[0]["tech_name"]
-        representative_market = related_markets[0]["demand_name"]
-        competition = estimate_competition(representative_tech, representative_market)
-        
-        # 최종 점수
-        final_score = calculate_theme_score(
-            avg_tech_score=avg_tech_score,
-            avg_market_score=avg_market_score,
-            avg_cagr=avg_cagr,
-            competition=competition
-        )
-        
-        # ---------------------------------------------------------
-        # E. 대표 조합 선정 (각 테마당 최고 점수 조합 1개)
-        # ---------------------------------------------------------
-        best_tech = max(related_techs, key=lambda x: x["maturity_score"])
-        best_market = max(related_markets, key=lambda x: x["opportunity_score"])
-        
-        # ---------------------------------------------------------
-        # F. 결과 저장
-        # ---------------------------------------------------------
+        # 대표 조합 (각 테마당 최고 점수 조합 1개) + 근거
         theme_scores[theme_name] = {
-            "final_score": final_score,
-            "tech_score": round(avg_tech_score, 1),
-            "market_score": round(avg_market_score, 1),
-            "cagr": round(avg_cagr, 3),
-            "competition": round(competition, 1),
-            "tech": best_tech,  # 대표 기술 (전체 객체)
-            "market": best_market,  # 대표 시장 (전체 객체)
+            "final_score": None,  # 아래에서 채움
+            "tech_score": round(x["avg_tech"], 1),
+            "market_score": round(x["avg_market"], 1),
+            "cagr": round(x["avg_cagr"], 3),
+            "competition": round(x["competition"], 1),
+            "tech": max(related_techs, key=lambda t: t["maturity_score"]),  # 대표 기술 (전체 객체)
+            "market": max(related_markets, key=lambda m: m["opportunity_score"]),  # 대표 시장 (전체 객체)
             "evidence": {
                 "tech_count": len(related_techs),
                 "market_count": len(related_markets),
@@ -185,9 +168,24 @@ def cross_analysis_node(state: GraphState) -> GraphState:
                 "all_markets": related_markets
             }
         }
+    
+    # 최종 점수 (전체 테마 배치 계산)
+    if theme_inputs:
+        names = list(theme_inputs)
+        inputs = [theme_inputs[name] for name in names]
+        final_scores = score_themes(
+            [x["avg_tech"] for x in inputs],
+            [x["avg_market"] for x in inputs],
+            [x["avg_cagr"] for x in inputs],
+            [x["competition"] for x in inputs],
+            THEME_WEIGHTS
+        )
         
-        logger.info(f"   → 최종 점수: {final_score:.1f}")
-        logger.info(f"      (기술 {avg_tech_score:.1f} + 시장 {avg_market_score:.1f} + 성장 {avg_cagr*100:.0f}% - 경쟁 {competition:.1f})\n")
+        for name, x, final_score in zip(names, inputs, final_scores):
+            theme_scores[name]["final_score"] = float(final_score)
+            logger.info(f"   [{name}] → 최종 점수: {final_score:.1f}")
+            logger.info(f"      (기술 {x['avg_tech']:.1f} + 시장 {x['avg_market']:.1f} + 성장 {x['avg_cagr']*100:.0f}% - 경쟁 {x['competition']:.1f})")
+        logger.info("")
     
     # =================================================================
     # 2️⃣ Top 5 테마 선정
@@ -239,13 +237,22 @@ def cross_analysis_node(state: GraphState) -> GraphState:
     if rag_analysis.get("answer"):
         logger.info("📚 RAG 인사이트 통합 중...")
         
+        per_theme = rag_analysis.get("per_theme", {})
+        num_grounded = 0
+        
         for trend in top_5_trends:
+            # 테마 전용 RAG 결과가 있으면 사용, 없으면 통합 답변
+            insight = per_theme.get(trend["trend_keyword"])
+            if insight and not insight.get("error"):
+                num_grounded += 1
+            else:
+                insight = rag_analysis
             trend["rag_insight"] = {
-                "answer": rag_analysis["answer"][:500],  # 500자만
-                "sources": rag_analysis.get("sources", [])[:2]  # 상위 2개 출처
+                "answer": insight["answer"][:500],  # 500자만
+                "sources": insight.get("sources", [])[:2]  # 상위 2개 출처
             }
         
-        logger.info("   ✓ 각 테마에 RAG 인사이트 추가 완료\n")
+        logger.info(f"   ✓ 각 테마에 RAG 인사이트 추가 완료 (테마 전용 {num_grounded}개)\n")
     
     # =================================================================
     # 4️⃣ 최종 요약
@@ -261,7 +268,7 @@ def cross_analysis_node(state: GraphState) -> GraphState:
     
     return {
         "top_5_trends": top_5_trends,
-        "all_theme_scores": theme_scores,  # 전체 테마 점수 (디버깅용)
+        "all_theme_scores": blob_store.put(theme_scores),  # 전체 테마 점수 (디버깅용, blob 참조)
         "messages": [{
             "role": "assistant",
             "content": f"Top 5 트렌드 선정 완료: {', '.join([t['trend_keyword'] for t in top_5_trends])}"
@@ -4,7 +4,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from state.graph_state import GraphState
-from tools.market_tool import search_market_reports
+from tools.market_tool import search_market_queries, asearch_market_queries
 from utils.logger import logger
 from config.settings import settings
 
@@ -82,6 +82,11 @@ B2B_MARKET_TEMPLATES = [
 ]
 
 
+def _market_search_terms() -> list:
+    """전체 템플릿의 쿼리 (중복 제거는 검색 도구에서)"""
+    return [term for domain in B2B_MARKET_TEMPLATES for term in domain["search_keywords"]]
+
+
 def market_analysis_node(state: GraphState) -> GraphState:
     """
     Agent 3: 시장 분석 (B2B 중심)
@@ -93,27 +98,63 @@ def market_analysis_node(state: GraphState) -> GraphState:
     logger.info("📈 Agent 3: 시장 분석 시작 (B2B 중심)")
     logger.info("=" * 70)
 
-    keywords = state.get("keywords", []) or []
-    keywords_lower = [str(k).lower() for k in keywords]
     error_log = state.get("error_log", [])
+
+    # 전체 템플릿의 쿼리를 한 번에 수집 → 중복 제거 후 동시 검색
+    try:
+        reports_by_query = search_market_queries(
+            _market_search_terms(),
+            max_results=settings.LIMITS.get("market_max_per_query", 5)
+        )
+    except Exception as e:
+        msg = f"Tavily 검색 실패: {e}"
+        logger.error(msg)
+        error_log.append(msg)
+        reports_by_query = {}
+
+    return evaluate_markets(state.get("keywords", []) or [], reports_by_query, error_log)
+
+
+async def market_analysis_node_async(state: GraphState) -> GraphState:
+    """market_analysis_node 비동기 버전 (Tavily 검색을 이벤트 루프에서 동시 실행)"""
+    logger.info("=" * 70)
+    logger.info("📈 Agent 3: 시장 분석 시작 (B2B 중심, async)")
+    logger.info("=" * 70)
+
+    error_log = state.get("error_log", [])
+
+    try:
+        reports_by_query = await asearch_market_queries(
+            _market_search_terms(),
+            max_results=settings.LIMITS.get("market_max_per_query", 5)
+        )
+    except Exception as e:
+        msg = f"Tavily 검색 실패: {e}"
+        logger.error(msg)
+        error_log.append(msg)
+        reports_by_query = {}
+
+    return evaluate_markets(state.get("keywords", []) or [], reports_by_query, error_log)
+
+
+def evaluate_markets(keywords: list, reports_by_query: dict, error_log: list) -> dict:
+    """검색 결과 → 도메인별 기회 점수 + 노드 결과"""
+    keywords_lower = [str(k).lower() for k in keywords]
     results = []
 
     for domain in B2B_MARKET_TEMPLATES:
         demand = domain["demand_name"]
         search_terms = domain["search_keywords"]
-        logger.info(f"\n🔍 시장 검색 → {demand}")
-
-        # Tavily 검색
-        try:
-            tavily_reports = search_market_reports.invoke({
-                "queries": search_terms,
-                "max_results": settings.LIMITS.get("market_max_per_query", 5)
-            })
-        except Exception as e:
-            msg = f"Tavily 검색 실패 ({demand}): {e}"
-            logger.error(msg)
-            error_log.append(msg)
-            tavily_reports = []
+
+        # 도메인 쿼리 결과 매핑 (같은 대표 쿼리 결과는 1번만)
+        tavily_reports = []
+        seen_queries = set()
+        for term in search_terms:
+            reports = reports_by_query.get(term, [])
+            if reports and reports[0]["query"] in seen_queries:
+                continue
+            seen_queries.update(r["query"] for r in reports)
+            tavily_reports.extend(reports)
 
         # 기회 점수 계산
         base_score = 50.0
@@ -1,31 +1,94 @@
 # nodes/rag_node.py
+import asyncio
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from state.graph_state import GraphState
-from tools.rag_tool import analyze_with_fixed_rag
+from tools.rag_tool import analyze_with_fixed_rag, analyze_with_rag_batch, aanalyze_with_rag_batch, loaded_documents
+from nodes.cross_node import theme_score_inputs
+from utils.scoring_engine import THEME_WEIGHTS, theme_scores
+from config.settings import settings
 from utils.logger import logger
 
-def rag_analysis_node(state: GraphState) -> GraphState:
+OVERALL_KEY = "__overall__"  # 배치 안에서 통합 질의 결과 키
+
+
+def build_theme_queries(tech_trends: list, market_trends: list, num_themes: int = 5) -> dict:
     """
-    Agent: RAG 문서 분석 노드
-    고정된 2개 PDF 문서를 기반으로 트렌드 인사이트 추출
+    교차 분석에서 Top으로 뽑힐 테마별 영어 질의 (cross_node와 같은 매칭 규칙 / 가중치로 미리 순위 계산)
+    
+    Returns:
+        {테마 이름: 질의}
     """
-    logger.info("="*70)
-    logger.info("📚 Agent: RAG 문서 분석 시작")
-    logger.info("="*70)
+    inputs = theme_score_inputs(tech_trends, market_trends)
+    if not inputs:
+        return {}
     
-    # 1. 쿼리 생성
-    # 이미 수집된 tech_trends와 market_demands 기반으로 심층 질문 생성
-    tech_trends = state.get("tech_trends", [])
-    market_demands = state.get("market_demands", [])
+    names = list(inputs)
+    scores = theme_scores(
+        [inputs[n]["avg_tech"] for n in names],
+        [inputs[n]["avg_market"] for n in names],
+        [inputs[n]["avg_cagr"] for n in names],
+        [inputs[n]["competition"] for n in names],
+        THEME_WEIGHTS
+    )
+    ranked = sorted(zip(names, scores), key=lambda x: x[1], reverse=True)[:num_themes]
     
-    # 상위 5개 기술 키워드
+    queries = {}
+    for name, _ in ranked:
+        x = inputs[name]
+        queries[name] = (
+            f"How will {x['representative_tech']} shape the '{name}' trend in 2025-2030, "
+            f"especially for {x['representative_market']}? Cover industry applications and success factors, "
+            f"key challenges for companies, expected changes within five years, and investment and market outlook, "
+            f"with concrete examples and figures."
+        )
+    return queries
+
+
+def _per_theme_result(batch: dict) -> dict:
+    """배치 결과 → analyze_with_fixed_rag 형식 + per_theme"""
+    results = dict(batch.get("results", {}))
+    overall = results.pop(OVERALL_KEY, None)
+    
+    if batch.get("error") or overall is None:
+        return {
+            "answer": "RAG 분석 실패: 벡터 저장소 또는 검색 오류 (먼저 'python scripts/build_vectorstore.py' 실행)",
+            "sources": [],
+            "loaded_documents": [],
+            "error": True
+        }
+    
+    retrieval = dict(overall.get("retrieval", {}))
+    retrieval["timings"] = batch.get("timings", {})
+    return {
+        **overall,
+        "loaded_documents": loaded_documents(
+            overall["sources"] + [src for r in results.values() for src in r["sources"]]
+        ),
+        "num_pages": "N/A (사전 인덱싱)",
+        "num_chunks": "N/A (사전 인덱싱)",
+        "retrieval": retrieval,
+        "per_theme": results
+    }
+
+
+def run_per_theme_rag(query: str, theme_queries: dict) -> dict:
+    """통합 질의 + 테마별 질의를 한 배치로 분석 → analyze_with_fixed_rag 형식 + per_theme"""
+    return _per_theme_result(analyze_with_rag_batch.invoke({"queries": {OVERALL_KEY: query, **theme_queries}}))
+
+
+async def arun_per_theme_rag(query: str, theme_queries: dict) -> dict:
+    """run_per_theme_rag 비동기 버전 (답변 LLM 호출을 이벤트 루프에서 동시 실행)"""
+    return _per_theme_result(await aanalyze_with_rag_batch({OVERALL_KEY: query, **theme_queries}))
+
+
+def build_rag_query(tech_trends: list) -> str:
+    """상위 5개 기술 기반 통합 RAG 질문"""
     top_techs = [t["tech_name"] for t in tech_trends[:5]]
     
-    # RAG 질문 생성
-    query = f"""
+    return f"""
 다음 AI 기술들에 대해 2025-2030년 트렌드를 분석해주세요:
 {', '.join(top_techs)}
 
@@ -37,73 +100,131 @@ def rag_analysis_node(state: GraphState) -> GraphState:
 
 구체적인 사례와 수치를 포함하여 답변해주세요.
 """
-    
+
+
+def _plan_rag(state: GraphState) -> tuple:
+    """(통합 질의, {테마: 질의}) - per_theme 모드가 아니거나 테마가 없으면 테마 질의는 빈 dict"""
+    tech_trends = state.get("tech_trends", [])
+    query = build_rag_query(tech_trends)
     logger.info(f"\n생성된 질문:\n{query}\n")
     
-    # 2. RAG 분석 실행
+    theme_queries = {}
+    if settings.RAG["mode"] == "per_theme":
+        theme_queries = build_theme_queries(tech_trends, state.get("market_trends", []), settings.RAG["num_themes"])
+    if theme_queries:
+        logger.info(f"🧩 테마별 질의 {len(theme_queries)}개: {', '.join(theme_queries)}")
+    return query, theme_queries
+
+
+def rag_analysis_node(state: GraphState) -> GraphState:
+    """
+    Agent: RAG 문서 분석 노드
+    고정된 2개 PDF 문서를 기반으로 트렌드 인사이트 추출
+    """
+    logger.info("="*70)
+    logger.info("📚 Agent: RAG 문서 분석 시작")
+    logger.info("="*70)
+    
+    # 1. 쿼리 생성 → 2. RAG 분석 실행 (per_theme: 통합 질의 + 테마별 질의를 한 배치로)
     try:
-        rag_result = analyze_with_fixed_rag.invoke({
-            "query": query,
-            "max_pages_per_doc": 35
-        })
-        
-        # 3. 결과 검증
-        if rag_result.get("error", False):
-            logger.warning("⚠️ RAG 분석 중 오류 발생")
-            logger.warning(f"   {rag_result.get('answer', '')}")
-            
-            # 오류 메시지 기록
-            error_msg = f"RAG 분석 실패: {rag_result.get('answer', 'Unknown error')}"
-            error_log = state.get("error_log", [])
-            error_log.append(error_msg)
-            
-            return {
-                "rag_analysis": rag_result,
-                "error_log": error_log,
-                "messages": [{
-                    "role": "assistant",
-                    "content": f"RAG 분석 중 오류 발생 (문서 확인 필요)"
-                }],
-                "current_step": "rag_failed"
-            }
-        
-        # 4. 성공 시 결과 로깅
-        logger.info("\n" + "="*70)
-        logger.info("✅ RAG 분석 완료")
-        logger.info("="*70)
-        logger.info(f"\n📄 사용된 문서: {', '.join(rag_result['loaded_documents'])}")
-        logger.info(f"📊 처리된 페이지: {rag_result['num_pages']}개")
-        logger.info(f"📦 생성된 청크: {rag_result['num_chunks']}개")
-        logger.info(f"\n💡 RAG 분석 결과 (처음 500자):\n")
-        logger.info(rag_result['answer'][:500] + "...\n")
+        query, theme_queries = _plan_rag(state)
+        if theme_queries:
+            rag_result = run_per_theme_rag(query, theme_queries)
+        else:
+            rag_result = analyze_with_fixed_rag.invoke({"query": query})
+        return _rag_node_result(state, rag_result)
+    except Exception as e:
+        return _rag_node_error(state, e)
+
+
+async def rag_analysis_node_async(state: GraphState) -> GraphState:
+    """rag_analysis_node 비동기 버전"""
+    logger.info("="*70)
+    logger.info("📚 Agent: RAG 문서 분석 시작 (async)")
+    logger.info("="*70)
+    
+    try:
+        query, theme_queries = _plan_rag(state)
+        if theme_queries:
+            rag_result = await arun_per_theme_rag(query, theme_queries)
+        else:
+            rag_result = await asyncio.to_thread(analyze_with_fixed_rag.invoke, {"query": query})
+        return _rag_node_result(state, rag_result)
+    except Exception as e:
+        return _rag_node_error(state, e)
+
+
+def _rag_node_result(state: GraphState, rag_result: dict) -> dict:
+    """RAG 결과 검증 + 로깅 → 노드 결과"""
+    # 3. 결과 검증
+    if rag_result.get("error", False):
+        logger.warning("⚠️ RAG 분석 중 오류 발생")
+        logger.warning(f"   {rag_result.get('answer', '')}")
         
-        if rag_result['sources']:
-            logger.info("📚 주요 출처:")
-            for i, source in enumerate(rag_result['sources'], 1):
-                logger.info(f"   [{i}] {source['source']} (p.{source['page']})")
-                logger.info(f"       {source['content'][:100]}...\n")
+        # 오류 메시지 기록
+        error_msg = f"RAG 분석 실패: {rag_result.get('answer', 'Unknown error')}"
+        error_log = state.get("error_log", [])
+        error_log.append(error_msg)
         
         return {
             "rag_analysis": rag_result,
+            "error_log": error_log,
             "messages": [{
                 "role": "assistant",
-                "content": f"RAG 분석 완료: {len(rag_result['answer'])}자 인사이트 생성"
+                "content": f"RAG 분석 중 오류 발생 (문서 확인 필요)"
             }],
-            "step_rag": "completed"
-        }
-        
-    except Exception as e:
-        logger.error(f"❌ RAG 노드 실행 실패: {e}")
-        
-        error_log = state.get("error_log", [])
-        error_log.append(f"RAG 노드 오류: {str(e)}")
-        
-        return {
-            "rag_analysis": {
-                "answer": f"RAG 분석 실패: {str(e)}",
-                "sources": [],
-                "error": True
-            },
-            "error_log": error_log,
             "current_step": "rag_failed"
-        }
\ No newline at end of file
+        }
+    
+    # 4. 성공 시 결과 로깅
+    logger.info("\n" + "="*70)
+    logger.info("✅ RAG 분석 완료")
+    logger.info("="*70)
+    logger.info(f"\n📄 사용된 문서: {', '.join(rag_result['loaded_documents'])}")
+    logger.info(f"📊 처리된 페이지: {rag_result['num_pages']}개")
+    logger.info(f"📦 생성된 청크: {rag_result['num_chunks']}개")
+    timings = rag_result.get("retrieval", {}).get("timings", {})
+    if timings:
+        logger.info(
+            f"⏱️  검색 {timings.get('retrieve_seconds', 0):.2f}초 / "
+            f"답변 생성 {timings.get('generate_seconds', 0):.2f}초"
+        )
+    logger.info(f"\n💡 RAG 분석 결과 (처음 500자):\n")
+    logger.info(rag_result['answer'][:500] + "...\n")
+    
+    if rag_result['sources']:
+        logger.info("📚 주요 출처:")
+        for i, source in enumerate(rag_result['sources'], 1):
+            logger.info(f"   [{i}] {source['source']} (p.{source['page']}, 관련도 {source.get('score', 'N/A')})")
+            logger.info(f"       {source['content'][:100]}...\n")
+    
+    for theme_name, theme_result in rag_result.get("per_theme", {}).items():
+        status = "✗" if theme_result.get("error") else "✓"
+        logger.info(f"   {status} [{theme_name}] {len(theme_result.get('answer', ''))}자, 출처 {len(theme_result.get('sources', []))}개")
+    
+    return {
+        "rag_analysis": rag_result,
+        "messages": [{
+            "role": "assistant",
+            "content": f"RAG 분석 완료: {len(rag_result['answer'])}자 인사이트 생성"
+        }],
+        "step_rag": "completed"
+    }
+
+
+def _rag_node_error(state: GraphState, e: Exception) -> dict:
+    """예외 → 실패 노드 결과"""
+    logger.error(f"❌ RAG 노드 실행 실패: {e}")
+    
+    error_log = state.get("error_log", [])
+    error_log.append(f"RAG 노드 오류: {str(e)}")
+    
+    return {
+        "rag_analysis": {
+            "answer": f"RAG 분석 실패: {str(e)}",
+            "sources": [],
+            "error": True
+        },
+        "error_log": error_log,
+        "current_step": "rag_failed"
+    }
@@ -11,139 +11,259 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from state.graph_state import GraphState
 from config.settings import settings
 from utils.logger import logger
+from utils.llm_cache import llm_cache
+from utils.blob_store import blob_store, load_field
+from utils.instrumentation import metrics
+from utils.report_spool import ReportSpool
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import asyncio
+import hashlib
+import json
+import time
+
+def _report_llm() -> ChatOpenAI:
+    return ChatOpenAI(
+        model=settings.LLM["model"],
+        temperature=settings.LLM["temperature"],
+        cache=llm_cache,
+        callbacks=[metrics.llm_callback]
+    )
+
 
 def report_generation_node(state: GraphState):
-    """최종 보고서 생성 (PDF만)"""
+    """최종 보고서 생성 (섹션 단위 spool → Markdown 파일 → PDF)"""
     logger.info("="*70)
     logger.info("📝 Agent 6: 최종 보고서 생성 (PDF)")
     logger.info("="*70)
-    
-    llm = ChatOpenAI(
-        model=settings.LLM["model"],
-        temperature=settings.LLM["temperature"]
-    )
-    
+
     top_5_trends = state.get("top_5_trends", [])
-    
+
     if not top_5_trends:
         logger.error("❌ Top 5 트렌드가 없습니다!")
-        return {
-            "final_report": "오류: Top 5 트렌드 데이터가 없습니다.",
-            "step_report": "failed"
-        }
-    
-    # 1️⃣ 커버 페이지 생성
-    logger.info("1️⃣ 커버 페이지 생성 중...")
-    cover_page = generate_cover_page(top_5_trends, state)
-    
-    # 2️⃣ Executive Summary
-    logger.info("2️⃣ Executive Summary 생성 중...")
-    executive_summary = generate_executive_summary(top_5_trends, llm)
-    
-    # 3️⃣ Top 5 한눈에 보기
-    logger.info("3️⃣ Top 5 요약 생성 중...")
-    top_5_summary = generate_top5_summary(top_5_trends)
-    
-    # 4️⃣ 분석 방법론
-    logger.info("4️⃣ 분석 방법론 생성 중...")
-    methodology = generate_methodology(state)
-    
-    # 5️⃣ 각 트렌드 상세 내용
-    logger.info("5️⃣ 트렌드 상세 내용 생성 중...")
-    trend_details = []
-    for idx, trend in enumerate(top_5_trends, 1):
-        logger.info(f"   [{idx}/5] '{trend['trend_keyword']}' 상세 내용 생성 중...")
-        try:
-            detail = generate_trend_detail(trend, llm)
+        return _missing_trends_result()
 
-            if idx > 1:
-                detail = f'\n\n<div style="page-break-before: always;"></div>\n\n{detail}'
-                
-            trend_details.append(detail)
-            logger.info(f"      ✓ 완료 ({len(detail):,}자)")
-        except Exception as e:
-            logger.error(f"      ✗ 실패: {e}")
-            trend_details.append(f"## {idx}. {trend['trend_keyword']}\n\n상세 내용 생성 실패\n\n")
-    
-    # 6️⃣ SK AX 전략 제언
-    logger.info("6️⃣ SK AX 전략 제언 생성 중...")
-    strategy = generate_strategy_top1(top_5_trends, llm)
-    
-    # 7️⃣ References
-    logger.info("7️⃣ References 생성 중...")
-    references = generate_references(state)
-    
-    # 8️⃣ Appendix
-    logger.info("8️⃣ Appendix 생성 중...")
-    appendix = generate_appendix()
-    
-    # 전체 보고서 조립
-    report = f"""# AI TRENDS 2025-2030
+    llm = _report_llm()
+    spool = _open_spool(state, top_5_trends)
+    llm_jobs, static_jobs = _section_jobs(state, top_5_trends, llm)
+    llm_jobs = _pending_jobs(spool, llm_jobs)
 
-{cover_page}
+    # 독립적인 LLM 호출(Executive Summary, 트렌드 상세 5개, 전략 제언)은 동시에 실행, 정적 섹션은 그동안 생성
+    max_workers = settings.REPORT["max_concurrency"]
+    logger.info(f"🤖 LLM 섹션 {len(llm_jobs)}개 동시 생성 시작 (동시 {max_workers}개)")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_section, spool, *job) for job in llm_jobs]
+        overrides = _static_sections(static_jobs)
+        for future in futures:
+            overrides.update(future.result())
+    logger.info(f"🤖 LLM 섹션 생성 완료 ({time.perf_counter() - started:.1f}초)")
 
----
+    return _finish_report(spool, len(top_5_trends), overrides)
 
-{executive_summary}
 
----
+async def report_generation_node_async(state: GraphState):
+    """
+    report_generation_node 비동기 버전
+    - 섹션 생성 함수(프롬프트 구성 + llm.invoke)는 동기 함수라 스레드에서 실행, 동시 실행 수는 세마포어로 제한
+    """
+    logger.info("="*70)
+    logger.info("📝 Agent 6: 최종 보고서 생성 (PDF, async)")
+    logger.info("="*70)
 
-{top_5_summary}
+    top_5_trends = state.get("top_5_trends", [])
 
----
+    if not top_5_trends:
+        logger.error("❌ Top 5 트렌드가 없습니다!")
+        return _missing_trends_result()
+
+    llm = _report_llm()
+    spool = await asyncio.to_thread(_open_spool, state, top_5_trends)
+    llm_jobs, static_jobs = _section_jobs(state, top_5_trends, llm)
+    llm_jobs = _pending_jobs(spool, llm_jobs)
+    semaphore = asyncio.Semaphore(settings.REPORT["max_concurrency"])
+
+    async def section(job):
+        async with semaphore:
+            return await asyncio.to_thread(_run_section, spool, *job)
+
+    logger.info(f"🤖 LLM 섹션 {len(llm_jobs)}개 동시 생성 시작 (동시 {settings.REPORT['max_concurrency']}개)")
+    started = time.perf_counter()
+    # 한 섹션이 실패해도 나머지는 끝까지 spool에 기록 (재실행 시 이어서 생성)
+    results = await asyncio.gather(
+        asyncio.to_thread(_static_sections, static_jobs),
+        *[section(job) for job in llm_jobs],
+        return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    logger.info(f"🤖 LLM 섹션 생성 완료 ({time.perf_counter() - started:.1f}초)")
 
-{methodology}
+    overrides = {}
+    for result in results:
+        overrides.update(result)
 
----
+    # Markdown 조립 + PDF 변환은 블로킹 작업 → 스레드에서 실행
+    return await asyncio.to_thread(_finish_report, spool, len(top_5_trends), overrides)
+
+
+# ==========================================
+# 섹션 spool / 조립
+# ==========================================
+SECTION_SEPARATOR = "\n\n---\n\n"
 
-# PART 2. 5대 트렌드 상세 분석
+PART2_HEADER = """# PART 2. 5대 트렌드 상세 분석
 
 각 트렌드는 4-5페이지 분량으로 구성되어 있습니다.
 
 ---
 
-{''.join(trend_details)}
+"""
 
----
 
-{strategy}
+def _missing_trends_result() -> dict:
+    return {
+        "final_report": None,
+        "step_report": "failed",
+        "error_log": ["[Report] 오류: Top 5 트렌드 데이터가 없습니다."]
+    }
 
----
 
-{references}
+def _open_spool(state: GraphState, top_5_trends: list) -> ReportSpool:
+    """
+    보고서 입력이 같으면 같은 spool 디렉토리 → 중단된 보고서는 완료된 섹션부터 이어서 생성
+    (papers 등 blob 필드는 참조 dict만 해시)
+    """
+    key_payload = {
+        "top_5_trends": top_5_trends,
+        "keywords": state.get("keywords", []),
+        "papers": state.get("papers"),
+        "github_repos": state.get("github_repos"),
+        "market_trends": state.get("market_trends", []),
+        "llm": settings.LLM,
+        "analysis": settings.ANALYSIS,
+    }
+    raw = json.dumps(key_payload, ensure_ascii=False, sort_keys=True, default=str)
+    key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    spool = ReportSpool(os.path.join(settings.REPORT["spool_dir"], key))
+    if len(spool):
+        logger.info(f"♻️  이전 실행의 완료 섹션 {len(spool)}개 재사용 (spool {key})")
+    return spool
 
----
 
-{appendix}
-"""
-    
-    # ✅ PDF만 생성 (Markdown 저장 안 함)
+def _section_jobs(state: GraphState, top_5_trends: list, llm: ChatOpenAI) -> tuple:
+    """
+    (LLM 섹션 작업, 정적 섹션 작업)
+    - LLM 작업: (섹션 이름, 생성 함수, 인자, 실패 시 대체 내용 / None이면 예외 전파) → spool에 기록
+    - 정적 작업: (섹션 이름, 생성 함수, 인자) → 비용이 없고 보고서 생성일 등 실행 시점 값이 있어 매번 생성
+    """
+    llm_jobs = [
+        ("executive_summary", generate_executive_summary, (top_5_trends, llm), None),
+        ("strategy", generate_strategy_top1, (top_5_trends, llm), None),
+    ] + [
+        (f"trend_{idx}", _generate_trend_detail_section, (idx, trend, llm),
+         f"## {idx}. {trend['trend_keyword']}\n\n상세 내용 생성 실패\n\n")
+        for idx, trend in enumerate(top_5_trends, 1)
+    ]
+    static_jobs = [
+        ("cover", generate_cover_page, (top_5_trends, state)),
+        ("top5_summary", generate_top5_summary, (top_5_trends,)),
+        ("methodology", generate_methodology, (state,)),
+        ("references", generate_references, (state,)),
+        ("appendix", generate_appendix, ()),
+    ]
+    return llm_jobs, static_jobs
+
+
+def _pending_jobs(spool: ReportSpool, jobs: list) -> list:
+    """spool에 이미 있는 섹션은 제외"""
+    return [job for job in jobs if job[0] not in spool]
+
+
+def _static_sections(static_jobs: list) -> dict:
+    """정적 섹션 생성 → {이름: 내용} (spool에 기록하지 않고 assemble의 overrides로 전달)"""
+    return {name: fn(*args) for name, fn, args in static_jobs}
+
+
+def _run_section(spool: ReportSpool, name: str, fn, args: tuple, fallback) -> dict:
+    """
+    섹션 1개 생성 → 완료 즉시 spool에 기록
+    - 대체 내용이 있는 섹션이 실패하면 spool에 기록하지 않고 {이름: 대체 내용} 반환 (재실행 시 다시 생성)
+    """
+    try:
+        content = fn(*args)
+    except Exception:
+        if fallback is None:
+            raise
+        return {name: fallback}
+    spool.append(name, content)
+    logger.info(f"   💾 [{name}] 섹션 기록 ({len(content):,}자)")
+    return {}
+
+
+def _report_layout(num_trends: int) -> list:
+    """섹션 순서 + 구분선 (ReportSpool.assemble 레이아웃)"""
+    layout = [("text", "# AI TRENDS 2025-2030\n\n")]
+    for name in ["cover", "executive_summary", "top5_summary", "methodology"]:
+        if name != "cover":
+            layout.append(("text", SECTION_SEPARATOR))
+        layout.append(("section", name))
+    layout.append(("text", SECTION_SEPARATOR + PART2_HEADER))
+    layout += [("section", f"trend_{idx}") for idx in range(1, num_trends + 1)]
+    for name in ["strategy", "references", "appendix"]:
+        layout += [("text", SECTION_SEPARATOR), ("section", name)]
+    layout.append(("text", "\n"))
+    return layout
+
+
+def _finish_report(spool: ReportSpool, num_trends: int, overrides: dict) -> dict:
+    """
+    spool 섹션을 Markdown 파일로 스트리밍 조립 → PDF 변환 → 노드 결과 (파일 참조만 상태에 저장)
+    - PDF 변환에 실패하면 spool을 남겨 둠 (Markdown은 항상 저장)
+    """
     output_dir = "outputs/reports"
-    os.makedirs(output_dir, exist_ok=True)
-    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    md_filename = f"{output_dir}/AI_TRENDS_{timestamp}.md"
     pdf_filename = f"{output_dir}/AI_TRENDS_{timestamp}.pdf"
-    
-    # PDF 변환 (Markdown 파일 없이 바로 생성)
+
+    report_ref = spool.assemble(_report_layout(num_trends), md_filename, overrides)
+    logger.info(f"📝 Markdown 저장: {md_filename} ({report_ref['chars']:,}자)")
+
     try:
         logger.info(f"📄 PDF 생성 중...")
-        convert_md_to_pdf_direct(report, pdf_filename)
+        with open(md_filename, "r", encoding="utf-8") as f:
+            convert_md_to_pdf_direct(f.read(), pdf_filename)
         logger.info(f"✅ PDF 저장: {pdf_filename}\n")
+        report_ref["pdf_path"] = pdf_filename
+        spool.discard()
     except Exception as e:
         logger.error(f"❌ PDF 생성 실패: {e}\n")
-        # 실패 시 Markdown이라도 저장
-        md_filename = f"{output_dir}/AI_TRENDS_{timestamp}.md"
-        with open(md_filename, "w", encoding="utf-8") as f:
-            f.write(report)
-        logger.info(f"⚠️ Markdown 대체 저장: {md_filename}\n")
-    
+        logger.info(f"⚠️ Markdown만 저장 (섹션 spool 유지: {spool.spool_dir})\n")
+        report_ref["pdf_path"] = None
+
     return {
-        "final_report": report,
+        "final_report": report_ref,
         "step_report": "completed"
     }
 
 
+def _generate_trend_detail_section(idx: int, trend: dict, llm: ChatOpenAI) -> str:
+    """트렌드 상세 1개 생성 (실패 시 예외 → 대체 섹션은 호출 측에서 사용)"""
+    logger.info(f"   [{idx}/5] '{trend['trend_keyword']}' 상세 내용 생성 중...")
+    try:
+        detail = generate_trend_detail(trend, llm)
+    except Exception as e:
+        logger.error(f"      ✗ [{idx}/5] 실패: {e}")
+        raise
+
+    if idx > 1:
+        detail = f'\n\n<div style="page-break-before: always;"></div>\n\n{detail}'
+
+    logger.info(f"      ✓ [{idx}/5] 완료 ({len(detail):,}자)")
+    return detail
+
+
 def generate_cover_page(top_5_trends, state):
     """✅ 커버 페이지 (1페이지 + 2페이지 합침)"""
     
@@ -238,8 +358,8 @@ def generate_top5_summary(top_5_trends):
 def generate_methodology(state):
     """분석 방법론"""
     
-    papers_count = len(state.get("papers", []))
-    github_count = len(state.get("github_repos", []))
+    papers_count = blob_store.count(state.get("papers"))
+    github_count = blob_store.count(state.get("github_repos"))
     keywords_count = len(state.get("keywords", []))
     
     return f"""# PART 1. 분석 방법론
@@ -1292,8 +1412,8 @@ def generate_references(state):
     References 생성
     - 논문, GitHub, 시장 리포트, 전문 문서 출처 정리
     """
-    papers = state.get("papers", [])[:10]
-    github_repos = state.get("github_repos", [])[:5]
+    papers = load_field(state, "papers", [])[:10]
+    github_repos = load_field(state, "github_repos", [])[:5]
     market_trends = state.get("market_trends", [])[:5]
     
     # ==========================================
@@ -1382,8 +1502,8 @@ def generate_references(state):
 """
     """References 생성"""
     
-    papers = state.get("papers", [])[:10]
-    github_repos = state.get("github_repos", [])[:5]
+    papers = load_field(state, "papers", [])[:10]
+    github_repos = load_field(state, "github_repos", [])[:5]
     
     paper_refs = "\n".join([
         f"{i}. {p['authors'][0]}. \"{p['title']}\". arXiv. {p['publish_date']}. {p['url']}"
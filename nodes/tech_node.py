@@ -6,6 +6,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from state.graph_state import GraphState
 from collections import Counter
 from utils.logger import logger
+from utils.blob_store import load_field
+from utils.repo_matcher import RepoMatcher
+from utils.scoring_engine import (
+    TECH_MATURITY, maturity_scores, maturity_penalty_factors, round_like_python
+)
 
 # -----------------------------
 # 튜닝 가능한 기준값 (B2B 제품화 중심)
@@ -22,15 +27,7 @@ def calculate_maturity_score(paper_count: int, github_stars: int, num_repos: int
     - 제품화 비율: 레포 수 / (논문 수/80) → 상한 1.0
     - GitHub 활동: 총 Stars / 50,000 → 상한 1.0
     """
-    # 제품화 비율 (논문 대비 구현 빈도)
-    denom = max(paper_count / 80.0, 1.0)  # 더 엄격한 분모
-    product_ratio = min(num_repos / denom, 1.0)
-
-    # GitHub 활동
-    github_score = min(github_stars / 50000.0, 1.0)
-
-    score = (0.6 * product_ratio + 0.4 * github_score) * 100.0
-    return round(score, 1)
+    return float(maturity_scores([paper_count], [github_stars], [num_repos], TECH_MATURITY)[0])
 
 def tech_analysis_node(state: GraphState) -> GraphState:
     """
@@ -44,8 +41,8 @@ def tech_analysis_node(state: GraphState) -> GraphState:
     logger.info("🔬 Agent 2: 기술 트렌드 분석 시작 (B2B 제품화 중심)")
     logger.info("="*70)
 
-    papers = state.get("papers", [])
-    github_repos = state.get("github_repos", [])
+    papers = load_field(state, "papers", [])
+    github_repos = load_field(state, "github_repos", [])
 
     logger.info(f"\n입력 데이터:")
     logger.info(f"   - 논문: {len(papers)}개")
@@ -64,40 +61,32 @@ def tech_analysis_node(state: GraphState) -> GraphState:
     # 2) 키워드별 GitHub 매칭 및 성숙도 계산
     tech_trends = []
 
-    for keyword, count in top_keywords:
-        kw_lower = keyword.lower()
+    # 저장소 이름/설명/키워드를 한 번만 훑어 전체 키워드 매칭 (Aho-Corasick)
+    matcher = RepoMatcher(github_repos, [keyword for keyword, _ in top_keywords])
 
-        # 관련 GitHub 저장소 찾기(이름/설명 매칭)
-        related_repos = [
-            r for r in github_repos
-            if kw_lower in (r.get("name","").lower())
-            or kw_lower in (r.get("description","").lower())
-            or any(kw_lower == (k or "").lower() for k in r.get("keywords", []))
-        ]
+    # 관련 GitHub 저장소 찾기(이름/설명 부분 일치 또는 키워드 일치)
+    related_by_keyword = [matcher.related(keyword) for keyword, _ in top_keywords]
+    repo_counts = [len(repos) for repos in related_by_keyword]
+    star_totals = [sum(int(r.get("stars", 0)) for r in repos) for repos in related_by_keyword]
+
+    # 성숙도 + 경미한 패널티(어느 한쪽만 부족할 때)를 전체 후보에 대해 한 번에 계산
+    paper_counts = [count for _, count in top_keywords]
+    base_scores = maturity_scores(paper_counts, star_totals, repo_counts, TECH_MATURITY)
+    penalty_factors = maturity_penalty_factors(repo_counts, star_totals, PENALTY_MIN_REPOS, PENALTY_MIN_STARS)
+    final_maturity = round_like_python(base_scores * penalty_factors, 1)
 
-        total_stars = sum(int(r.get("stars", 0)) for r in related_repos)
-        num_repos = len(related_repos)
+    for i, (keyword, count) in enumerate(top_keywords):
+        related_repos = related_by_keyword[i]
+        total_stars = star_totals[i]
+        num_repos = repo_counts[i]
 
         # 자격요건(eligibility) 체크: 레포·스타 모두 너무 적으면 제외
         if num_repos < ELIGIBILITY_MIN_REPOS and total_stars < ELIGIBILITY_MIN_STARS:
             # 연구만 뜨거운 키워드로 간주하여 스킵
             continue
 
-        # 기본 성숙도 점수
-        maturity_score = calculate_maturity_score(
-            paper_count=count,
-            github_stars=total_stars,
-            num_repos=num_repos
-        )
-
-        # 경미한 패널티: 어느 한쪽만 부족할 때
-        penalty_factor = 1.0
-        if num_repos < PENALTY_MIN_REPOS:
-            penalty_factor *= 0.90
-        if total_stars < PENALTY_MIN_STARS:
-            penalty_factor *= 0.92
-
-        maturity_score = round(maturity_score * penalty_factor, 1)
+        maturity_score = float(final_maturity[i])
+        penalty_factor = float(penalty_factors[i])
 
         # 대표 프로젝트 3개 (stars desc)
         top_projects = sorted(
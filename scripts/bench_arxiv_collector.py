@@ -0,0 +1,111 @@
+# scripts/bench_arxiv_collector.py
+"""
+arXiv 비동기 수집 엔진 벤치마크
+- 로컬 가짜 arXiv Atom 피드 서버를 띄우고 collect_arxiv_papers 실행
+- 네트워크/API 쿼터 없이 동시 실행 + Rate limiter 동작 확인
+
+사용 예시:
+  python scripts/bench_arxiv_collector.py
+  python scripts/bench_arxiv_collector.py --latency 0.5 --rate 2
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from config.settings import settings
+from config.keywords import SEED_TECH_KEYWORDS_B2B
+from tools.arxiv_tool import collect_arxiv_papers, RequestsFetcher
+from utils.rate_limiter import TokenBucket
+from utils.response_cache import response_cache
+from utils.logger import logger
+
+
+def build_feed(query: str, start: int, max_results: int) -> str:
+    """키워드별 가짜 Atom 피드 생성 (키워드 간 일부 논문 중복)"""
+    entries = []
+    today = date.today()
+    for i in range(start, start + max_results):
+        paper_id = f"2401.{(hash(query) + i) % 500:05d}v1"
+        published = (today - timedelta(days=i * 3)).isoformat()
+        entries.append(f"""
+  <entry>
+    <id>http://arxiv.org/abs/{paper_id}</id>
+    <published>{published}T00:00:00Z</published>
+    <title>Fake paper {i} about {query}</title>
+    <summary>Synthetic abstract for benchmarking {query}.</summary>
+    <author><name>Bench Author</name></author>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>""")
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        + "".join(entries)
+        + "\n</feed>"
+    )
+
+
+def start_fake_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            qs = parse_qs(urlparse(self.path).query)
+            time.sleep(latency)
+            body = build_feed(
+                qs.get("search_query", [""])[0],
+                int(qs.get("start", ["0"])[0]),
+                int(qs.get("max_results", ["10"])[0]),
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/atom+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="arXiv 수집 엔진 벤치마크 (가짜 피드 서버)")
+    parser.add_argument("--latency", type=float, default=0.3, help="가짜 서버 응답 지연(초)")
+    parser.add_argument("--rate", type=float, default=20.0, help="토큰 버킷 초당 요청 수")
+    parser.add_argument("--max-results", type=int, default=100, help="키워드당 최대 결과 수")
+    args = parser.parse_args()
+
+    server = start_fake_server(args.latency)
+    settings.ARXIV["api_url"] = f"http://127.0.0.1:{server.server_address[1]}/api/query"
+    response_cache.enabled = False  # 매 실행마다 실제 요청 측정
+
+    keywords = SEED_TECH_KEYWORDS_B2B
+    started = time.perf_counter()
+    papers = asyncio.run(collect_arxiv_papers(
+        keywords,
+        args.max_results,
+        fetch=RequestsFetcher(),
+        limiter=TokenBucket(rate=args.rate, burst=1)
+    ))
+    elapsed = time.perf_counter() - started
+
+    sequential = len(keywords) * args.latency + (len(keywords) - 1) * 3
+    logger.info("=" * 70)
+    logger.info(f"키워드 {len(keywords)}개 → 논문 {len(papers)}개 (중복 제거 후)")
+    logger.info(f"비동기 수집: {elapsed:.2f}초")
+    logger.info(f"기존 순차 수집 추정: {sequential:.2f}초 (지연 + 키워드 간 3초 대기)")
+    logger.info("=" * 70)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# scripts/bench_github_collector.py
+"""
+GitHub 검색 클라이언트 벤치마크 / 동작 확인
+- 로컬 가짜 GitHub Search API 서버 (ETag, X-RateLimit 헤더 흉내)
+- 1차 실행: 키워드 동시 요청 + rate limit 소진 시 리셋 대기
+- 2차 실행: 캐시 만료 상태에서 If-None-Match → 304 재검증
+
+사용 예시:
+  python scripts/bench_github_collector.py
+  python scripts/bench_github_collector.py --latency 0.5 --quota 5
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import hashlib
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from config.keywords import SEED_TECH_KEYWORDS_B2B
+from tools.github_tool import GithubSearchClient
+from utils.rate_limiter import TokenBucket
+from utils.response_cache import response_cache
+from utils.logger import logger
+
+
+def start_fake_server(latency: float, quota: int, window: float) -> ThreadingHTTPServer:
+    state = {"remaining": quota, "reset_at": time.time() + window, "requests": 0, "not_modified": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            qs = parse_qs(urlparse(self.path).query)
+            query = qs.get("q", [""])[0]
+            per_page = int(qs.get("per_page", ["30"])[0])
+            time.sleep(latency)
+
+            with lock:
+                state["requests"] += 1
+                if time.time() >= state["reset_at"]:
+                    state["remaining"], state["reset_at"] = quota, time.time() + window
+                if state["remaining"] <= 0:
+                    self._send(403, b'{"message": "API rate limit exceeded"}', remaining=0, reset=state["reset_at"])
+                    return
+                state["remaining"] -= 1
+                remaining, reset = state["remaining"], state["reset_at"]
+
+            etag = '"' + hashlib.md5(self.path.encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                with lock:
+                    state["not_modified"] += 1
+                self._send(304, b"", remaining=remaining, reset=reset, etag=etag)
+                return
+
+            items = [
+                {
+                    "full_name": f"bench/{query.split()[0].lower()}-{i}",
+                    "description": f"Fake repo for {query}",
+                    "stargazers_count": 10_000 - i * 10,
+                    "forks_count": i,
+                    "language": "Python",
+                    "html_url": f"https://github.com/bench/{i}",
+                }
+                for i in range(per_page)
+            ]
+            body = json.dumps({"total_count": per_page, "items": items}).encode("utf-8")
+            self._send(200, body, remaining=remaining, reset=reset, etag=etag)
+
+        def _send(self, status, body, remaining, reset, etag=None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("X-RateLimit-Remaining", str(remaining))
+            self.send_header("X-RateLimit-Reset", str(int(reset)))
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub 검색 클라이언트 벤치마크 (가짜 API 서버)")
+    parser.add_argument("--latency", type=float, default=0.3, help="가짜 서버 응답 지연(초)")
+    parser.add_argument("--quota", type=int, default=8, help="리셋 주기당 허용 요청 수")
+    parser.add_argument("--window", type=float, default=3.0, help="rate limit 리셋 주기(초)")
+    args = parser.parse_args()
+
+    server = start_fake_server(args.latency, args.quota, args.window)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # 벤치마크 전용 임시 캐시 (TTL 0 → 2차 실행은 항상 조건부 재검증)
+    response_cache.enabled = True
+    response_cache.root = tempfile.mkdtemp()
+    response_cache.ttl_hours = {"default": 0}
+
+    keywords = SEED_TECH_KEYWORDS_B2B
+    client = GithubSearchClient(token="", base_url=base_url, limiter=TokenBucket(rate=50, burst=10))
+
+    for label in ("1차 (신규 요청)", "2차 (ETag 재검증)"):
+        started = time.perf_counter()
+        results = client.search_keywords(keywords, min_stars=100)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"{label}: 키워드 {len(results)}/{len(keywords)}개, "
+            f"저장소 {sum(len(r) for r in results.values())}개, {elapsed:.2f}초"
+        )
+
+    logger.info("=" * 70)
+    logger.info(f"서버 요청 수: {server.state['requests']} (304 응답 {server.state['not_modified']}회)")
+    logger.info(f"캐시 통계: {response_cache.stats()}")
+    logger.info("=" * 70)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# scripts/bench_import_time.py
+"""
+import 시간 벤치마크 (지연 로딩 회귀 방지)
+- 새 인터프리터에서 main / graph.workflow를 import → 소요 시간(중앙값) 측정
+- import 직후 무거운 의존성(langchain_openai, chromadb, PyMuPDF, matplotlib 등)이
+  sys.modules에 올라와 있으면 회귀로 판단
+- -X importtime 결과로 누적 시간이 큰 모듈 상위 N개 출력
+- 회귀(무거운 모듈 로드 / 시간 예산 초과) 시 종료 코드 1
+
+사용 예시:
+  python scripts/bench_import_time.py
+  python scripts/bench_import_time.py --repeat 10 --max-seconds 1.5 --top 15
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import statistics
+import subprocess
+
+from utils.logger import logger
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 측정 대상 (import 문)
+TARGETS = ["graph.workflow", "main"]
+
+# 노드가 실행되기 전에는 로드되면 안 되는 모듈
+HEAVY_MODULES = [
+    "langchain_openai",
+    "langchain_chroma",
+    "chromadb",
+    "langchain_community",
+    "langchain_huggingface",
+    "langchain_text_splitters",
+    "sentence_transformers",
+    "torch",
+    "fitz",
+    "arxiv",
+    "github",
+    "pytrends",
+    "tavily",
+    "matplotlib",
+    "nodes.collector_node",
+    "nodes.rag_node",
+    "nodes.report_node",
+]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run_probe(target: str, importtime: bool = False) -> dict:
+    """새 인터프리터에서 target import → {"seconds", "heavy", "stderr"}"""
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", PROBE.format(target=target, heavy=HEAVY_MODULES)]
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import 실패")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["stderr"] = proc.stderr
+    return result
+
+
+def top_imports(importtime_log: str, top: int) -> list:
+    """-X importtime 출력 → 누적 시간 상위 [(모듈, 초)] (최상위 import만)"""
+    entries = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, raw_name = line.split(":", 1)[1].split("|")
+        # 이름 앞 공백 = 중첩 깊이, 최상위 import만 집계
+        if len(raw_name) - len(raw_name.lstrip()) > 1:
+            continue
+        entries.append((raw_name.strip(), int(cumulative_us) / 1e6))
+    return sorted(entries, key=lambda e: e[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="main / graph.workflow import 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="대상별 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="대상별 import 시간 예산(초)")
+    parser.add_argument("--top", type=int, default=10, help="누적 시간 상위 모듈 출력 수")
+    args = parser.parse_args()
+
+    failed = False
+    logger.info("=" * 70)
+    for target in TARGETS:
+        try:
+            runs = [run_probe(target) for _ in range(args.repeat)]
+            profile = run_probe(target, importtime=True)
+        except Exception as e:
+            logger.error(f"❌ import {target} 실패: {e}")
+            failed = True
+            continue
+
+        median = statistics.median(r["seconds"] for r in runs)
+        heavy = profile["heavy"]
+        logger.info(f"📦 import {target}: 중앙값 {median * 1000:.0f}ms ({args.repeat}회, 예산 {args.max_seconds:.1f}초)")
+        for name, seconds in top_imports(profile["stderr"], args.top):
+            logger.info(f"   {seconds * 1000:8.1f}ms  {name}")
+
+        if heavy:
+            logger.error(f"   ❌ 지연 로딩 회귀: {', '.join(heavy)}")
+            failed = True
+        if median > args.max_seconds:
+            logger.error(f"   ❌ 시간 예산 초과: {median:.2f}초 > {args.max_seconds:.2f}초")
+            failed = True
+    logger.info("=" * 70)
+
+    if failed:
+        sys.exit(1)
+    logger.info("✅ import 시간 / 지연 로딩 확인 통과")
+
+
+if __name__ == "__main__":
+    main()
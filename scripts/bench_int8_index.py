@@ -0,0 +1,96 @@
+# scripts/bench_int8_index.py
+"""
+int8 벡터 인덱스 벤치마크
+- 합성(군집) 임베딩으로 int8 인덱스 생성 → 로드 시간 / 질의 시간 / recall@k (float32 전수 검색 대비)
+- --vectors가 ivf_min_vectors 이상이면 IVF 경로도 함께 확인
+
+사용 예시:
+  python scripts/bench_int8_index.py
+  python scripts/bench_int8_index.py --vectors 200000 --nprobe 16
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from utils.int8_index import Int8Index, build_int8_index
+from utils.logger import logger
+
+
+def make_vectors(num_vectors: int, dim: int, num_clusters: int = 300, seed: int = 0) -> np.ndarray:
+    """문서 임베딩처럼 군집이 있는 합성 벡터"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(num_clusters, dim))
+    vectors = centers[rng.integers(0, num_clusters, num_vectors)] + 0.6 * rng.normal(size=(num_vectors, dim))
+    return vectors.astype(np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="int8 벡터 인덱스 로드/검색 벤치마크")
+    parser.add_argument("--vectors", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--ivf-min-vectors", type=int, default=100000)
+    parser.add_argument("--nprobe", type=int, default=16)
+    args = parser.parse_args()
+
+    vectors = make_vectors(args.vectors, args.dim)
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    work_dir = tempfile.mkdtemp()
+    index_dir = os.path.join(work_dir, "int8")
+
+    try:
+        batches = (
+            ([f"chunk-{i}" for i in range(start, min(start + 256, args.vectors))],
+             vectors[start:start + 256],
+             ["text"] * len(vectors[start:start + 256]),
+             [{}] * len(vectors[start:start + 256]))
+            for start in range(0, args.vectors, 256)
+        )
+        started = time.perf_counter()
+        info = build_int8_index(batches, args.vectors, index_dir, args.ivf_min_vectors)
+        build_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        index = Int8Index(index_dir, nprobe=args.nprobe)
+        load_elapsed = time.perf_counter() - started
+
+        rng = np.random.default_rng(1)
+        query_rows = rng.choice(args.vectors, args.queries, replace=False)
+        recalls, exact_elapsed, int8_elapsed = [], 0.0, 0.0
+        for row in query_rows:
+            query = normalized[row] + 0.05 * rng.normal(size=args.dim).astype(np.float32)
+
+            started = time.perf_counter()
+            exact = set(np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:args.k])
+            exact_elapsed += time.perf_counter() - started
+
+            started = time.perf_counter()
+            found = {r for r, _ in index.search(query, args.k)}
+            int8_elapsed += time.perf_counter() - started
+            recalls.append(len(exact & found) / args.k)
+
+        float_mb = vectors.nbytes / 1024 / 1024
+        logger.info("=" * 70)
+        logger.info(f"벡터 {args.vectors:,}개 × {args.dim}차원 | {'IVF ' + str(info['nlist']) + '개 리스트' if info['nlist'] else '전수 검색'}")
+        logger.info(f"   생성 {build_elapsed:.2f}초 | 로드 {load_elapsed * 1000:.1f}ms")
+        logger.info(f"   크기: int8 인덱스 {info['bytes'] / 1024 / 1024:.1f} MB (float32 벡터만 {float_mb:.1f} MB)")
+        logger.info(
+            f"   질의당: float32 전수 {exact_elapsed / args.queries * 1000:.2f}ms | "
+            f"int8 {int8_elapsed / args.queries * 1000:.2f}ms"
+        )
+        logger.info(f"   recall@{args.k}: {np.mean(recalls):.3f}")
+        logger.info("=" * 70)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
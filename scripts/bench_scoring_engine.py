@@ -0,0 +1,126 @@
+# scripts/bench_scoring_engine.py
+"""
+점수 엔진 벤치마크 / 동일성 확인
+- 기존 스칼라 공식(아래 reference_*)과 utils.scoring_engine 배치 계산 결과가 완전히 같은지 확인
+- 후보 수를 늘려 루프 대비 배치 계산 시간 비교
+
+사용 예시:
+  python scripts/bench_scoring_engine.py
+  python scripts/bench_scoring_engine.py --n 1000000
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+import numpy as np
+
+from utils.scoring_engine import (
+    TECH_MATURITY, LEGACY_MATURITY, THEME_WEIGHTS,
+    maturity_scores, opportunity_scores, final_scores, theme_scores
+)
+from utils.logger import logger
+
+
+# ==========================================
+# 기존 스칼라 공식 (변경 전 코드 그대로)
+# ==========================================
+def reference_tech_maturity(paper_count, github_stars, num_repos):
+    denom = max(paper_count / 80.0, 1.0)
+    product_ratio = min(num_repos / denom, 1.0)
+    github_score = min(github_stars / 50000.0, 1.0)
+    score = (0.6 * product_ratio + 0.4 * github_score) * 100.0
+    return round(score, 1)
+
+
+def reference_legacy_maturity(paper_count, github_stars, num_products):
+    product_ratio = min(num_products / max(paper_count / 100, 1), 1.0)
+    github_score = min(github_stars / 100000, 1.0)
+    score = (0.5 * product_ratio + 0.5 * github_score) * 100
+    return round(score, 1)
+
+
+def reference_opportunity(tam_usd, cagr, gov_support):
+    tam_score = min(tam_usd / 1_000_000_000, 1.0) * 40
+    growth_score = min(cagr / 0.5, 1.0) * 30
+    gov_score = 30 if gov_support else 0
+    return round(tam_score + growth_score + gov_score, 1)
+
+
+def reference_final(tech_score, market_score, growth_rate, competition):
+    score = 0.25 * tech_score + 0.35 * market_score + 0.25 * (growth_rate * 100) - 0.15 * competition
+    return round(score, 1)
+
+
+def reference_theme(avg_tech_score, avg_market_score, avg_cagr, competition):
+    score = (
+        0.25 * avg_tech_score +
+        0.35 * avg_market_score +
+        0.25 * min(avg_cagr * 100 / 50, 100) +
+        -0.15 * competition
+    )
+    return round(max(score, 0), 1)
+
+
+def compare(name, reference_fn, engine_values, columns):
+    started = time.perf_counter()
+    expected = [reference_fn(*row) for row in zip(*columns)]
+    loop_elapsed = time.perf_counter() - started
+
+    mismatches = int(np.sum(np.asarray(expected, dtype=np.float64) != engine_values))
+    logger.info(f"   {name:18s}: 루프 {loop_elapsed:6.2f}초 | 불일치 {mismatches}개")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="점수 엔진 동일성/속도 확인")
+    parser.add_argument("--n", type=int, default=200_000, help="후보 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n = args.n
+    papers = rng.integers(0, 2000, n)
+    stars = rng.integers(0, 300_000, n)
+    repos = rng.integers(0, 60, n)
+    tam = rng.integers(0, 5_000_000_000, n)
+    cagr = np.round(rng.uniform(0, 0.8, n), 3)
+    gov = rng.integers(0, 2, n).astype(bool)
+    tech = np.round(rng.uniform(0, 100, n), 1)
+    market = np.round(rng.uniform(0, 100, n), 1)
+    competition = rng.choice([40.0, 50.0, 55.0, 60.0, 75.0, 80.0, 85.0, 90.0, 95.0], n)
+
+    started = time.perf_counter()
+    engine = {
+        "tech_maturity": maturity_scores(papers, stars, repos, TECH_MATURITY),
+        "legacy_maturity": maturity_scores(papers, stars, repos, LEGACY_MATURITY),
+        "opportunity": opportunity_scores(tam, cagr, gov),
+        "final": final_scores(tech, market, cagr, competition),
+        "theme": theme_scores(tech, market, cagr, competition, THEME_WEIGHTS),
+    }
+    engine_elapsed = time.perf_counter() - started
+
+    logger.info("=" * 70)
+    logger.info(f"후보 {n:,}개 | 엔진 배치 계산(5종 합계) {engine_elapsed:.3f}초")
+    mismatches = sum([
+        compare("tech_maturity", reference_tech_maturity, engine["tech_maturity"],
+                (papers.tolist(), stars.tolist(), repos.tolist())),
+        compare("legacy_maturity", reference_legacy_maturity, engine["legacy_maturity"],
+                (papers.tolist(), stars.tolist(), repos.tolist())),
+        compare("opportunity", reference_opportunity, engine["opportunity"],
+                (tam.tolist(), cagr.tolist(), gov.tolist())),
+        compare("final", reference_final, engine["final"],
+                (tech.tolist(), market.tolist(), cagr.tolist(), competition.tolist())),
+        compare("theme", reference_theme, engine["theme"],
+                (tech.tolist(), market.tolist(), cagr.tolist(), competition.tolist())),
+    ])
+    logger.info(f"결과 일치: {'✅' if mismatches == 0 else f'❌ ({mismatches}개 불일치)'}")
+    logger.info("=" * 70)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
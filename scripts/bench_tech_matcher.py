@@ -0,0 +1,92 @@
+# scripts/bench_tech_matcher.py
+"""
+기술 분석 저장소 매칭 벤치마크
+- 기존 방식(키워드 × 저장소 부분 문자열 스캔) vs RepoMatcher(Aho-Corasick 인덱스)
+- 합성 데이터로 두 결과가 완전히 같은지 확인 후 소요 시간 비교
+
+사용 예시:
+  python scripts/bench_tech_matcher.py
+  python scripts/bench_tech_matcher.py --repos 50000 --keywords 500
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+
+from utils.repo_matcher import RepoMatcher
+from utils.logger import logger
+
+VOCAB = [
+    "llm", "agent", "rag", "retrieval", "vision", "speech", "diffusion", "transformer", "graph",
+    "multimodal", "edge", "quantization", "inference", "serving", "fine-tuning", "embedding",
+    "vector", "database", "workflow", "automation", "code", "generation", "evaluation", "safety",
+]
+
+
+def naive_related(repos, keyword):
+    """기존 tech_node 매칭 로직"""
+    kw_lower = keyword.lower()
+    return [
+        r for r in repos
+        if kw_lower in (r.get("name", "").lower())
+        or kw_lower in (r.get("description", "").lower())
+        or any(kw_lower == (k or "").lower() for k in r.get("keywords", []))
+    ]
+
+
+def make_data(num_repos: int, num_keywords: int, seed: int = 42):
+    rng = random.Random(seed)
+    keywords = list(VOCAB)
+    while len(keywords) < num_keywords:
+        keywords.append(" ".join(rng.sample(VOCAB, rng.randint(2, 3))))
+    keywords = keywords[:num_keywords]
+
+    repos = []
+    for i in range(num_repos):
+        words = rng.sample(VOCAB, 4)
+        repos.append({
+            "name": f"org{i % 97}/{'-'.join(words[:2])}-{i}",
+            "description": f"A {' '.join(rng.sample(VOCAB, 6))} toolkit for {words[2].upper()} {words[3]}",
+            "stars": rng.randint(100, 50_000),
+            "keywords": [rng.choice(keywords)],
+        })
+    return repos, keywords
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장소 매칭 벤치마크 (기존 스캔 vs Aho-Corasick 인덱스)")
+    parser.add_argument("--repos", type=int, default=20_000, help="합성 저장소 수")
+    parser.add_argument("--keywords", type=int, default=200, help="후보 키워드 수")
+    args = parser.parse_args()
+
+    repos, keywords = make_data(args.repos, args.keywords)
+
+    started = time.perf_counter()
+    naive = {k: naive_related(repos, k) for k in keywords}
+    naive_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matcher = RepoMatcher(repos, keywords)
+    indexed = {k: matcher.related(k) for k in keywords}
+    indexed_elapsed = time.perf_counter() - started
+
+    identical = all(
+        [r["name"] for r in naive[k]] == [r["name"] for r in indexed[k]] for k in keywords
+    )
+
+    logger.info("=" * 70)
+    logger.info(f"저장소 {len(repos):,}개 × 키워드 {len(keywords)}개")
+    logger.info(f"   기존 스캔     : {naive_elapsed:7.2f}초")
+    logger.info(f"   인덱스 매칭   : {indexed_elapsed:7.2f}초 ({naive_elapsed / max(indexed_elapsed, 1e-9):.1f}배)")
+    logger.info(f"   결과 일치     : {'✅' if identical else '❌'}")
+    logger.info("=" * 70)
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
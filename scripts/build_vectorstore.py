@@ -1,20 +1,50 @@
 # scripts/build_vectorstore.py
 """
-RAG 벡터 저장소 사전 생성
-최초 1회만 실행하면 됩니다.
+RAG 벡터 저장소 생성 (증분)
+- data/rag_documents 의 PDF를 문서 지문(SHA-256)으로 비교해 바뀐 문서만 다시 분할
+- 청크 ID = (문서, 페이지, 내용) 해시 → 새로 생긴 청크만 임베딩, 사라진 청크는 삭제
+- 삭제된 문서의 청크도 제거
+- 문서 지문 / 청크 ID / 빌드 조건은 data/vectorstore/manifest.json 에 기록
+- 분할·임베딩 조건(청크 크기, 모델 등)이 바뀌면 자동으로 전체 재생성
+- 문서 파싱·분할은 프로세스 풀에서 병렬 처리, 청크는 고정 크기 배치로 임베딩에 스트리밍
+  → 동시에 메모리에 있는 것은 처리 중인 문서 몇 개 + 임베딩 배치 1개 (코퍼스 크기와 무관)
+- 페이지 수 제한 없음 (--max-pages로 선택 가능)
+- 갱신 후 Chroma의 전체 청크로 BM25 희소 인덱스(data/vectorstore/bm25) 재생성 → rag_tool 하이브리드 검색
+- 같은 시점에 임베딩을 int8 메모리 맵 인덱스(data/vectorstore/int8)로 내보냄 → rag_tool 빠른 로드
+- 임베딩은 utils.embedding_cache를 거침 → 전체 재생성이어도 전에 본 청크는 모델 추론 없이 재사용
+
+사용 예시:
+  python scripts/build_vectorstore.py
+  python scripts/build_vectorstore.py --full       # 강제 전체 재생성
+  python scripts/build_vectorstore.py --workers 8 --batch-size 512
 """
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import argparse
+import glob
+import hashlib
+import json
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional
+
 from langchain_community.document_loaders import PyMuPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from utils.embedding_cache import cached_embeddings, embedding_cache
+from utils.bm25_index import build_bm25_index
+from utils.int8_index import build_int8_index
+from config.settings import settings
 from utils.logger import logger
-import shutil
 
-# 문서 경로
+# 문서 경로 (이 디렉토리의 PDF 전체를 색인)
+RAG_DOCUMENTS_DIR = "data/rag_documents"
+
+# 기본 문서 (참고용)
 FIXED_DOCUMENTS = [
     "data/rag_documents/20250128_GPAI_GenAI_FoW_report_final_VOECD.pdf",
     "data/rag_documents/wpiea2025076-print-pdf.pdf"
@@ -22,110 +52,400 @@ FIXED_DOCUMENTS = [
 
 # 벡터 저장소 경로
 VECTORSTORE_DIR = "data/vectorstore"
+MANIFEST_PATH = os.path.join(VECTORSTORE_DIR, "manifest.json")
+BM25_DIR = os.path.join(VECTORSTORE_DIR, "bm25")
+INT8_DIR = os.path.join(VECTORSTORE_DIR, "int8")
+MANIFEST_VERSION = 1
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+ADD_BATCH_SIZE = 256  # 임베딩 + Chroma add 배치당 청크 수
+
+
+# ==========================================
+# 지문 / 청크 ID
+# ==========================================
+def file_fingerprint(path: str) -> str:
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ChunkIdAssigner:
+    """
+    청크 ID = sha256(문서, 페이지, 내용)
+    - 같은 페이지에 같은 내용이 반복되면 #1, #2 ... 로 구분
+    """
+
+    def __init__(self, doc_key: str):
+        self.doc_key = doc_key
+        self._seen: Dict[str, int] = {}
+
+    def __call__(self, page: int, content: str) -> str:
+        raw = f"{self.doc_key}\x00{page}\x00{content}"
+        chunk_id = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        occurrence = self._seen.get(chunk_id, 0)
+        self._seen[chunk_id] = occurrence + 1
+        return chunk_id if occurrence == 0 else f"{chunk_id}#{occurrence}"
+
+
+# ==========================================
+# Manifest
+# ==========================================
+def load_manifest() -> Dict:
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ manifest 로드 실패 → 전체 재생성: {e}")
+        return {}
+
+
+def save_manifest(manifest: Dict) -> None:
+    os.makedirs(VECTORSTORE_DIR, exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def discover_documents() -> List[str]:
+    """색인 대상 PDF 목록 (정렬)"""
+    return sorted(glob.glob(os.path.join(RAG_DOCUMENTS_DIR, "*.pdf")))
+
+
+# ==========================================
+# 문서 로드 + 분할 (워커 프로세스)
+# ==========================================
+def split_document(
+    doc_path: str,
+    previous_fingerprint: Optional[str],
+    max_pages_per_doc: Optional[int] = None
+) -> Dict:
+    """
+    문서 1개 지문 계산 + (바뀐 경우) 페이지 단위 스트리밍 분할
+
+    Returns:
+        {"doc_key", "fingerprint", "unchanged", "num_pages", "chunks": [(chunk_id, text, metadata)]}
+        - 프로세스 간 전달 비용을 줄이기 위해 Document 대신 튜플 사용
+    """
+    doc_key = os.path.basename(doc_path)
+    fingerprint = file_fingerprint(doc_path)
+    result = {"doc_key": doc_key, "fingerprint": fingerprint, "unchanged": False, "num_pages": 0, "chunks": []}
+    if fingerprint == previous_fingerprint:
+        result["unchanged"] = True
+        return result
 
-def build_vectorstore(max_pages_per_doc: int = 35):
-    """벡터 저장소 생성"""
-    
-    logger.info("="*70)
-    logger.info("🏗️  벡터 저장소 생성 시작")
-    logger.info("="*70)
-    
-    # 기존 벡터 저장소 삭제 (재생성)
-    if os.path.exists(VECTORSTORE_DIR):
-        logger.info(f"\n🗑️  기존 벡터 저장소 삭제 중...")
-        shutil.rmtree(VECTORSTORE_DIR)
-        logger.info("   ✓ 삭제 완료")
-    
-    # 1. 문서 로드
-    logger.info(f"\n1️⃣ 문서 로드 중...")
-    all_documents = []
-    loaded_docs = []
-    
-    for doc_path in FIXED_DOCUMENTS:
-        if not os.path.exists(doc_path):
-            logger.warning(f"   ⚠️ 문서 없음: {doc_path}")
-            continue
-        
-        try:
-            logger.info(f"   📄 {os.path.basename(doc_path)}")
-            
-            loader = PyMuPDFLoader(doc_path)
-            pages = loader.load()
-            
-            if len(pages) > max_pages_per_doc:
-                logger.info(f"      → {len(pages)}페이지 중 {max_pages_per_doc}페이지만 사용")
-                pages = pages[:max_pages_per_doc]
-            else:
-                logger.info(f"      → {len(pages)}페이지 로드")
-            
-            all_documents.extend(pages)
-            loaded_docs.append(os.path.basename(doc_path))
-            
-        except Exception as e:
-            logger.error(f"   ✗ 로드 실패: {e}")
-            continue
-    
-    if not all_documents:
-        logger.error("\n❌ 로드된 문서 없음!")
-        return False
-    
-    logger.info(f"\n   ✅ 총 {len(all_documents)}개 페이지 로드")
-    logger.info(f"   📚 문서: {', '.join(loaded_docs)}")
-    
-    # 2. 텍스트 분할
-    logger.info(f"\n2️⃣ 텍스트 분할 중...")
-    
     text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=1000,
-        chunk_overlap=200,
+        chunk_size=CHUNK_SIZE,
+        chunk_overlap=CHUNK_OVERLAP,
         length_function=len
     )
-    splits = text_splitter.split_documents(all_documents)
-    
-    logger.info(f"   ✅ {len(splits)}개 청크 생성")
-    
-    # 3. 임베딩 및 벡터 저장소 생성
-    logger.info(f"\n3️⃣ 벡터 임베딩 및 저장소 생성 중...")
-    logger.info(f"   (예상 시간: 1-3분)")
-    
+    assign_id = ChunkIdAssigner(doc_key)
+
+    # lazy_load: 페이지를 하나씩 읽고 바로 분할 (문서 전체를 메모리에 올리지 않음)
+    for page in PyMuPDFLoader(doc_path).lazy_load():
+        if max_pages_per_doc is not None and result["num_pages"] >= max_pages_per_doc:
+            break
+        result["num_pages"] += 1
+        for split in text_splitter.split_documents([page]):
+            chunk_id = assign_id(split.metadata.get("page", 0), split.page_content)
+            result["chunks"].append((chunk_id, split.page_content, split.metadata))
+
+    return result
+
+
+def iter_split_documents(
+    doc_paths: List[str],
+    previous: Dict[str, Dict],
+    max_pages_per_doc: Optional[int],
+    workers: int
+):
+    """
+    프로세스 풀로 문서 분할 (완료 순서대로 yield)
+    - 동시에 제출하는 문서 수를 workers × 2로 제한해 결과가 메모리에 쌓이지 않게 함
+    """
+    pending_paths = list(doc_paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+
+        def submit_next():
+            doc_path = pending_paths.pop(0)
+            prev_fp = previous.get(os.path.basename(doc_path), {}).get("fingerprint")
+            in_flight[executor.submit(split_document, doc_path, prev_fp, max_pages_per_doc)] = doc_path
+
+        while pending_paths and len(in_flight) < workers * 2:
+            submit_next()
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                doc_path = in_flight.pop(future)
+                try:
+                    yield doc_path, future.result(), None
+                except Exception as e:
+                    yield doc_path, None, e
+                if pending_paths:
+                    submit_next()
+
+
+class BatchedIndexer:
+    """청크를 ADD_BATCH_SIZE 단위로 모아 임베딩 + 저장 (첫 배치 때 모델 로드)"""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.vectorstore = None
+        self._docs: List[Document] = []
+        self._ids: List[str] = []
+        self.added = 0
+
+    def _store(self):
+        if self.vectorstore is None:
+            embeddings = cached_embeddings(EMBEDDING_MODEL)
+            self.vectorstore = Chroma(
+                persist_directory=VECTORSTORE_DIR,  # ✅ 디스크에 저장
+                embedding_function=embeddings
+            )
+        return self.vectorstore
+
+    def add(self, chunk_id: str, text: str, metadata: Dict) -> None:
+        self._docs.append(Document(page_content=text, metadata=metadata))
+        self._ids.append(chunk_id)
+        if len(self._ids) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._ids:
+            return
+        self._store().add_documents(documents=self._docs, ids=self._ids)
+        embedding_cache.flush()
+        self.added += len(self._ids)
+        logger.info(f"      ✓ 임베딩 배치 {len(self._ids)}개 저장 (누적 {self.added}개)")
+        self._docs, self._ids = [], []
+
+    def delete(self, ids: List[str]) -> None:
+        for start in range(0, len(ids), self.batch_size):
+            self._store().delete(ids=ids[start:start + self.batch_size])
+
+    def iter_pages(self, include: List[str]):
+        """저장된 전체 청크를 batch_size 단위 페이지로 읽기 (BM25 / int8 인덱스 생성용)"""
+        offset = 0
+        while True:
+            page = self._store().get(include=include, limit=self.batch_size, offset=offset)
+            if not len(page["ids"]):
+                return
+            yield page
+            offset += len(page["ids"])
+
+    def iter_chunks(self):
+        for page in self.iter_pages(["documents"]):
+            yield from zip(page["ids"], page["documents"])
+
+    def count(self) -> int:
+        return self._store()._collection.count()
+
+
+def build_dense_export(indexer: BatchedIndexer) -> None:
+    """Chroma 임베딩 전체를 int8 메모리 맵 인덱스로 내보내기 (rag_tool 기본 백엔드)"""
+    started = time.perf_counter()
+    batches = (
+        (page["ids"], page["embeddings"], page["documents"], page["metadatas"])
+        for page in indexer.iter_pages(["embeddings", "documents", "metadatas"])
+    )
+    info = build_int8_index(batches, indexer.count(), INT8_DIR, settings.VECTOR_INDEX["ivf_min_vectors"])
+    logger.info(
+        f"   ✓ int8 인덱스: 벡터 {info['count']}개 × {info['dim']}차원, "
+        f"{'IVF ' + str(info['nlist']) + '개 리스트' if info['nlist'] else '전수 검색'}, "
+        f"{info['bytes'] / 1024 / 1024:.1f} MB ({time.perf_counter() - started:.1f}초)"
+    )
+
+
+def build_search_indexes(indexer: BatchedIndexer, missing_only: bool = False) -> None:
+    """BM25 + int8 인덱스 생성 (missing_only면 없는 것만)"""
+    if not (missing_only and os.path.exists(os.path.join(BM25_DIR, "meta.json"))):
+        build_sparse_index(indexer)
+    if not (missing_only and os.path.exists(os.path.join(INT8_DIR, "meta.json"))):
+        build_dense_export(indexer)
+
+
+def build_sparse_index(indexer: BatchedIndexer) -> None:
+    """Chroma 청크 전체로 BM25 인덱스 재생성"""
+    started = time.perf_counter()
+    info = build_bm25_index(indexer.iter_chunks(), BM25_DIR)
+    logger.info(
+        f"   ✓ BM25 인덱스: 청크 {info['num_chunks']}개, 단어 {info['num_terms']:,}개, "
+        f"{info['bytes'] / 1024 / 1024:.1f} MB ({time.perf_counter() - started:.1f}초)"
+    )
+
+
+def build_vectorstore(
+    max_pages_per_doc: Optional[int] = None,
+    full_rebuild: bool = False,
+    workers: Optional[int] = None,
+    batch_size: int = ADD_BATCH_SIZE
+):
+    """벡터 저장소 증분 생성"""
+
+    logger.info("="*70)
+    logger.info("🏗️  벡터 저장소 생성 시작 (증분)")
+    logger.info("="*70)
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+
+    params = {
+        "version": MANIFEST_VERSION,
+        "embedding_model": EMBEDDING_MODEL,
+        "chunk_size": CHUNK_SIZE,
+        "chunk_overlap": CHUNK_OVERLAP,
+        "max_pages_per_doc": max_pages_per_doc,
+    }
+    manifest = load_manifest()
+
+    # 빌드 조건이 바뀌었거나 강제 재생성이면 기존 저장소 삭제
+    if full_rebuild or manifest.get("params") != params:
+        reason = "강제 재생성" if full_rebuild else ("빌드 조건 변경" if manifest else "manifest 없음")
+        if os.path.exists(VECTORSTORE_DIR):
+            logger.info(f"\n🗑️  기존 벡터 저장소 삭제 중... ({reason})")
+            shutil.rmtree(VECTORSTORE_DIR)
+            logger.info("   ✓ 삭제 완료")
+        manifest = {}
+    documents_manifest = manifest.get("documents", {})
+
+    # 1. 문서 분할(프로세스 풀) → 새 청크는 배치 단위로 바로 임베딩
+    doc_paths = discover_documents()
+    logger.info(f"\n1️⃣ 문서 {len(doc_paths)}개 확인 중... (워커 {workers}개, 임베딩 배치 {batch_size})")
+
+    indexer = BatchedIndexer(batch_size)
+    new_manifest = {}
+    delete_ids = []
+    total_pages = 0
+
     try:
-        embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2"
-        )
-        
-        # persist_directory로 저장
-        vectorstore = Chroma.from_documents(
-            documents=splits,
-            embedding=embeddings,
-            persist_directory=VECTORSTORE_DIR  # ✅ 디스크에 저장
-        )
-        
-        logger.info(f"   ✅ 벡터 저장소 생성 완료")
-        logger.info(f"   📂 저장 위치: {VECTORSTORE_DIR}")
-        
+        for doc_path, result, error in iter_split_documents(doc_paths, documents_manifest, max_pages_per_doc, workers):
+            doc_key = os.path.basename(doc_path)
+            previous = documents_manifest.get(doc_key)
+
+            if error is not None:
+                logger.error(f"   ✗ {doc_key} 로드 실패: {error}")
+                if previous:
+                    new_manifest[doc_key] = previous  # 기존 청크 유지
+                continue
+
+            if result["unchanged"]:
+                logger.info(f"   = {doc_key} (변경 없음, {len(previous['chunk_ids'])}개 청크)")
+                new_manifest[doc_key] = previous
+                continue
+
+            ids = [chunk_id for chunk_id, _, _ in result["chunks"]]
+            old_ids = set(previous["chunk_ids"]) if previous else set()
+            new_ids = set(ids)
+            total_pages += result["num_pages"]
+            logger.info(
+                f"   {'~' if previous else '+'} 📄 {doc_key}: {result['num_pages']}페이지, 청크 {len(ids)}개 "
+                f"(신규 {len(new_ids - old_ids)}, 삭제 {len(old_ids - new_ids)})"
+            )
+
+            for chunk_id, text, metadata in result["chunks"]:
+                if chunk_id not in old_ids:
+                    indexer.add(chunk_id, text, metadata)
+            delete_ids.extend(sorted(old_ids - new_ids))
+
+            new_manifest[doc_key] = {
+                "fingerprint": result["fingerprint"],
+                "chunk_ids": ids,
+                "indexed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+
+        # 삭제된 문서
+        for doc_key, previous in documents_manifest.items():
+            if doc_key not in new_manifest and not os.path.exists(os.path.join(RAG_DOCUMENTS_DIR, doc_key)):
+                logger.info(f"   - {doc_key} (삭제됨, 청크 {len(previous['chunk_ids'])}개 제거)")
+                delete_ids.extend(previous["chunk_ids"])
+
+        # 이전 manifest도 없으면 처음부터 문서가 없는 것 → 중단
+        # (이전 문서가 모두 삭제된 경우는 아래에서 청크 삭제 + 빈 manifest 저장)
+        if not new_manifest and not documents_manifest:
+            logger.error("\n❌ 로드된 문서 없음!")
+            return False
+
+        # 2. 남은 배치 저장 + 사라진 청크 삭제
+        indexer.flush()
+        if delete_ids:
+            indexer.delete(delete_ids)
+            logger.info(f"   ✓ {len(delete_ids)}개 청크 삭제")
+
+        if not new_manifest:
+            # 검색 인덱스도 비움 (남아 있으면 삭제된 문서가 계속 인용됨)
+            for index_dir in (BM25_DIR, INT8_DIR):
+                shutil.rmtree(index_dir, ignore_errors=True)
+            save_manifest({"params": params, "documents": {}})
+            logger.info("\n⚠️ 문서가 모두 삭제됨 → 벡터 저장소 / 검색 인덱스 비움\n")
+            return True
+
+        if not indexer.added and not delete_ids:
+            if not all(os.path.exists(os.path.join(d, "meta.json")) for d in (BM25_DIR, INT8_DIR)):
+                logger.info("\n🔤 검색 인덱스(BM25 / int8) 없음 → 생성")
+                build_search_indexes(indexer, missing_only=True)
+            # 파일만 바뀌고 청크는 같은 문서(다시 저장, 메타데이터 수정 등)도 새 지문 기록
+            # → 다음 실행부터 "변경 없음"으로 분할 생략
+            if new_manifest != documents_manifest:
+                save_manifest({"params": params, "documents": new_manifest})
+                logger.info("   ✓ 청크 변화 없는 문서 지문 갱신")
+            logger.info("\n✅ 벡터 저장소가 최신 상태입니다. (청크 변경 없음)\n")
+            return True
+
+        # BM25 희소 인덱스 + int8 밀집 인덱스 (변경된 청크 집합 기준으로 재생성)
+        logger.info("\n🔤 검색 인덱스(BM25 / int8) 생성 중...")
+        build_search_indexes(indexer)
+
+        # manifest는 검색 인덱스까지 성공한 뒤 저장
+        # (인덱스 생성이 실패하면 다음 실행에서 변경으로 감지되어 다시 생성됨)
+        save_manifest({"params": params, "documents": new_manifest})
+
         # 크기 확인
         dir_size = sum(
             os.path.getsize(os.path.join(dirpath, filename))
             for dirpath, _, filenames in os.walk(VECTORSTORE_DIR)
             for filename in filenames
         ) / 1024 / 1024
-        
+
+        logger.info(f"\n2️⃣ 반영 결과: 페이지 {total_pages}개 처리, 청크 추가 {indexer.added}개, 삭제 {len(delete_ids)}개")
+        logger.info(f"   📂 저장 위치: {VECTORSTORE_DIR}")
         logger.info(f"   💾 저장소 크기: {dir_size:.1f} MB")
-        
+        embedding_cache.log_stats()
+
         logger.info("\n" + "="*70)
-        logger.info("✅ 벡터 저장소 생성 완료!")
+        logger.info(f"✅ 벡터 저장소 갱신 완료! ({time.perf_counter() - started:.1f}초)")
         logger.info("="*70)
-        logger.info(f"\n이제 RAG 분석을 빠르게 실행할 수 있습니다.")
-        logger.info(f"재생성이 필요하면 이 스크립트를 다시 실행하세요.\n")
-        
+        logger.info(f"\n문서를 추가/수정/삭제한 뒤 이 스크립트를 다시 실행하면 바뀐 부분만 반영됩니다.\n")
+
         return True
-        
+
     except Exception as e:
         logger.error(f"\n❌ 벡터 저장소 생성 실패: {e}")
         import traceback
         traceback.print_exc()
         return False
 
+
 if __name__ == "__main__":
-    success = build_vectorstore()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="RAG 벡터 저장소 증분 생성")
+    parser.add_argument("--full", action="store_true", help="기존 저장소를 지우고 전체 재생성")
+    parser.add_argument("--max-pages", type=int, default=None, help="문서당 최대 페이지 수 (기본: 제한 없음)")
+    parser.add_argument("--workers", type=int, default=None, help="문서 분할 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--batch-size", type=int, default=ADD_BATCH_SIZE, help="임베딩 배치 크기")
+    args = parser.parse_args()
+
+    success = build_vectorstore(
+        max_pages_per_doc=args.max_pages,
+        full_rebuild=args.full,
+        workers=args.workers,
+        batch_size=args.batch_size
+    )
+    sys.exit(0 if success else 1)
@@ -11,13 +11,14 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import argparse
-from graph.workflow import create_workflow
+import asyncio
+from graph.workflow import create_async_workflow, close_workflow
 from utils.logger import logger
 from datetime import datetime
 
-def resume_analysis(thread_id: str):
+async def aresume_analysis(thread_id: str):
     """
-    중단된 분석 재개
+    중단된 분석 재개 (비동기 그래프 실행, app.astream)
     
     Args:
         thread_id: 재개할 thread ID
@@ -28,7 +29,7 @@ def resume_analysis(thread_id: str):
     logger.info(f"\n📍 Thread ID: {thread_id}\n")
     
     # Workflow 생성
-    app = create_workflow()
+    app = await create_async_workflow()
     
     # 설정
     config = {
@@ -39,7 +40,7 @@ def resume_analysis(thread_id: str):
     
     # 이전 상태 확인
     try:
-        previous_state = app.get_state(config)
+        previous_state = await app.aget_state(config)
         
         if not previous_state or not previous_state.values:
             logger.error("❌ 이전 상태를 찾을 수 없습니다!")
@@ -64,7 +65,7 @@ def resume_analysis(thread_id: str):
         # 재개
         logger.info("\n▶️  분석 재개 중...\n")
         
-        for event in app.stream(None, config, stream_mode="values"):
+        async for event in app.astream(None, config, stream_mode="values"):
             # 진행 상황 출력
             if event.get("step_collector") and "collector" not in completed:
                 logger.info("✅ Collector 완료")
@@ -86,7 +87,7 @@ def resume_analysis(thread_id: str):
                 completed.append("report")
         
         # 최종 상태
-        final_state = app.get_state(config).values
+        final_state = (await app.aget_state(config)).values
         
         logger.info("\n" + "="*70)
         logger.info("🎉 분석 재개 완료!")
@@ -105,6 +106,13 @@ def resume_analysis(thread_id: str):
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        await close_workflow(app)
+
+def resume_analysis(thread_id: str):
+    """동기 진입점 (호환용): aresume_analysis()를 새 이벤트 루프에서 실행"""
+    return asyncio.run(aresume_analysis(thread_id))
 
 def cli():
     parser = argparse.ArgumentParser(description="중단된 분석 재개")
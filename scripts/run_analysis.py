@@ -41,6 +41,36 @@ def cli():
         help="RAG 분석 스킵"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="수집 응답 캐시 사용 안 함 (항상 새로 요청)"
+    )
+    
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="LLM 응답 캐시 사용 안 함 (항상 API 호출)"
+    )
+    
+    parser.add_argument(
+        "--no-memo",
+        action="store_true",
+        help="노드 결과 재사용 안 함 (입력이 같아도 모든 노드 실행)"
+    )
+    
+    parser.add_argument(
+        "--offline-translation",
+        action="store_true",
+        help="RAG 질의 번역을 네트워크 없이 용어집으로 처리 (테스트용)"
+    )
+    
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="증분 수집 코퍼스를 무시하고 전체 기간 재수집"
+    )
+    
     args = parser.parse_args()
     
     # 키워드 오버라이드
@@ -54,19 +84,50 @@ def cli():
         settings.LIMITS["arxiv_max_per_keyword"] = 50
         settings.LIMITS["github_max_per_keyword"] = 20
     
+    # 캐시 비활성화
+    if args.no_cache:
+        logger.info(f"🚫 응답 캐시 비활성화")
+        from utils.response_cache import response_cache
+        response_cache.enabled = False
+        args.no_memo = True  # 재사용 결과도 이전 응답 기반이므로 함께 비활성화
+    
+    # LLM 캐시 비활성화
+    if args.no_llm_cache:
+        logger.info(f"🚫 LLM 응답 캐시 비활성화")
+        from utils.llm_cache import llm_cache
+        llm_cache.enabled = False
+    
+    # 노드 결과 재사용 비활성화
+    if args.no_memo:
+        logger.info(f"🚫 노드 결과 재사용 비활성화")
+        from utils.node_memo import node_memo
+        node_memo.enabled = False
+    
+    # 오프라인 번역
+    if args.offline_translation:
+        logger.info(f"🌐 RAG 질의 번역: 오프라인 모드")
+        from utils.translator import translator
+        translator.backend = "offline"
+    
+    # 전체 재수집
+    if args.full_refresh:
+        logger.info(f"🔄 전체 재수집 모드")
+        settings.COLLECTION["full_refresh"] = True
+    
     # RAG 스킵
     if args.no_rag:
         logger.info(f"⏭️  RAG 분석 스킵")
         # workflow_config에서 RAG 노드 제거
         from config import workflow_config
-        if "rag_analyzer" in workflow_config.WORKFLOW_NODES:
-            workflow_config.WORKFLOW_NODES.remove("rag_analyzer")
-            # 엣지 재연결
-            workflow_config.WORKFLOW_EDGES = [
+        if "rag_analyzer_agent" in workflow_config.WORKFLOW_NODES:
+            workflow_config.WORKFLOW_NODES.remove("rag_analyzer_agent")
+            # 엣지 재연결 (기술/시장 분석 → 교차 검증), graph.workflow가 같은 리스트를 참조하므로 제자리 수정
+            workflow_config.WORKFLOW_EDGES[:] = [
                 e for e in workflow_config.WORKFLOW_EDGES 
-                if "rag_analyzer" not in e
+                if "rag_analyzer_agent" not in e
             ]
-            workflow_config.WORKFLOW_EDGES.append(("market_analyzer", "cross_analyzer"))
+            workflow_config.WORKFLOW_EDGES.append(("tech_analyzer_agent", "cross_check_agent"))
+            workflow_config.WORKFLOW_EDGES.append(("market_analyzer_agent", "cross_check_agent"))
     
     # 실행
     main()
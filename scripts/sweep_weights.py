@@ -0,0 +1,100 @@
+# scripts/sweep_weights.py
+"""
+테마 가중치 민감도 스윕 (수집 / LLM 호출 없음)
+- 체크포인트 DB(또는 JSON 파일)에 저장된 tech_trends, market_trends 재사용
+- 가중치 수천 개에 대한 CLUSTER_RULES 테마 랭킹을 한 번에 계산 → 순위 안정성 통계 저장
+
+사용 예시:
+  python scripts/sweep_weights.py                               # 가장 최근 체크포인트
+  python scripts/sweep_weights.py --thread-id ai-trends-20251023_101500
+  python scripts/sweep_weights.py --mode grid --step 0.05
+  python scripts/sweep_weights.py --state-json outputs/state.json --samples 20000
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import sqlite3
+from datetime import datetime
+
+from config.settings import settings
+from config.workflow_config import CHECKPOINT_CONFIG
+from nodes.cross_node import theme_score_inputs
+from utils.weight_sweep import sample_weights, sweep_theme_weights
+from utils.logger import logger
+
+
+def load_trends_from_checkpoint(thread_id: str = None):
+    """체크포인트에서 tech_trends / market_trends 로드 (thread_id 없으면 가장 최근)"""
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    conn = sqlite3.connect(CHECKPOINT_CONFIG["db_path"], check_same_thread=False)
+    saver = SqliteSaver(conn)
+    config = {"configurable": {"thread_id": thread_id}} if thread_id else None
+
+    for checkpoint in saver.list(config):
+        values = checkpoint.checkpoint.get("channel_values", {})
+        if values.get("tech_trends") and values.get("market_trends"):
+            logger.info(f"📂 체크포인트 로드: {checkpoint.config['configurable']['thread_id']}")
+            return values["tech_trends"], values["market_trends"]
+    return None, None
+
+
+def main():
+    conf = settings.SWEEP
+    parser = argparse.ArgumentParser(description="테마 가중치 민감도 스윕")
+    parser.add_argument("--thread-id", help="체크포인트 thread ID (기본: 가장 최근)")
+    parser.add_argument("--state-json", help="tech_trends / market_trends가 담긴 JSON 파일")
+    parser.add_argument("--mode", choices=["monte_carlo", "grid"], default=conf["mode"])
+    parser.add_argument("--samples", type=int, default=conf["samples"], help="Monte-Carlo 샘플 수")
+    parser.add_argument("--step", type=float, default=conf["grid_step"], help="격자 간격")
+    parser.add_argument("--seed", type=int, default=conf["seed"])
+    parser.add_argument("--top-k", type=int, default=settings.ANALYSIS["num_trends"])
+    args = parser.parse_args()
+
+    if args.state_json:
+        with open(args.state_json, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        tech_trends, market_trends = state.get("tech_trends"), state.get("market_trends")
+    else:
+        tech_trends, market_trends = load_trends_from_checkpoint(args.thread_id)
+
+    if not tech_trends or not market_trends:
+        logger.error("❌ tech_trends / market_trends를 찾을 수 없습니다. (분석을 먼저 실행하세요)")
+        return False
+
+    theme_inputs = theme_score_inputs(tech_trends, market_trends)
+    if not theme_inputs:
+        logger.error("❌ 매칭된 테마가 없습니다.")
+        return False
+
+    weights = sample_weights(args.mode, args.samples, args.step, args.seed)
+    result = sweep_theme_weights(theme_inputs, weights, top_k=args.top_k)
+    result["mode"] = args.mode
+
+    logger.info("=" * 70)
+    logger.info(f"⚖️  가중치 {result['num_weights']:,}개 × 테마 {result['num_themes']}개 ({args.mode})")
+    logger.info(f"   현재 순위와 완전히 같은 비율: {result['p_same_order'] * 100:.1f}%")
+    logger.info(f"   Top {args.top_k} 구성이 같은 비율: {result[f'p_same_top{args.top_k}_set'] * 100:.1f}%")
+    logger.info("=" * 70)
+    for name, stats in result["themes"].items():
+        logger.info(
+            f"   {stats['baseline_rank']}위 {name:30s} | 평균 {stats['mean_rank']:.2f}위 "
+            f"(±{stats['std_rank']:.2f}, {stats['min_rank']}~{stats['max_rank']}위) | "
+            f"순위 유지 {stats['p_same_rank'] * 100:5.1f}% | 1위 {stats['p_top1'] * 100:5.1f}%"
+        )
+    logger.info(f"   README 가중치 순위: {result['named']['readme']}")
+    logger.info("=" * 70)
+
+    os.makedirs(conf["output_dir"], exist_ok=True)
+    output_path = os.path.join(conf["output_dir"], f"weight_sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    logger.info(f"💾 저장: {output_path}")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -195,7 +195,7 @@ def create_mock_state():
         "rag_analysis": {},
         "trend_matrix": [],
         "top_5_trends": top_5_trends,
-        "final_report": "",
+        "final_report": None,
         "error_log": [],
         "step_collector": "completed",
         "step_tech": "completed",
@@ -2,6 +2,12 @@
 from typing import TypedDict, Optional, Annotated
 from operator import add
 
+
+def merge_dicts(left: Optional[dict], right: Optional[dict]) -> dict:
+    """병렬 노드가 같은 dict 필드를 갱신할 때 키 단위 병합"""
+    return {**(left or {}), **(right or {})}
+
+
 class GraphState(TypedDict):
     """
     AI Trends 2025-2030 분석 그래프 상태
@@ -18,9 +24,12 @@ class GraphState(TypedDict):
     # ==========================================
     # 수집 데이터 (Agent 1)
     # ==========================================
+    # 큰 필드는 blob 참조 {"blob_ref", "count", "bytes"}로 저장될 수 있음
+    # → 읽을 때 utils.blob_store.load_field(state, key) 사용
     papers: list                   # arXiv 논문 목록
     github_repos: list             # GitHub 저장소 목록
     google_trends: dict            # Google Trends 데이터
+    collection_timings: Optional[dict]  # 소스별 수집 소요 시간(초) + total
     
     # ==========================================
     # 분석 결과 (Agent 2, 3, 4)
@@ -34,13 +43,16 @@ class GraphState(TypedDict):
     # ==========================================
     # 최종 출력 (Agent 5)
     # ==========================================
-    final_report: str              # 최종 보고서 (Markdown)
+    # 보고서 파일 참조 {"path", "pdf_path", "chars", "bytes", "sha256", "sections"}
+    # → 내용은 utils.report_spool.read_report(ref)로 로드
+    final_report: Optional[dict]
     
     # ==========================================
     # 누적 데이터 (자동 병합)
     # ==========================================
     messages: Annotated[list, add]      # 각 노드의 메시지 (자동 추가)
     error_log: Annotated[list, add]     # 에러 로그 (자동 추가)
+    node_metrics: Annotated[dict, merge_dicts]  # 노드별 계측값 (utils.instrumentation)
     
     # ==========================================
     # 진행 상태 (각 노드별)
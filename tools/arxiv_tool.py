@@ -1,120 +1,280 @@
 # tools/arxiv_tool.py
 """
 arXiv 논문 검색 도구
+- 키워드별 쿼리를 asyncio로 동시에 실행
+- 공유 토큰 버킷(utils.rate_limiter)으로 arXiv API 요청 간격 준수
+- fetch 백엔드 교체 가능 (로컬 가짜 arXiv 피드 서버로 벤치마크)
+- 응답은 공용 디스크 캐시(utils.response_cache)에 저장, hit 시 토큰 소모 없음
 """
 from langchain_core.tools import tool
-from typing import List, Dict
-import arxiv
+from typing import List, Dict, Optional, Callable, Awaitable
 from datetime import datetime
-import time
+import xml.etree.ElementTree as ET
+import asyncio
+import re
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import settings
 from utils.logger import logger
+from utils.rate_limiter import TokenBucket, get_rate_limiter
+from utils.response_cache import response_cache
 
-@tool
-def search_arxiv_papers(keywords: List[str], max_results: int = 100) -> List[Dict]:
+# fetch 백엔드 시그니처: (url, params) -> Atom XML 문자열
+FetchFn = Callable[[str, Dict], Awaitable[str]]
+
+ATOM_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
+
+# ============================================
+# 🌐 기본 fetch 백엔드 (requests 세션 재사용)
+# ============================================
+class RequestsFetcher:
+    """requests.Session을 스레드에서 실행하는 기본 백엔드 (커넥션 재사용 + 디스크 캐시)"""
+
+    def __init__(self, timeout: Optional[float] = None):
+        import requests
+        self.session = requests.Session()
+        self.timeout = timeout or settings.ARXIV["timeout"]
+
+    def _get(self, url: str, params: Dict) -> str:
+        return response_cache.http_get(self.session, "arxiv", url, params, timeout=self.timeout)
+
+    async def __call__(self, url: str, params: Dict) -> str:
+        return await asyncio.to_thread(self._get, url, params)
+
+
+# ============================================
+# 📄 Atom 피드 파싱
+# ============================================
+def parse_arxiv_feed(xml_text: str) -> List[Dict]:
+    """arXiv Atom 피드 → entry 딕셔너리 리스트 (arxiv 라이브러리 Result와 같은 필드)"""
+    root = ET.fromstring(xml_text)
+    entries = []
+
+    for entry in root.findall("atom:entry", ATOM_NS):
+        entry_id = (entry.findtext("atom:id", "", ATOM_NS) or "").strip()
+        published = (entry.findtext("atom:published", "", ATOM_NS) or "").strip()
+        if not entry_id or not published:
+            continue
+
+        entries.append({
+            "entry_id": entry_id,
+            "title": re.sub(r"\s+", " ", entry.findtext("atom:title", "", ATOM_NS) or ""),
+            "summary": entry.findtext("atom:summary", "", ATOM_NS) or "",
+            "published": datetime.strptime(published[:10], "%Y-%m-%d").date(),
+            "authors": [
+                (a.findtext("atom:name", "", ATOM_NS) or "").strip()
+                for a in entry.findall("atom:author", ATOM_NS)
+            ],
+            "categories": [
+                c.get("term") for c in entry.findall("atom:category", ATOM_NS) if c.get("term")
+            ],
+        })
+
+    return entries
+
+
+# ============================================
+# ⚙️ 비동기 수집 엔진
+# ============================================
+async def _fetch_page(
+    fetch: FetchFn,
+    limiter: TokenBucket,
+    keyword: str,
+    start: int,
+    page_size: int,
+    since=None,
+    until=None
+) -> List[Dict]:
+    """한 페이지 요청 (Rate limit + 재시도)"""
+    search_query = keyword
+    if since is not None:
+        # 증분 수집: 제출일 범위로 서버 측 필터링
+        search_query = (
+            f"({keyword}) AND submittedDate:"
+            f"[{since.strftime('%Y%m%d')}0000 TO {until.strftime('%Y%m%d')}2359]"
+        )
+
+    params = {
+        "search_query": search_query,
+        "id_list": "",
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+        "start": start,
+        "max_results": page_size,
+    }
+    url = settings.ARXIV["api_url"]
+
+    # 캐시 hit이면 Rate limit 토큰을 쓰지 않음
+    cached = response_cache.get("arxiv", {"url": url, **params})
+    if cached is not None:
+        return parse_arxiv_feed(cached)
+
+    num_retries = settings.ARXIV["num_retries"]
+    for attempt in range(num_retries + 1):
+        await limiter.acquire()
+        try:
+            xml_text = await fetch(url, params)
+            return parse_arxiv_feed(xml_text)
+        except Exception as e:
+            if attempt >= num_retries:
+                raise
+            logger.warning(f"      ⚠️ '{keyword}' 요청 실패, 재시도 ({attempt + 1}/{num_retries}): {e}")
+
+    return []
+
+
+async def _collect_keyword(
+    fetch: FetchFn,
+    limiter: TokenBucket,
+    keyword: str,
+    max_results: int,
+    start_date,
+    end_date,
+    since=None
+) -> List[Dict]:
     """
-    arXiv에서 AI 관련 논문을 검색합니다.
-    
-    Args:
-        keywords: 검색할 키워드 리스트
-        max_results: 키워드당 최대 결과 수
-    
-    Returns:
-        논문 정보 리스트
+    키워드 1개 수집 (최신순 상위 max_results개 중 기간 내 논문)
+    - since가 주어지면 그 날짜 이후 제출된 논문만 요청 (증분 수집)
     """
-    logger.info(f"📄 arXiv 논문 검색 시작 (키워드: {len(keywords)}개)")
-    
-    papers = []
-    
-    # ✅ 날짜를 date 객체로 변환
-    start_date = datetime.strptime(settings.ANALYSIS["date_range"]["start"], "%Y-%m-%d").date()
-    end_date = datetime.strptime(settings.ANALYSIS["date_range"]["end"], "%Y-%m-%d").date()
-    
-    for idx, keyword in enumerate(keywords, 1):
-        try:
-            logger.info(f"   [{idx}/{len(keywords)}] 검색 중: '{keyword}'")
-            
-            # ✅ 검색 설정
-            search = arxiv.Search(
-                query=keyword,
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
+    page_size = min(settings.ARXIV["page_size"], max_results)
+    keyword_papers = []
+    seen = 0
+
+    try:
+        while seen < max_results:
+            requested = min(page_size, max_results - seen)
+            entries = await _fetch_page(
+                fetch, limiter, keyword, seen, requested,
+                since=since, until=end_date if since is not None else None
             )
-            
-            count = 0
-            keyword_papers = []
-            
-            # ✅ 결과 순회 (에러 핸들링 추가)
-            try:
-                for result in search.results():
-                    try:
-                        pub_date = result.published.date()
-                        
-                        # 날짜 필터링
-                        if pub_date < start_date or pub_date > end_date:
-                            continue
-                        
-                        # 논문 정보 저장
-                        keyword_papers.append({
-                            "id": result.entry_id.split('/')[-1],  # arXiv ID만 추출
-                            "title": result.title.strip(),
-                            "authors": [a.name for a in result.authors][:5],
-                            "abstract": result.summary.strip()[:500],
-                            "publish_date": pub_date.isoformat(),
-                            "keywords": [keyword],
-                            "url": result.entry_id,
-                            "categories": result.categories if hasattr(result, 'categories') else []
-                        })
-                        count += 1
-                        
-                        # ✅ 최대 개수 도달 시 중단
-                        if count >= max_results:
-                            break
-                            
-                    except Exception as e:
-                        # 개별 논문 처리 실패는 건너뛰기
-                        continue
-                
-            except StopIteration:
-                # 더 이상 결과 없음
-                pass
-            except arxiv.UnexpectedEmptyPageError:
-                # 빈 페이지 에러 (무시)
-                logger.warning(f"      ⚠️ 더 이상 결과 없음")
-            except Exception as e:
-                logger.warning(f"      ⚠️ 검색 중 예외: {e}")
-            
-            # 수집된 논문 추가
-            papers.extend(keyword_papers)
-            logger.info(f"      ✓ {count}개 수집")
-            
-            # ✅ Rate limit 방지 (키워드 간 대기)
-            if idx < len(keywords):
-                time.sleep(3)  # 3초 대기
-            
-        except Exception as e:
-            logger.error(f"      ✗ '{keyword}' 검색 실패: {e}")
-            continue
-    
-    # ✅ 중복 제거 (같은 논문이 여러 키워드에서 나올 수 있음)
+            if not entries:
+                break  # 더 이상 결과 없음
+
+            for entry in entries[:requested]:
+                pub_date = entry["published"]
+
+                # 날짜 필터링
+                if pub_date < start_date or pub_date > end_date:
+                    continue
+
+                keyword_papers.append({
+                    "id": entry["entry_id"].split('/')[-1],  # arXiv ID만 추출
+                    "title": entry["title"].strip(),
+                    "authors": entry["authors"][:5],
+                    "abstract": entry["summary"].strip()[:500],
+                    "publish_date": pub_date.isoformat(),
+                    "keywords": [keyword],
+                    "url": entry["entry_id"],
+                    "categories": entry["categories"]
+                })
+
+            seen += len(entries)
+            if len(entries) < requested:
+                break
+
+    except Exception as e:
+        logger.error(f"      ✗ '{keyword}' 검색 실패: {e}")
+
+    logger.info(f"      ✓ '{keyword}': {len(keyword_papers)}개 수집")
+    return keyword_papers
+
+
+def merge_papers(papers: List[Dict]) -> List[Dict]:
+    """중복 제거 (같은 논문이 여러 키워드에서 나올 수 있음) + 키워드 병합"""
     unique_papers = {}
     for paper in papers:
         paper_id = paper["id"]
         if paper_id not in unique_papers:
             unique_papers[paper_id] = paper
         else:
-            # 키워드 병합
             existing_keywords = unique_papers[paper_id]["keywords"]
             new_keywords = paper["keywords"]
             unique_papers[paper_id]["keywords"] = list(set(existing_keywords + new_keywords))
-    
-    final_papers = list(unique_papers.values())
-    
+    return list(unique_papers.values())
+
+
+async def collect_arxiv_by_keyword(
+    keywords: List[str],
+    max_results: int = 100,
+    fetch: Optional[FetchFn] = None,
+    limiter: Optional[TokenBucket] = None,
+    since: Optional[Dict[str, str]] = None
+) -> Dict[str, List[Dict]]:
+    """
+    키워드별 arXiv 논문 비동기 수집 (키워드 동시 실행, 병합 전 결과)
+
+    Args:
+        keywords: 검색할 키워드 리스트
+        max_results: 키워드당 최대 결과 수
+        fetch: (url, params) -> XML 코루틴 (기본: RequestsFetcher)
+        limiter: 토큰 버킷 (기본: settings.RATE_LIMITS["arxiv"] 공유 버킷)
+        since: 키워드 → 'YYYY-MM-DD' (이 날짜 이후만 수집, 증분 모드)
+
+    Returns:
+        {키워드: 논문 정보 리스트}
+    """
+    fetch = fetch or RequestsFetcher()
+    limiter = limiter or get_rate_limiter("arxiv")
+    since = since or {}
+
+    start_date = datetime.strptime(settings.ANALYSIS["date_range"]["start"], "%Y-%m-%d").date()
+    end_date = datetime.strptime(settings.ANALYSIS["date_range"]["end"], "%Y-%m-%d").date()
+
+    results = await asyncio.gather(*[
+        _collect_keyword(
+            fetch, limiter, keyword, max_results, start_date, end_date,
+            since=datetime.strptime(since[keyword], "%Y-%m-%d").date() if since.get(keyword) else None
+        )
+        for keyword in keywords
+    ])
+    return dict(zip(keywords, results))
+
+
+async def collect_arxiv_papers(
+    keywords: List[str],
+    max_results: int = 100,
+    fetch: Optional[FetchFn] = None,
+    limiter: Optional[TokenBucket] = None
+) -> List[Dict]:
+    """
+    arXiv 논문 비동기 수집 (키워드 동시 실행)
+
+    Args:
+        keywords: 검색할 키워드 리스트
+        max_results: 키워드당 최대 결과 수
+        fetch: (url, params) -> XML 코루틴 (기본: RequestsFetcher)
+        limiter: 토큰 버킷 (기본: settings.RATE_LIMITS["arxiv"] 공유 버킷)
+
+    Returns:
+        논문 정보 리스트 (중복 제거 + 키워드 병합)
+    """
+    logger.info(f"📄 arXiv 논문 검색 시작 (키워드: {len(keywords)}개, 동시 실행)")
+
+    by_keyword = await collect_arxiv_by_keyword(keywords, max_results, fetch, limiter)
+
+    papers = [paper for keyword in keywords for paper in by_keyword[keyword]]
+    final_papers = merge_papers(papers)
+
     logger.info(f"✅ arXiv 총 {len(final_papers)}개 논문 수집 완료 (중복 제거 후)\n")
-    
-    return final_papers
\ No newline at end of file
+    return final_papers
+
+
+@tool
+def search_arxiv_papers(keywords: List[str], max_results: int = 100) -> List[Dict]:
+    """
+    arXiv에서 AI 관련 논문을 검색합니다.
+
+    Args:
+        keywords: 검색할 키워드 리스트
+        max_results: 키워드당 최대 결과 수
+
+    Returns:
+        논문 정보 리스트
+    """
+    return asyncio.run(collect_arxiv_papers(keywords, max_results))
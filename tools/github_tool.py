@@ -1,63 +1,253 @@
 # tools/github_tool.py
+"""
+GitHub 저장소 검색 도구
+- 커넥션 풀을 가진 requests 세션 1개로 REST Search API 직접 호출
+- 키워드별 페이지 요청을 동시에 실행 (settings.GITHUB_API["max_concurrency"])
+- ETag / If-None-Match 조건부 요청 (utils.response_cache)
+- X-RateLimit-Remaining / Reset, Retry-After 헤더를 읽어 리셋까지 대기 후 재시도
+- base_url 교체로 로컬 가짜 GitHub API에 대해 테스트 가능
+"""
 from langchain_core.tools import tool
 from typing import List, Dict, Optional
-from github import Github
+from concurrent.futures import ThreadPoolExecutor
+import json
+import math
+import threading
+import time
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import settings
 from utils.logger import logger
+from utils.rate_limiter import TokenBucket, get_rate_limiter
+from utils.response_cache import response_cache
+
+MAX_REPOS_PER_KEYWORD = 50
+
+
+class GithubRateLimited(Exception):
+    """rate limit 응답 (wait: 리셋까지 남은 초)"""
+
+    def __init__(self, wait: float):
+        super().__init__(f"GitHub rate limit, {wait:.0f}초 후 리셋")
+        self.wait = wait
+
+
+class GithubSearchClient:
+    """
+    GitHub Search API 클라이언트 (프로세스 내 재사용)
+    - rate limit 상태는 응답 헤더로 갱신하고, 남은 요청이 0이면 리셋 시각까지 대기
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        limiter: Optional[TokenBucket] = None
+    ):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        conf = settings.GITHUB_API
+        self.base_url = (base_url or conf["base_url"]).rstrip("/")
+        self.limiter = limiter or get_rate_limiter("github")
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=conf["max_concurrency"])
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+        token = token if token is not None else settings.GITHUB_TOKEN
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+
+        self._rate_lock = threading.Lock()
+        self._remaining = None
+        self._reset_at = 0.0
+
+    # ------------------------------------------
+    # Rate limit
+    # ------------------------------------------
+    def _on_response(self, response) -> None:
+        """응답 헤더로 rate limit 상태 갱신, 제한 응답이면 GithubRateLimited"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        with self._rate_lock:
+            if remaining is not None:
+                self._remaining = int(remaining)
+            if reset is not None:
+                self._reset_at = float(reset)
+
+        if response.status_code in (403, 429):
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                raise GithubRateLimited(float(retry_after))
+            if remaining == "0":
+                raise GithubRateLimited(max(float(reset or 0) - time.time(), 0) + 1)
+
+    def _wait_for_quota(self) -> None:
+        """남은 요청이 0이면 리셋 시각까지 대기 (상한 초과 시 예외)"""
+        with self._rate_lock:
+            exhausted = self._remaining == 0
+            wait = self._reset_at - time.time() + 1
+        if exhausted and wait > 0:
+            self._sleep_for_reset(wait)
+
+    def _sleep_for_reset(self, wait: float) -> None:
+        max_wait = settings.GITHUB_API["max_rate_wait"]
+        if wait > max_wait:
+            raise GithubRateLimited(wait)
+        logger.warning(f"      ⚠️ GitHub rate limit 소진 → {wait:.0f}초 대기")
+        time.sleep(wait)
+        with self._rate_lock:
+            self._remaining = None
+
+    # ------------------------------------------
+    # 검색
+    # ------------------------------------------
+    def search_page(self, query: str, page: int = 1, per_page: int = 50) -> List[Dict]:
+        """검색 결과 1페이지 (캐시 hit이면 요청/토큰 없이 반환)"""
+        url = f"{self.base_url}/search/repositories"
+        params = {"q": query, "sort": "stars", "order": "desc", "per_page": per_page, "page": page}
+
+        cached = response_cache.get("github", {"url": url, **params})
+        if cached is None:
+            num_retries = settings.GITHUB_API["num_retries"]
+            for attempt in range(num_retries + 1):
+                self._wait_for_quota()
+                self.limiter.acquire_sync()
+                try:
+                    cached = response_cache.http_get(
+                        self.session, "github", url, params,
+                        timeout=settings.GITHUB_API["timeout"],
+                        on_response=self._on_response
+                    )
+                    break
+                except GithubRateLimited as e:
+                    if attempt >= num_retries:
+                        raise
+                    self._sleep_for_reset(e.wait)
+
+        return [
+            {
+                "name": item["full_name"],
+                "description": item.get("description") or "",
+                "stars": item.get("stargazers_count", 0),
+                "forks": item.get("forks_count", 0),
+                "language": item.get("language") or "Unknown",
+                "url": item.get("html_url", "")
+            }
+            for item in json.loads(cached).get("items", [])
+        ]
+
+    def search_keyword(
+        self,
+        keyword: str,
+        min_stars: int = 100,
+        created_after: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        키워드 1개 검색 (stars 내림차순 상위 50개)
+        - created_after('YYYY-MM-DD')가 주어지면 그날 이후(당일 포함) 생성된 저장소만 검색 (증분 모드)
+        - 증분 모드에서는 생성일 조건 없는 stars 상위 refresh_pages 페이지도 함께 조회
+          → 예전에 생성됐지만 뒤늦게 min_stars를 넘은 저장소, 이미 아는 저장소의 stars 갱신
+        """
+        base_query = f"{keyword} language:python stars:>{min_stars}"
+        query = f"{base_query} created:>={created_after}" if created_after else base_query
+
+        per_page = min(settings.GITHUB_API["per_page"], MAX_REPOS_PER_KEYWORD)
+        repos = []
+        for page in range(1, math.ceil(MAX_REPOS_PER_KEYWORD / per_page) + 1):
+            items = self.search_page(query, page, per_page)
+            repos.extend(items)
+            if len(items) < per_page:
+                break
+
+        if created_after:
+            seen = {r["name"] for r in repos}
+            for page in range(1, settings.GITHUB_API["refresh_pages"] + 1):
+                items = self.search_page(base_query, page, per_page)
+                repos.extend(r for r in items if r["name"] not in seen)
+                seen.update(r["name"] for r in items)
+                if len(items) < per_page:
+                    break
+            repos.sort(key=lambda r: int(r.get("stars", 0)), reverse=True)
+        return repos[:MAX_REPOS_PER_KEYWORD]  # 키워드당 최대 50개
+
+    def search_keywords(
+        self,
+        keywords: List[str],
+        min_stars: int = 100,
+        created_after: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        여러 키워드 동시 검색 (키워드별 에러 격리, 실패한 키워드는 결과에서 제외)
+
+        Returns:
+            {키워드: 저장소 정보 리스트}
+        """
+        created_after = created_after or {}
+
+        def run(keyword):
+            try:
+                repos = self.search_keyword(keyword, min_stars, created_after.get(keyword))
+                logger.info(f"   ✓ '{keyword}': {len(repos)}개 검색")
+                return keyword, repos
+            except Exception as e:
+                logger.error(f"   ✗ '{keyword}' 검색 실패: {e}")
+                return keyword, None
+
+        with ThreadPoolExecutor(max_workers=settings.GITHUB_API["max_concurrency"]) as executor:
+            results = list(executor.map(run, keywords))
+
+        return {keyword: repos for keyword, repos in results if repos is not None}
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_github_client() -> GithubSearchClient:
+    """공유 클라이언트 (세션/커넥션 풀/rate limit 상태 재사용)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GithubSearchClient()
+        return _client
+
+
+def dedupe_repos(repos_by_keyword: Dict[str, List[Dict]], keywords: List[str]) -> List[Dict]:
+    """키워드 순서대로 병합 (먼저 나온 키워드에 귀속, 저장소명 기준 중복 제거)"""
+    repos = []
+    seen_names = set()
+    for keyword in keywords:
+        for repo in repos_by_keyword.get(keyword, []):
+            if repo["name"] not in seen_names:
+                repos.append({**repo, "keywords": [keyword]})
+                seen_names.add(repo["name"])
+    return repos
+
 
 @tool
 def search_github_repos(keywords: List[str], min_stars: int = 100) -> List[Dict]:
     """
     GitHub에서 인기 AI 저장소를 검색합니다.
-    
+
     Args:
         keywords: 검색할 키워드 리스트
         min_stars: 최소 star 수
-    
+
     Returns:
         저장소 정보 리스트
     """
     logger.info(f"🐙 GitHub 저장소 검색 시작 (키워드: {len(keywords)}개)")
-    
-    # GitHub 인증
-    token = settings.GITHUB_TOKEN
-    g = Github(token) if token else Github()
-    
-    repos = []
-    seen_names = set()  # 중복 제거용
-    
-    for keyword in keywords:
-        try:
-            logger.info(f"   검색 중: '{keyword}'")
-            
-            # 검색 쿼리
-            query = f"{keyword} language:python stars:>{min_stars}"
-            results = g.search_repositories(query=query, sort="stars")
-            
-            count = 0
-            for repo in results[:50]:  # 키워드당 최대 50개
-                if repo.full_name not in seen_names:
-                    repos.append({
-                        "name": repo.full_name,
-                        "description": repo.description or "",
-                        "stars": repo.stargazers_count,
-                        "forks": repo.forks_count,
-                        "language": repo.language or "Unknown",
-                        "url": repo.html_url,
-                        "keywords": [keyword]
-                    })
-                    seen_names.add(repo.full_name)
-                    count += 1
-            
-            logger.info(f"   ✓ '{keyword}': {count}개 수집")
-            
-        except Exception as e:
-            logger.error(f"   ✗ '{keyword}' 검색 실패: {e}")
-            continue
-    
+
+    repos_by_keyword = get_github_client().search_keywords(keywords, min_stars)
+    repos = dedupe_repos(repos_by_keyword, keywords)
+
     logger.info(f"✅ GitHub 총 {len(repos)}개 저장소 수집 완료")
-    return repos
\ No newline at end of file
+    return repos
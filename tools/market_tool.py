@@ -1,13 +1,197 @@
 # tools/market_tool.py
 from langchain_core.tools import tool
-from typing import List, Dict
-from tavily import TavilyClient
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import re
+import threading
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import settings
 from utils.logger import logger
+from utils.rate_limiter import get_rate_limiter
+from utils.response_cache import response_cache
+
+# 신뢰할 수 있는 출처만
+TRUSTED_DOMAINS = [
+    "mckinsey.com",
+    "gartner.com", 
+    "idc.com",
+    "forrester.com",
+    "statista.com",
+    "techcrunch.com",
+    "venturebeat.com",
+    "cbinsights.com"
+]
+
+# ============================================
+# 🔁 쿼리 중복 제거 (정확/유사 중복)
+# ============================================
+def _query_tokens(query: str) -> frozenset:
+    return frozenset(re.findall(r"[a-z0-9]+", query.lower()))
+
+
+def dedupe_queries(queries: List[str], threshold: Optional[float] = None) -> Tuple[List[str], Dict[str, str]]:
+    """
+    정확 중복 + 유사 중복(토큰 Jaccard ≥ threshold) 제거
+
+    Returns:
+        (대표 쿼리 리스트, 원본 쿼리 → 대표 쿼리 매핑)
+    """
+    threshold = settings.MARKET_SEARCH["near_duplicate_threshold"] if threshold is None else threshold
+    representatives = []  # (쿼리, 토큰 집합)
+    alias = {}
+
+    for query in queries:
+        if query in alias:
+            continue
+        tokens = _query_tokens(query)
+        for rep_query, rep_tokens in representatives:
+            union = tokens | rep_tokens
+            if union and len(tokens & rep_tokens) / len(union) >= threshold:
+                alias[query] = rep_query
+                break
+        else:
+            representatives.append((query, tokens))
+            alias[query] = query
+
+    return [q for q, _ in representatives], alias
+
+
+# ============================================
+# ⚙️ Tavily 검색 엔진 (클라이언트 재사용 + 동시 실행)
+# ============================================
+_tavily_client = None
+_tavily_lock = threading.Lock()
+
+
+def get_tavily_client():
+    """공유 Tavily 클라이언트 (캐시 miss가 발생할 때만 생성)"""
+    global _tavily_client
+    with _tavily_lock:
+        if _tavily_client is None:
+            from tavily import TavilyClient
+            _tavily_client = TavilyClient(api_key=settings.TAVILY_API_KEY)
+        return _tavily_client
+
+
+def _search_params(query: str, max_results: int) -> Dict:
+    return {
+        "query": query,
+        "search_depth": "advanced",  # 심층 검색
+        "max_results": max_results,
+        "include_domains": TRUSTED_DOMAINS
+    }
+
+
+def _format_results(query: str, response: Dict) -> List[Dict]:
+    return [
+        {
+            "query": query,
+            "title": result.get('title', ''),
+            "url": result.get('url', ''),
+            "content": result.get('content', ''),
+            "score": result.get('score', 0),
+            "published_date": result.get('published_date', ''),
+            "source": result.get('url', '').split('/')[2] if result.get('url') else ''
+        }
+        for result in response.get('results', [])
+    ]
+
+
+def _search_one(query: str, max_results: int) -> List[Dict]:
+    """쿼리 1개 검색 (캐시 우선, miss 시 rate limit 토큰 소모)"""
+    search_params = _search_params(query, max_results)
+
+    response = response_cache.get("tavily", search_params)
+    if response is None:
+        get_rate_limiter("tavily").acquire_sync()
+        response = get_tavily_client().search(**search_params)
+        response_cache.put("tavily", search_params, {"results": response.get("results", [])})
+
+    return _format_results(query, response)
+
+
+async def _asearch_one(query: str, max_results: int) -> List[Dict]:
+    """_search_one 비동기 버전 (rate limit 대기는 이벤트 루프에서, HTTP 요청만 스레드에서)"""
+    search_params = _search_params(query, max_results)
+
+    response = response_cache.get("tavily", search_params)
+    if response is None:
+        await get_rate_limiter("tavily").acquire()
+        response = await asyncio.to_thread(get_tavily_client().search, **search_params)
+        response_cache.put("tavily", search_params, {"results": response.get("results", [])})
+
+    return _format_results(query, response)
+
+
+def search_market_queries(
+    queries: List[str],
+    max_results: int = 10,
+    max_concurrency: Optional[int] = None
+) -> Dict[str, List[Dict]]:
+    """
+    여러 쿼리를 중복 제거 후 동시에 검색
+
+    Args:
+        queries: 검색할 쿼리 리스트 (중복 허용)
+        max_results: 쿼리당 최대 결과 수
+        max_concurrency: 동시 요청 수 (기본: settings.MARKET_SEARCH["max_concurrency"])
+
+    Returns:
+        {원본 쿼리: 결과 리스트} (유사 중복 쿼리는 대표 쿼리 결과를 공유, 실패 쿼리는 빈 리스트)
+    """
+    unique_queries, alias = dedupe_queries(queries)
+    max_concurrency = max_concurrency or settings.MARKET_SEARCH["max_concurrency"]
+    logger.info(
+        f"📊 시장 리포트 검색 시작 (쿼리: {len(queries)}개 → 중복 제거 후 {len(unique_queries)}개, "
+        f"동시 {max_concurrency}개)"
+    )
+
+    def run(query):
+        try:
+            results = _search_one(query, max_results)
+            logger.info(f"   ✓ '{query}': {len(results)}개 수집")
+            return query, results
+        except Exception as e:
+            logger.error(f"   ✗ '{query}' 검색 실패: {e}")
+            return query, []
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        by_query = dict(executor.map(run, unique_queries))
+
+    return {query: by_query[alias[query]] for query in queries}
+
+
+async def asearch_market_queries(
+    queries: List[str],
+    max_results: int = 10,
+    max_concurrency: Optional[int] = None
+) -> Dict[str, List[Dict]]:
+    """search_market_queries 비동기 버전 (동시 요청 수는 세마포어로 제한)"""
+    unique_queries, alias = dedupe_queries(queries)
+    max_concurrency = max_concurrency or settings.MARKET_SEARCH["max_concurrency"]
+    logger.info(
+        f"📊 시장 리포트 검색 시작 (쿼리: {len(queries)}개 → 중복 제거 후 {len(unique_queries)}개, "
+        f"동시 {max_concurrency}개, async)"
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(query):
+        async with semaphore:
+            try:
+                results = await _asearch_one(query, max_results)
+                logger.info(f"   ✓ '{query}': {len(results)}개 수집")
+                return query, results
+            except Exception as e:
+                logger.error(f"   ✗ '{query}' 검색 실패: {e}")
+                return query, []
+
+    by_query = dict(await asyncio.gather(*[run(query) for query in unique_queries]))
+    return {query: by_query[alias[query]] for query in queries}
+
 
 @tool
 def search_market_reports(queries: List[str], max_results: int = 10) -> List[Dict]:
@@ -21,52 +205,17 @@ def search_market_reports(queries: List[str], max_results: int = 10) -> List[Dic
     Returns:
         시장 리포트 및 뉴스 정보 리스트
     """
-    logger.info(f"📊 시장 리포트 검색 시작 (쿼리: {len(queries)}개)")
-    
-    # Tavily 클라이언트 초기화
-    tavily = TavilyClient(api_key=settings.TAVILY_API_KEY)
-    
+    results_by_query = search_market_queries(queries, max_results)
+
+    # 유사 중복 쿼리는 대표 쿼리 결과를 1번만 포함
     all_results = []
-    
+    seen_queries = set()
     for query in queries:
-        try:
-            logger.info(f"   검색 중: '{query}'")
-            
-            # Tavily 검색 (심층 검색 모드)
-            response = tavily.search(
-                query=query,
-                search_depth="advanced",  # 심층 검색
-                max_results=max_results,
-                include_domains=[
-                    "mckinsey.com",
-                    "gartner.com", 
-                    "idc.com",
-                    "forrester.com",
-                    "statista.com",
-                    "techcrunch.com",
-                    "venturebeat.com",
-                    "cbinsights.com"
-                ]  # 신뢰할 수 있는 출처만
-            )
-            
-            count = 0
-            for result in response.get('results', []):
-                all_results.append({
-                    "query": query,
-                    "title": result.get('title', ''),
-                    "url": result.get('url', ''),
-                    "content": result.get('content', ''),
-                    "score": result.get('score', 0),
-                    "published_date": result.get('published_date', ''),
-                    "source": result.get('url', '').split('/')[2] if result.get('url') else ''
-                })
-                count += 1
-            
-            logger.info(f"   ✓ '{query}': {count}개 수집")
-            
-        except Exception as e:
-            logger.error(f"   ✗ '{query}' 검색 실패: {e}")
+        results = results_by_query[query]
+        if results and results[0]["query"] in seen_queries:
             continue
+        seen_queries.update(r["query"] for r in results)
+        all_results.extend(results)
     
     logger.info(f"✅ 총 {len(all_results)}개 시장 리포트 수집 완료")
     return all_results
@@ -1,27 +1,38 @@
 # tools/rag_tool.py (개선 버전)
 from langchain_core.tools import tool
-from langchain_community.document_loaders import PyMuPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_chroma import Chroma
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnablePassthrough
 from langchain_core.output_parsers import StrOutputParser
-from typing import Dict
+from langchain_core.documents import Document
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import json
 import os
 import sys
+import time
 import warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import settings
 from utils.logger import logger
+from utils.llm_cache import llm_cache
+from utils.instrumentation import metrics
+from utils.embedding_cache import cached_embeddings
+from utils.translator import translator
+from utils.bm25_index import BM25Index, reciprocal_rank_fusion
+from utils.int8_index import Int8Index, Int8VectorStore
 
 # ============================================
 # 📂 벡터 저장소 경로
 # ============================================
 VECTORSTORE_DIR = "data/vectorstore"
+BM25_DIR = os.path.join(VECTORSTORE_DIR, "bm25")  # build_vectorstore.py가 함께 생성
+INT8_DIR = os.path.join(VECTORSTORE_DIR, "int8")  # build_vectorstore.py가 함께 생성
+MANIFEST_PATH = os.path.join(VECTORSTORE_DIR, "manifest.json")  # 인덱싱된 문서 목록 (build_vectorstore.py)
+
+# BM25 희소 인덱스 (첫 검색 때 로드)
+bm25_index = BM25Index(BM25_DIR)
 
 # ============================================
 # 🔄 벡터 저장소 로드 (캐싱)
@@ -43,19 +54,24 @@ def get_vectorstore():
         return None
     
     try:
-        logger.info(f"📂 벡터 저장소 로드 중: {VECTORSTORE_DIR}")
+        started = time.perf_counter()
         
-        embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2"
-        )
+        # 질의 임베딩도 캐시 조회 (같은 질의 반복 시 모델 추론/로드 생략)
+        embeddings = cached_embeddings("sentence-transformers/all-MiniLM-L6-v2")
         
-        # 저장된 벡터 저장소 로드
-        _vectorstore_cache = Chroma(
-            persist_directory=VECTORSTORE_DIR,
-            embedding_function=embeddings
-        )
+        # int8 메모리 맵 인덱스 우선 (없거나 backend=chroma면 Chroma)
+        if settings.VECTOR_INDEX["backend"] == "int8" and Int8Index.exists(INT8_DIR):
+            logger.info(f"📂 벡터 저장소 로드 중: {INT8_DIR} (int8)")
+            _vectorstore_cache = Int8VectorStore(INT8_DIR, embeddings, nprobe=settings.VECTOR_INDEX["nprobe"])
+        else:
+            logger.info(f"📂 벡터 저장소 로드 중: {VECTORSTORE_DIR} (Chroma)")
+            from langchain_chroma import Chroma  # chromadb는 Chroma 백엔드일 때만 로드
+            _vectorstore_cache = Chroma(
+                persist_directory=VECTORSTORE_DIR,
+                embedding_function=embeddings
+            )
         
-        logger.info(f"   ✅ 로드 완료 (0.1초)")
+        logger.info(f"   ✅ 로드 완료 ({time.perf_counter() - started:.3f}초)")
         return _vectorstore_cache
         
     except Exception as e:
@@ -66,19 +82,151 @@ def get_vectorstore():
 # 🌐 한글 질의 → 영어 변환
 # ============================================
 def translate_query_to_english(query: str) -> str:
-    """한글 질의를 영어로 번역"""
+    """한글 질의를 영어로 번역 (캐시 + 공용 클라이언트, utils.translator)"""
+    return translator.translate(query)
+
+# ============================================
+# 🔎 검색 (1회) + 출처
+# ============================================
+RETRIEVAL_K = 5       # 프롬프트 컨텍스트에 넣는 청크 수
+NUM_SOURCES = 3       # 결과에 출처로 남기는 청크 수
+
+def embed_queries(vectorstore, queries_en: List[str]) -> List[List[float]]:
+    """질의 임베딩 1배치 (캐시 임베딩이면 miss만 모델 호출)"""
+    embeddings = vectorstore.embeddings
+    if hasattr(embeddings, "embed_queries"):
+        return embeddings.embed_queries(queries_en)
+    return [embeddings.embed_query(q) for q in queries_en]
+
+def _doc_id(doc) -> str:
+    return getattr(doc, "id", None) or doc.metadata.get("id") or doc.page_content
+
+def search_by_vectors(vectorstore, vectors: List[List[float]], k: int = RETRIEVAL_K) -> List[List[Tuple]]:
+    """
+    질의 벡터 여러 개를 Chroma 컬렉션 쿼리 1번으로 검색 → 질의별 [(Document, 관련도 점수)]
+    - int8 인덱스는 자체 배치 검색, 컬렉션 직접 접근이 안 되면 질의별 검색으로 대체
+    """
+    if isinstance(vectorstore, Int8VectorStore):
+        return vectorstore.search_by_vectors(vectors, k=k)
     try:
-        llm_translator = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
-        prompt = f"Translate the following Korean text into English, preserving technical and analytical meaning:\n\n{query}"
-        response = llm_translator.invoke(prompt)
-        return response.content.strip()
-    except Exception as e:
-        logger.error(f"⚠️ 질의 번역 실패 (원문으로 진행): {e}")
-        return query
+        collection = vectorstore._collection
+        relevance_fn = vectorstore._select_relevance_score_fn()
+    except (AttributeError, NotImplementedError):
+        return [vectorstore.similarity_search_by_vector_with_relevance_scores(v, k=k) for v in vectors]
+    
+    results = collection.query(
+        query_embeddings=vectors,
+        n_results=k,
+        include=["documents", "metadatas", "distances"]
+    )
+    scored = []
+    for ids, texts, metadatas, distances in zip(
+        results["ids"], results["documents"], results["metadatas"], results["distances"]
+    ):
+        scored.append([
+            (Document(id=chunk_id, page_content=text, metadata=metadata or {}), relevance_fn(distance))
+            for chunk_id, text, metadata, distance in zip(ids, texts, metadatas, distances)
+        ])
+    return scored
+
+def fuse_with_bm25(vectorstore, query_en: str, dense: List[Tuple], k: int = RETRIEVAL_K) -> Tuple[List[Tuple], str]:
+    """
+    밀집 검색 결과 + BM25 결과를 RRF로 결합 → (상위 k개 [(Document, RRF 점수)], "hybrid_rrf")
+    - BM25에만 있는 청크는 Chroma에서 ID로 가져옴
+    - BM25 인덱스가 없거나 매칭 단어가 없으면 (밀집 결과 그대로, "dense")
+    """
+    sparse = bm25_index.search(query_en, k=settings.RAG["fetch_k"])
+    if not sparse:
+        return dense[:k], "dense"
+    
+    docs_by_id = {_doc_id(doc): doc for doc, _ in dense}
+    fused = reciprocal_rank_fusion(
+        [list(docs_by_id), [chunk_id for chunk_id, _ in sparse]],
+        rrf_k=settings.RAG["rrf_k"]
+    )[:k]
+    
+    missing = [chunk_id for chunk_id, _ in fused if chunk_id not in docs_by_id]
+    if missing:
+        fetched = vectorstore.get(ids=missing, include=["documents", "metadatas"])
+        for chunk_id, text, metadata in zip(fetched["ids"], fetched["documents"], fetched["metadatas"]):
+            docs_by_id[chunk_id] = Document(id=chunk_id, page_content=text, metadata=metadata or {})
+    
+    return [(docs_by_id[chunk_id], score) for chunk_id, score in fused if chunk_id in docs_by_id], "hybrid_rrf"
+
+def hybrid_search(vectorstore, queries_en: List[str], k: int = RETRIEVAL_K) -> Tuple[List[List[Tuple]], List[str]]:
+    """
+    질의 여러 개 검색 (임베딩 1배치 + 컬렉션 쿼리 1번) → (질의별 [(Document, 점수)], 질의별 검색 방식)
+    - RAG["hybrid"]면 질의별 밀집 상위 fetch_k와 BM25 상위 fetch_k를 RRF로 결합 (점수 = RRF, "hybrid_rrf")
+    - 아니면, 또는 BM25 매칭 단어가 없는 질의는 밀집 검색 상위 k (점수 = 관련도, "dense")
+    """
+    hybrid = settings.RAG["hybrid"] and bm25_index.exists()
+    fetch_k = max(settings.RAG["fetch_k"], k) if hybrid else k
+    dense_lists = search_by_vectors(vectorstore, embed_queries(vectorstore, queries_en), k=fetch_k)
+    if not hybrid:
+        return dense_lists, ["dense"] * len(dense_lists)
+    fused = [fuse_with_bm25(vectorstore, q, dense, k) for q, dense in zip(queries_en, dense_lists)]
+    return [scored for scored, _ in fused], [method for _, method in fused]
+
+def retrieve_documents(vectorstore, query_en: str, k: int = RETRIEVAL_K) -> Tuple[List[Tuple], str]:
+    """
+    질의 1개 검색 → ([(Document, 점수)], 검색 방식)
+    - 같은 결과를 프롬프트 컨텍스트와 출처 양쪽에 사용
+    """
+    scored_lists, methods = hybrid_search(vectorstore, [query_en], k)
+    return scored_lists[0], methods[0]
+
+def format_docs(docs) -> str:
+    return "\n\n".join(d.page_content for d in docs)
+
+def build_answer_chain():
+    """컨텍스트 + 질문 → 한국어 답변 (prompt | llm | parser)"""
+    from langchain_openai import ChatOpenAI
+    llm = ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0,
+        openai_api_key=settings.OPENAI_API_KEY,
+        cache=llm_cache,
+        callbacks=[metrics.llm_callback]
+    )
+    
+    # 한국어 답변용 프롬프트
+    prompt = PromptTemplate(
+        template=(
+            "다음 컨텍스트만 사용하여 질문에 한국어로 간결하고 분석적으로 답하세요.\n\n"
+            "질문:\n{question}\n\n"
+            "컨텍스트:\n{context}\n"
+        ),
+        input_variables=["question", "context"]
+    )
+    return prompt | llm | StrOutputParser()
+
+def build_sources(scored_docs: List[Tuple], limit: int = NUM_SOURCES) -> List[Dict]:
+    """검색 결과 상위 limit개 → 출처 목록 (순위 / 점수 포함)"""
+    sources = []
+    for rank, (doc, score) in enumerate(scored_docs[:limit], 1):
+        sources.append({
+            "content": doc.page_content[:300],
+            "page": doc.metadata.get("page", 0) + 1,
+            "source": os.path.basename(doc.metadata.get("source", "unknown")),
+            "rank": rank,
+            "score": round(float(score), 4)
+        })
+    return sources
+
+def loaded_documents(sources: Optional[List[Dict]] = None) -> List[str]:
+    """
+    결과의 loaded_documents (출처 표기)
+    - manifest.json의 문서 키 = 실제 인덱싱된 문서 목록
+    - manifest가 없으면(이전 형식 저장소) 검색 출처의 source 필드
+    """
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            documents = json.load(f).get("documents", {})
+        if documents:
+            return sorted(documents)
+    except (OSError, ValueError):
+        pass
+    return sorted({s["source"] for s in sources or [] if s.get("source")})
 
 # ============================================
 # 🤖 RAG 분석 도구 (최적화 버전)
@@ -88,12 +236,16 @@ def analyze_with_fixed_rag(query: str) -> Dict:
     """
     사전 생성된 벡터 저장소를 사용하여 RAG 분석 수행
     (매우 빠름: 0.1초 로딩 + 2-3초 검색)
+    - 검색은 1회만 수행하고 같은 문서로 답변 컨텍스트와 출처를 함께 구성
     """
     logger.info("📚 Fixed RAG 분석 시작")
     logger.info(f"   Query: {query[:100]}...")
+    timings = {}
     
     # 1️⃣ 벡터 저장소 로드 (캐싱됨)
+    started = time.perf_counter()
     vectorstore = get_vectorstore()
+    timings["load_seconds"] = round(time.perf_counter() - started, 3)
     
     if vectorstore is None:
         return {
@@ -104,63 +256,33 @@ def analyze_with_fixed_rag(query: str) -> Dict:
         }
     
     # 2️⃣ 한글 질의 → 영어 변환
+    started = time.perf_counter()
     if not query.isascii():
         logger.info("🌐 한글 질의를 영어로 변환 중...")
         query_en = translate_query_to_english(query)
         logger.info(f"   번역 완료 → {query_en[:80]}...")
     else:
         query_en = query
-    
-    # 3️⃣ LLM 초기화
-    logger.info("   🤖 LLM 분석 실행 중...")
+    timings["translate_seconds"] = round(time.perf_counter() - started, 3)
     
     try:
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
+        # 3️⃣ 검색 (1회)
+        started = time.perf_counter()
+        scored_docs, method = retrieve_documents(vectorstore, query_en)
+        timings["retrieve_seconds"] = round(time.perf_counter() - started, 3)
+        docs = [doc for doc, _ in scored_docs]
+        logger.info(f"   🔎 검색 완료: {len(docs)}개 청크 ({timings['retrieve_seconds']:.2f}초)")
         
-        # 4️⃣ 한국어 답변용 프롬프트
-        prompt = PromptTemplate(
-            template=(
-                "다음 컨텍스트만 사용하여 질문에 한국어로 간결하고 분석적으로 답하세요.\n\n"
-                "질문:\n{question}\n\n"
-                "컨텍스트:\n{context}\n"
-            ),
-            input_variables=["question", "context"]
-        )
+        # 4️⃣ LCEL 파이프라인 (검색된 문서를 그대로 컨텍스트로 전달)
+        logger.info("   🤖 LLM 분석 실행 중...")
+        rag_chain = build_answer_chain()
         
-        # 5️⃣ Retriever 준비
-        retriever = vectorstore.as_retriever(search_kwargs={"k": 5})
+        started = time.perf_counter()
+        answer_ko = rag_chain.invoke({"context": format_docs(docs), "question": query_en})
+        timings["generate_seconds"] = round(time.perf_counter() - started, 3)
         
-        # 6️⃣ 문서 포맷터
-        def format_docs(docs):
-            return "\n\n".join(d.page_content for d in docs)
-        
-        # 7️⃣ LCEL 기반 RAG 파이프라인
-        rag_chain = (
-            {
-                "context": retriever | format_docs,
-                "question": RunnablePassthrough(),
-            }
-            | prompt
-            | llm
-            | StrOutputParser()
-        )
-        
-        # 8️⃣ 영어 질의 실행
-        answer_ko = rag_chain.invoke(query_en)
-        
-        # 9️⃣ 출처 정리
-        top_docs = retriever.invoke(query_en)[:3]
-        sources = []
-        for doc in top_docs:
-            sources.append({
-                "content": doc.page_content[:300],
-                "page": doc.metadata.get("page", 0) + 1,
-                "source": os.path.basename(doc.metadata.get("source", "unknown"))
-            })
+        # 5️⃣ 출처 정리 (같은 검색 결과 재사용)
+        sources = build_sources(scored_docs)
         
         logger.info("   ✅ RAG 분석 완료")
         logger.info(f"      답변 길이: {len(answer_ko)}자")
@@ -168,9 +290,16 @@ def analyze_with_fixed_rag(query: str) -> Dict:
         return {
             "answer": answer_ko,
             "sources": sources,
-            "loaded_documents": ["OECD PDF", "IMF PDF"],
+            "loaded_documents": loaded_documents(sources),
             "num_pages": "N/A (사전 인덱싱)",
             "num_chunks": "N/A (사전 인덱싱)",
+            "retrieval": {
+                "query_en": query_en,
+                "k": RETRIEVAL_K,
+                "method": method,
+                "scores": [round(float(score), 4) for _, score in scored_docs],
+                "timings": timings
+            },
             "error": False
         }
         
@@ -181,4 +310,142 @@ def analyze_with_fixed_rag(query: str) -> Dict:
             "sources": [],
             "loaded_documents": [],
             "error": True
-        }
\ No newline at end of file
+        }
+
+# ============================================
+# 🧩 멀티 질의 RAG (트렌드별 질의 1개씩)
+# ============================================
+def _retrieve_batch(queries: Dict[str, str], timings: Dict):
+    """
+    멀티 질의 RAG 1단계: 저장소 로드 → 일괄 번역 → 검색 1회
+    
+    Returns:
+        (이름 목록, 영어 질의 목록, 질의별 [(Document, 점수)], 질의별 검색 방식), 저장소가 없으면 None
+    """
+    started = time.perf_counter()
+    vectorstore = get_vectorstore()
+    timings["load_seconds"] = round(time.perf_counter() - started, 3)
+    if vectorstore is None:
+        return None
+    
+    names = list(queries)
+    started = time.perf_counter()
+    queries_en = translator.translate_many(list(queries.values()))  # 캐시 miss만 1번 호출로 일괄 번역
+    timings["translate_seconds"] = round(time.perf_counter() - started, 3)
+    
+    # 질의 임베딩 (1배치) + 검색 (1회)
+    started = time.perf_counter()
+    scored_lists, methods = hybrid_search(vectorstore, queries_en)
+    timings["retrieve_seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(f"   🔎 검색 완료: 질의 {len(names)}개 ({timings['retrieve_seconds']:.2f}초)")
+    return names, queries_en, scored_lists, methods
+
+def _batch_results(names, queries_en, scored_lists, methods, answers) -> Dict:
+    results = {}
+    for name, query_en, scored, method, answer in zip(names, queries_en, scored_lists, methods, answers):
+        results[name] = {
+            "answer": answer or f"RAG 분석 실패: {name}",
+            "sources": build_sources(scored),
+            "retrieval": {
+                "query_en": query_en,
+                "k": RETRIEVAL_K,
+                "method": method,
+                "scores": [round(float(score), 4) for _, score in scored]
+            },
+            "error": answer is None
+        }
+    return results
+
+@tool
+def analyze_with_rag_batch(queries: Dict[str, str]) -> Dict:
+    """
+    질의 여러 개(예: 테마별 1개)를 한 번에 RAG 분석
+    - 질의 임베딩 1배치 → 유사도 검색 1회(컬렉션 쿼리, + BM25 RRF) → 답변 LLM 호출은 동시 실행
+    - 질의마다 자신이 검색한 문서로 답변 + 출처를 구성 (analyze_with_fixed_rag와 같은 결과 형식)
+    
+    Args:
+        queries: {이름: 영어 질의} (한글 질의는 번역 후 사용)
+    
+    Returns:
+        {"results": {이름: 결과}, "timings": {...}, "error": bool}
+    """
+    logger.info(f"📚 멀티 질의 RAG 분석 시작 ({len(queries)}개)")
+    timings = {}
+    if not queries:
+        return {"results": {}, "timings": timings, "error": False}
+    
+    try:
+        retrieved = _retrieve_batch(queries, timings)
+        if retrieved is None:
+            return {"results": {}, "timings": timings, "error": True}
+        names, queries_en, scored_lists, methods = retrieved
+        
+        # 답변 LLM 동시 호출
+        rag_chain = build_answer_chain()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(settings.RAG["max_concurrency"], len(names))) as executor:
+            futures = [
+                executor.submit(
+                    rag_chain.invoke,
+                    {"context": format_docs([doc for doc, _ in scored]), "question": query_en}
+                )
+                for query_en, scored in zip(queries_en, scored_lists)
+            ]
+            answers = []
+            for name, future in zip(names, futures):
+                try:
+                    answers.append(future.result())
+                except Exception as e:
+                    logger.warning(f"   ⚠️ [{name}] 답변 생성 실패: {e}")
+                    answers.append(None)
+        timings["generate_seconds"] = round(time.perf_counter() - started, 3)
+    
+    except Exception as e:
+        logger.error(f"   ❌ 멀티 질의 RAG 실행 실패: {e}")
+        return {"results": {}, "timings": timings, "error": True}
+    
+    logger.info(f"   ✅ 멀티 질의 RAG 완료 (답변 생성 {timings['generate_seconds']:.2f}초)")
+    return {"results": _batch_results(names, queries_en, scored_lists, methods, answers), "timings": timings, "error": False}
+
+async def aanalyze_with_rag_batch(queries: Dict[str, str]) -> Dict:
+    """
+    analyze_with_rag_batch 비동기 버전
+    - 로드/번역/검색(CPU·로컬 I/O)은 스레드 1개에서, 답변 LLM 호출은 ainvoke로 이벤트 루프에서 동시 실행
+    """
+    logger.info(f"📚 멀티 질의 RAG 분석 시작 ({len(queries)}개, async)")
+    timings = {}
+    if not queries:
+        return {"results": {}, "timings": timings, "error": False}
+    
+    try:
+        retrieved = await asyncio.to_thread(_retrieve_batch, queries, timings)
+        if retrieved is None:
+            return {"results": {}, "timings": timings, "error": True}
+        names, queries_en, scored_lists, methods = retrieved
+        
+        rag_chain = build_answer_chain()
+        semaphore = asyncio.Semaphore(settings.RAG["max_concurrency"])
+        
+        async def answer(name, query_en, scored):
+            async with semaphore:
+                try:
+                    return await rag_chain.ainvoke(
+                        {"context": format_docs([doc for doc, _ in scored]), "question": query_en}
+                    )
+                except Exception as e:
+                    logger.warning(f"   ⚠️ [{name}] 답변 생성 실패: {e}")
+                    return None
+        
+        started = time.perf_counter()
+        answers = await asyncio.gather(*[
+            answer(name, query_en, scored)
+            for name, query_en, scored in zip(names, queries_en, scored_lists)
+        ])
+        timings["generate_seconds"] = round(time.perf_counter() - started, 3)
+    
+    except Exception as e:
+        logger.error(f"   ❌ 멀티 질의 RAG 실행 실패: {e}")
+        return {"results": {}, "timings": timings, "error": True}
+    
+    logger.info(f"   ✅ 멀티 질의 RAG 완료 (답변 생성 {timings['generate_seconds']:.2f}초)")
+    return {"results": _batch_results(names, queries_en, scored_lists, methods, answers), "timings": timings, "error": False}
@@ -1,13 +1,13 @@
 # tools/trends_tool.py
 from langchain_core.tools import tool
 from typing import List, Dict
-from pytrends.request import TrendReq
 import sys
 import os
 import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.logger import logger
+from utils.response_cache import response_cache
 
 @tool
 def search_google_trends(keywords: List[str], timeframe: str = '2023-01-01 2025-10-21') -> Dict:
@@ -23,7 +23,7 @@ def search_google_trends(keywords: List[str], timeframe: str = '2023-01-01 2025-
     """
     logger.info(f"📊 Google Trends 검색 시작 (키워드: {len(keywords)}개)")
     
-    pytrends = TrendReq(hl='en-US', tz=360, timeout=(10, 25))  # ✅ 타임아웃 증가
+    pytrends = None  # ✅ 캐시 miss가 있을 때만 생성 (생성 시 쿠키 요청 발생)
     trends_data = {}
     
     # Google Trends는 한 번에 최대 5개만 가능
@@ -31,9 +31,20 @@ def search_google_trends(keywords: List[str], timeframe: str = '2023-01-01 2025-
     
     for i in range(0, len(keywords), batch_size):
         batch = keywords[i:i+batch_size]
-        
+        cache_params = {"batch": batch, "timeframe": timeframe}
+
+        # ✅ 캐시 hit이면 요청/대기 없이 사용
+        cached = response_cache.get("trends", cache_params)
+        if cached is not None:
+            logger.info(f"   배치 {i//batch_size + 1} 캐시 사용: {batch}")
+            trends_data.update(cached)
+            continue
+
         try:
             logger.info(f"   배치 {i//batch_size + 1} 처리 중: {batch}")
+            if pytrends is None:
+                from pytrends.request import TrendReq  # 캐시 miss가 있을 때만 로드
+                pytrends = TrendReq(hl='en-US', tz=360, timeout=(10, 25))  # ✅ 타임아웃 증가
             
             # ✅ 재시도 로직 추가
             max_retries = 3
@@ -51,17 +62,25 @@ def search_google_trends(keywords: List[str], timeframe: str = '2023-01-01 2025-
                     else:
                         raise  # 마지막 시도 실패 시 예외 발생
             
+            batch_data = {}
             if not data.empty:
                 for keyword in batch:
                     if keyword in data.columns:
                         # 월별 평균으로 변환
                         monthly_data = data[keyword].resample('M').mean().to_dict()
-                        trends_data[keyword] = {
+                        batch_data[keyword] = {
                             str(k.date()): int(v) for k, v in monthly_data.items()
                         }
                         
                         avg_score = data[keyword].mean()
                         logger.info(f"      ✓ '{keyword}': 평균 {avg_score:.1f}")
+
+            trends_data.update(batch_data)
+            # 빈 결과(pytrends 소프트 스로틀)는 캐시하지 않음 → 다음 실행에서 다시 조회
+            if batch_data:
+                response_cache.put("trends", cache_params, batch_data)
+            else:
+                logger.warning("      ⚠️ 빈 응답 (스로틀 가능성) → 캐시 저장 생략")
             
             # ✅ 배치 간 대기 시간 증가
             time.sleep(5)
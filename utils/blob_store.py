@@ -0,0 +1,108 @@
+# utils/blob_store.py
+"""
+큰 GraphState 필드용 content-addressed blob 저장소
+- papers / github_repos / google_trends / all_theme_scores 를 gzip JSON 파일로 1번만 저장
+- 상태(체크포인트)에는 작은 참조 dict만 남김: {"blob_ref": sha256, "count": n, "bytes": m}
+- 노드가 읽을 때 resolve()로 지연 로드 (프로세스 내 캐시)
+- 같은 내용은 같은 해시 → 재실행/재개 시 중복 저장 없음
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import sys
+from typing import Any, Dict, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from utils.logger import logger
+
+REF_KEY = "blob_ref"
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and REF_KEY in value and len(value) <= 3
+
+
+class BlobStore:
+    """sha256(JSON) 기반 gzip 파일 저장소"""
+
+    def __init__(self, root: str, min_bytes: int = 0, enabled: bool = True):
+        self.root = root
+        self.min_bytes = min_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, Any] = {}
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}.json.gz")
+
+    def put(self, value: Any) -> Any:
+        """
+        값을 저장하고 참조 반환
+        - 비활성화 상태이거나 직렬화 크기가 min_bytes 미만이면 값을 그대로 반환
+        """
+        if not self.enabled or value is None or is_blob_ref(value):
+            return value
+
+        raw = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        if len(raw) < self.min_bytes:
+            return value
+
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self._loaded[digest] = value
+        return {REF_KEY: digest, "count": len(value), "bytes": len(raw)}
+
+    def get(self, ref: Dict) -> Any:
+        digest = ref[REF_KEY]
+        with self._lock:
+            if digest in self._loaded:
+                return self._loaded[digest]
+
+        with gzip.open(self._path(digest), "rb") as f:
+            value = json.loads(f.read().decode("utf-8"))
+
+        with self._lock:
+            self._loaded[digest] = value
+        return value
+
+    def resolve(self, value: Any, default: Optional[Any] = None) -> Any:
+        """참조면 로드, 일반 값이면 그대로 (None이면 default)"""
+        if value is None:
+            return default
+        if is_blob_ref(value):
+            return self.get(value)
+        return value
+
+    def count(self, value: Any) -> int:
+        """로드 없이 항목 수 확인"""
+        if is_blob_ref(value):
+            return value["count"]
+        return len(value or [])
+
+
+# 전역 저장소
+blob_store = BlobStore(
+    root=settings.BLOB_STORE["dir"],
+    min_bytes=settings.BLOB_STORE["min_bytes"],
+    enabled=settings.BLOB_STORE["enabled"]
+)
+
+
+def load_field(state: Dict, key: str, default: Optional[Any] = None) -> Any:
+    """상태 필드 읽기 (blob 참조면 지연 로드)"""
+    try:
+        return blob_store.resolve(state.get(key), default)
+    except (OSError, ValueError) as e:
+        logger.error(f"❌ blob 로드 실패 ({key}): {e}")
+        return default
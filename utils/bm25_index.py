@@ -0,0 +1,180 @@
+# utils/bm25_index.py
+"""
+BM25 희소 검색 인덱스 (RAG 벡터 저장소 보조)
+- 밀집 임베딩(MiniLM)이 놓치는 정확한 수치 / 약어(CAGR, GPAI, 2030 등) 검색용
+- 디스크 형식: 단어별 posting을 CSR 배열(.npy)로 저장 → np.load(mmap_mode="r")로 필요할 때 로드
+  · vocab.json: 단어 목록 (인덱스 = 단어 ID)
+  · indptr.npy (int64) / doc_ids.npy (uint32) / tfs.npy (uint16): 단어 ID별 (청크, 빈도)
+  · doc_len.npy (uint32): 청크별 토큰 수, chunk_ids.json: 청크 순번 → Chroma 청크 ID
+- 점수: Okapi BM25 (k1=1.2, b=0.75), IDF는 음수가 되지 않는 ln(1 + (N - df + 0.5) / (df + 0.5))
+"""
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from utils.logger import logger
+
+FORMAT_VERSION = 1
+K1 = 1.2
+B = 0.75
+
+# 소문자 영숫자 토큰 (소수점 수치 37.5 유지, 2025-2030 같은 범위는 분리) + 한글 토큰
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)*|[가-힣]+")
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the their this to was were will with
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def build_bm25_index(chunks: Iterable[Tuple[str, str]], index_dir: str) -> Dict:
+    """
+    (청크 ID, 텍스트) 스트림 → index_dir에 BM25 인덱스 저장 (임시 디렉토리에 쓴 뒤 교체)
+
+    Returns:
+        {"num_chunks", "num_terms", "bytes"}
+    """
+    term_ids: Dict[str, int] = {}
+    postings = defaultdict(list)  # 단어 ID → [(청크 순번, 빈도)]
+    chunk_ids: List[str] = []
+    doc_len: List[int] = []
+
+    for chunk_id, text in chunks:
+        doc = len(chunk_ids)
+        counts = Counter(tokenize(text))
+        chunk_ids.append(chunk_id)
+        doc_len.append(sum(counts.values()))
+        for term, tf in counts.items():
+            term_id = term_ids.setdefault(term, len(term_ids))
+            postings[term_id].append((doc, min(tf, 65535)))
+
+    indptr = np.zeros(len(term_ids) + 1, dtype=np.int64)
+    for term_id in range(len(term_ids)):
+        indptr[term_id + 1] = indptr[term_id] + len(postings[term_id])
+    doc_ids = np.empty(indptr[-1], dtype=np.uint32)
+    tfs = np.empty(indptr[-1], dtype=np.uint16)
+    for term_id in range(len(term_ids)):
+        entries = postings.pop(term_id)
+        start = indptr[term_id]
+        doc_ids[start:start + len(entries)] = [d for d, _ in entries]
+        tfs[start:start + len(entries)] = [tf for _, tf in entries]
+
+    tmp_dir = f"{index_dir}.tmp"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+    np.save(os.path.join(tmp_dir, "indptr.npy"), indptr)
+    np.save(os.path.join(tmp_dir, "doc_ids.npy"), doc_ids)
+    np.save(os.path.join(tmp_dir, "tfs.npy"), tfs)
+    np.save(os.path.join(tmp_dir, "doc_len.npy"), np.asarray(doc_len, dtype=np.uint32))
+    with open(os.path.join(tmp_dir, "vocab.json"), "w", encoding="utf-8") as f:
+        json.dump(sorted(term_ids, key=term_ids.get), f, ensure_ascii=False)
+    with open(os.path.join(tmp_dir, "chunk_ids.json"), "w", encoding="utf-8") as f:
+        json.dump(chunk_ids, f)
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "version": FORMAT_VERSION,
+            "num_chunks": len(chunk_ids),
+            "avg_doc_len": float(np.mean(doc_len)) if doc_len else 0.0,
+            "k1": K1,
+            "b": B
+        }, f)
+
+    if os.path.exists(index_dir):
+        shutil.rmtree(index_dir)
+    os.replace(tmp_dir, index_dir)
+
+    size = sum(os.path.getsize(os.path.join(index_dir, name)) for name in os.listdir(index_dir))
+    return {"num_chunks": len(chunk_ids), "num_terms": len(term_ids), "bytes": size}
+
+
+class BM25Index:
+    """디스크 BM25 인덱스 (첫 검색 때 메모리 맵으로 로드)"""
+
+    def __init__(self, index_dir: str):
+        self.index_dir = index_dir
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._available = False
+
+    def exists(self) -> bool:
+        return os.path.exists(os.path.join(self.index_dir, "meta.json"))
+
+    def _load(self) -> bool:
+        with self._lock:
+            if self._loaded:
+                return self._available
+            self._loaded = True
+            if not self.exists():
+                return False
+            try:
+                with open(os.path.join(self.index_dir, "meta.json"), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                if meta.get("version") != FORMAT_VERSION:
+                    raise ValueError(f"인덱스 형식 버전 불일치 ({meta.get('version')})")
+                with open(os.path.join(self.index_dir, "vocab.json"), "r", encoding="utf-8") as f:
+                    self._term_ids = {term: i for i, term in enumerate(json.load(f))}
+                with open(os.path.join(self.index_dir, "chunk_ids.json"), "r", encoding="utf-8") as f:
+                    self._chunk_ids = json.load(f)
+                load = lambda name: np.load(os.path.join(self.index_dir, name), mmap_mode="r")
+                self._indptr, self._doc_ids, self._tfs = load("indptr.npy"), load("doc_ids.npy"), load("tfs.npy")
+                self._doc_len = np.asarray(load("doc_len.npy"), dtype=np.float64)
+                self._avg_doc_len = meta["avg_doc_len"] or 1.0
+                self._k1, self._b = meta["k1"], meta["b"]
+                self._available = True
+            except Exception as e:
+                logger.warning(f"⚠️ BM25 인덱스 로드 실패 (밀집 검색만 사용): {e}")
+            return self._available
+
+    def reset(self) -> None:
+        """인덱스 재생성 후 다시 로드하도록 표시"""
+        with self._lock:
+            self._loaded = False
+            self._available = False
+
+    def search(self, query: str, k: int = 20) -> List[Tuple[str, float]]:
+        """BM25 상위 k개 [(청크 ID, 점수)], 인덱스가 없으면 []"""
+        if not self._load():
+            return []
+
+        n = len(self._chunk_ids)
+        scores = np.zeros(n, dtype=np.float64)
+        norm = self._k1 * (1 - self._b + self._b * self._doc_len / self._avg_doc_len)
+        for term in set(tokenize(query)):
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                continue
+            start, end = self._indptr[term_id], self._indptr[term_id + 1]
+            docs = np.asarray(self._doc_ids[start:end], dtype=np.int64)
+            tf = np.asarray(self._tfs[start:end], dtype=np.float64)
+            df = end - start
+            idf = np.log(1 + (n - df + 0.5) / (df + 0.5))
+            scores[docs] += idf * tf * (self._k1 + 1) / (tf + norm[docs])
+
+        matched = np.flatnonzero(scores)
+        if not len(matched):
+            return []
+        top = matched[np.argsort(-scores[matched], kind="stable")[:k]]
+        return [(self._chunk_ids[i], float(scores[i])) for i in top]
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], rrf_k: int = 60) -> List[Tuple[str, float]]:
+    """
+    RRF: 점수 = Σ 1 / (rrf_k + 순위), 순위가 여러 목록에 있을수록 위로
+    - 동점은 먼저 나온 목록(밀집 검색)의 순서 우선
+    """
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, 1):
+            fused[item] = fused.get(item, 0.0) + 1.0 / (rrf_k + rank)
+    return sorted(fused.items(), key=lambda kv: kv[1], reverse=True)
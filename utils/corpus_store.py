@@ -0,0 +1,131 @@
+# utils/corpus_store.py
+"""
+증분 수집용 코퍼스 + 워터마크 저장소 (data/processed/corpus.json)
+- 소스·키워드별 워터마크
+  · arxiv  : 수집된 논문 중 가장 최근 publish_date
+  · github : 수집된 저장소 이름 집합 + 마지막 수집일
+  · trends : 수집된 가장 최근 월
+- 키워드별 누적 코퍼스를 보관하고, 새 실행은 델타만 받아 병합
+- 수집 조건(기간 시작일, 수집 한도)이 바뀌면 자동으로 전체 재수집
+"""
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logger import logger
+
+SOURCES = ("arxiv", "github", "trends")
+
+
+class CorpusStore:
+    """키워드별 누적 코퍼스 + 워터마크 (JSON 파일 1개)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data = self._load()
+
+    def _empty(self, params: Optional[Dict] = None) -> Dict:
+        return {
+            "params": params or {},
+            "watermarks": {source: {} for source in SOURCES},
+            **{source: {} for source in SOURCES},
+        }
+
+    def _load(self) -> Dict:
+        if not os.path.exists(self.path):
+            return self._empty()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ 코퍼스 로드 실패 → 전체 재수집: {e}")
+            return self._empty()
+
+    def prepare(self, params: Dict, full_refresh: bool = False) -> bool:
+        """
+        수집 조건 확인 후 코퍼스 사용 여부 결정
+
+        Returns:
+            True: 증분 수집 가능 / False: 비우고 전체 재수집
+        """
+        if full_refresh:
+            logger.info("   🔄 전체 재수집 (--full-refresh)")
+            self.data = self._empty(params)
+            return False
+        if self.data.get("params") != params:
+            if self.data.get("params"):
+                logger.info("   🔄 수집 조건 변경 감지 → 전체 재수집")
+            self.data = self._empty(params)
+            return False
+        return True
+
+    # ------------------------------------------
+    # 워터마크
+    # ------------------------------------------
+    def watermark(self, source: str, keyword: str):
+        return self.data["watermarks"][source].get(keyword)
+
+    # ------------------------------------------
+    # 병합
+    # ------------------------------------------
+    def merge_arxiv(self, keyword: str, papers: List[Dict], max_results: int) -> int:
+        """논문 병합 (ID 기준) → 최신순 상위 max_results개 유지, 새 논문 수 반환"""
+        existing = {p["id"]: p for p in self.data["arxiv"].get(keyword, [])}
+        new_count = sum(1 for p in papers if p["id"] not in existing)
+        existing.update({p["id"]: p for p in papers})
+
+        merged = sorted(existing.values(), key=lambda p: p["publish_date"], reverse=True)[:max_results]
+        self.data["arxiv"][keyword] = merged
+        if merged:
+            self.data["watermarks"]["arxiv"][keyword] = merged[0]["publish_date"]
+        return new_count
+
+    def merge_github(self, keyword: str, repos: List[Dict], limit: int, collected_at: str) -> int:
+        """저장소 병합 (이름 기준, 새 데이터 우선) → stars 상위 limit개 유지, 새 저장소 수 반환"""
+        existing = {r["name"]: r for r in self.data["github"].get(keyword, [])}
+        known = set((self.watermark("github", keyword) or {}).get("repos", []))
+        new_count = sum(1 for r in repos if r["name"] not in known)
+        existing.update({r["name"]: r for r in repos})
+
+        merged = sorted(existing.values(), key=lambda r: int(r.get("stars", 0)), reverse=True)[:limit]
+        self.data["github"][keyword] = merged
+        self.data["watermarks"]["github"][keyword] = {
+            "repos": sorted(known | {r["name"] for r in repos}),
+            "collected_at": collected_at,
+        }
+        return new_count
+
+    def set_trends(self, keyword: str, monthly: Dict[str, int]) -> None:
+        """Trends는 기간 전체 상대값이므로 키워드 단위로 교체"""
+        if not monthly:
+            return
+        self.data["trends"][keyword] = monthly
+        self.data["watermarks"]["trends"][keyword] = max(monthly.keys())
+
+    # ------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------
+    def papers_by_keyword(self, start: str, end: str) -> Dict[str, List[Dict]]:
+        """기간 내 논문 (병합 시 원본이 바뀌지 않도록 복사본 반환)"""
+        return {
+            keyword: [
+                {**p, "keywords": list(p["keywords"])}
+                for p in papers if start <= p["publish_date"] <= end
+            ]
+            for keyword, papers in self.data["arxiv"].items()
+        }
+
+    def repos_by_keyword(self) -> Dict[str, List[Dict]]:
+        return {keyword: list(repos) for keyword, repos in self.data["github"].items()}
+
+    def trends(self, keywords: List[str]) -> Dict[str, Dict[str, int]]:
+        return {k: self.data["trends"][k] for k in keywords if k in self.data["trends"]}
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
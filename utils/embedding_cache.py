@@ -0,0 +1,283 @@
+# utils/embedding_cache.py
+"""
+임베딩 캐시 (텍스트 해시 → float32 벡터, 메모리 맵 파일)
+- vectors.f32: (capacity, dim) float32 np.memmap, 필요할 때 2배씩 늘림 (max_entries까지)
+- index.npz: 슬롯별 키(sha256 앞 16바이트, uint8) / 마지막 사용 순번 / 차원
+- 키 = sha256(모델, 종류(doc|query), 텍스트) → 모델이나 질의/문서 인코딩이 바뀌면 자연히 miss
+- 가득 차면 오래 안 쓴 슬롯부터 재사용 (LRU)
+- build_vectorstore(문서 청크)와 rag_tool(질의) 공용 → CachedEmbeddings(langchain Embeddings)
+- 임베딩 모델은 첫 miss 때 로드 (전부 hit이면 transformer를 띄우지 않음)
+- 한 번에 한 프로세스가 쓰는 것을 가정 (index.npz는 os.replace로 원자적 저장)
+"""
+import atexit
+import hashlib
+import os
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from config.settings import settings
+from utils.logger import logger
+
+KEY_BYTES = 16
+MIN_CAPACITY = 1024
+
+
+def embedding_key(model_name: str, kind: str, text: str) -> bytes:
+    raw = f"{model_name}\x00{kind}\x00{text}"
+    return hashlib.sha256(raw.encode("utf-8")).digest()[:KEY_BYTES]
+
+
+class EmbeddingCache:
+    """메모리 맵 임베딩 캐시 (스레드 안전, 단일 프로세스 쓰기)"""
+
+    def __init__(self, cache_dir: str, max_entries: int, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.vectors_path = os.path.join(cache_dir, "vectors.f32")
+        self.index_path = os.path.join(cache_dir, "index.npz")
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {"hit": 0, "miss": 0, "write": 0, "evict": 0}
+        self._loaded = False
+        self._dirty = False
+        self._dim = 0
+        self._size = 0
+        self._tick = 0
+        self._vectors: Optional[np.memmap] = None
+        self._keys = np.empty((0, KEY_BYTES), dtype=np.uint8)
+        self._access = np.empty(0, dtype=np.int64)
+        self._slot_of: Dict[bytes, int] = {}
+
+    # ------------------------------------------
+    # 로드 / 파일 크기
+    # ------------------------------------------
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not (os.path.exists(self.index_path) and os.path.exists(self.vectors_path)):
+            return
+        try:
+            with np.load(self.index_path) as index:
+                dim, size = int(index["dim"]), int(index["size"])
+                keys, access = index["keys"], index["access"]
+            capacity = os.path.getsize(self.vectors_path) // (4 * dim)
+            if size > capacity or len(keys) < size:
+                raise ValueError(f"index({size}) / vectors({capacity}) 크기 불일치")
+        except Exception as e:
+            logger.warning(f"⚠️ 임베딩 캐시 로드 실패 → 비우고 다시 시작: {e}")
+            self._reset_files()
+            return
+
+        self._dim, self._size = dim, size
+        self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(capacity, dim))
+        self._keys = np.zeros((capacity, KEY_BYTES), dtype=np.uint8)
+        self._access = np.zeros(capacity, dtype=np.int64)
+        self._keys[:size], self._access[:size] = keys[:size], access[:size]
+        self._tick = int(self._access[:size].max()) if size else 0
+        self._slot_of = {key.tobytes(): slot for slot, key in enumerate(self._keys[:size])}
+
+    def _reset_files(self) -> None:
+        for path in (self.vectors_path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._vectors = None
+        self._dim = self._size = self._tick = 0
+        self._keys = np.empty((0, KEY_BYTES), dtype=np.uint8)
+        self._access = np.empty(0, dtype=np.int64)
+        self._slot_of = {}
+
+    def _capacity(self) -> int:
+        return 0 if self._vectors is None else self._vectors.shape[0]
+
+    def _grow(self, needed: int) -> None:
+        """vectors.f32를 needed 슬롯 이상으로 확장 (2배씩, max_entries 이하)"""
+        capacity = self._capacity()
+        if needed <= capacity:
+            return
+        new_capacity = min(max(needed, capacity * 2, MIN_CAPACITY), self.max_entries)
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(new_capacity * self._dim * 4)
+        self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(new_capacity, self._dim))
+        self._keys = np.concatenate([self._keys[:capacity], np.zeros((new_capacity - capacity, KEY_BYTES), dtype=np.uint8)])
+        self._access = np.concatenate([self._access[:capacity], np.zeros(new_capacity - capacity, dtype=np.int64)])
+
+    # ------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------
+    def lookup(self, keys: Sequence[bytes]) -> List[Optional[np.ndarray]]:
+        """키별 벡터 (없으면 None), hit 슬롯은 최근 사용으로 갱신"""
+        if not self.enabled:
+            return [None] * len(keys)
+        with self._lock:
+            self._load()
+            results: List[Optional[np.ndarray]] = []
+            for key in keys:
+                slot = self._slot_of.get(key)
+                if slot is None:
+                    results.append(None)
+                    continue
+                self._tick += 1
+                self._access[slot] = self._tick
+                results.append(np.array(self._vectors[slot]))
+            hits = sum(r is not None for r in results)
+            self._stats["hit"] += hits
+            self._stats["miss"] += len(keys) - hits
+            if hits:
+                self._dirty = True
+            return results
+
+    def store(self, keys: Sequence[bytes], vectors) -> None:
+        """새 벡터 저장, 자리가 없으면 오래 안 쓴 슬롯을 덮어씀"""
+        if not self.enabled or not len(keys):
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._load()
+            if self._dim and vectors.shape[1] != self._dim:
+                logger.warning(f"⚠️ 임베딩 차원 변경({self._dim} → {vectors.shape[1]}) → 캐시 초기화")
+                self._reset_files()
+            self._dim = self._dim or vectors.shape[1]
+
+            pending = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self._slot_of:
+                    pending[key] = vector
+            items = list(pending.items())[-self.max_entries:]
+            if not items:
+                return
+
+            free = self.max_entries - self._size
+            self._grow(min(self._size + len(items), self.max_entries))
+            slots = list(range(self._size, self._size + max(min(len(items), free), 0)))
+
+            shortfall = len(items) - len(slots)
+            if shortfall:
+                oldest = np.argpartition(self._access[:self._size], shortfall - 1)[:shortfall]
+                for slot in oldest:
+                    del self._slot_of[self._keys[slot].tobytes()]
+                slots.extend(int(slot) for slot in oldest)
+                self._stats["evict"] += shortfall
+            self._size += len(items) - shortfall
+
+            for slot, (key, vector) in zip(slots, items):
+                self._tick += 1
+                self._vectors[slot] = vector
+                self._keys[slot] = np.frombuffer(key, dtype=np.uint8)
+                self._access[slot] = self._tick
+                self._slot_of[key] = slot
+            self._stats["write"] += len(items)
+            self._dirty = True
+
+    def flush(self) -> None:
+        """벡터 flush + index.npz 저장 (변경 있을 때만)"""
+        with self._lock:
+            if not self._dirty or self._vectors is None:
+                return
+            self._vectors.flush()
+            tmp_path = f"{self.index_path}.tmp.npz"
+            np.savez(
+                tmp_path,
+                dim=self._dim,
+                size=self._size,
+                keys=self._keys[:self._size],
+                access=self._access[:self._size]
+            )
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset_files()
+            self._loaded = True
+            self._dirty = False
+
+    # ------------------------------------------
+    # 통계
+    # ------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "entries": self._size}
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        total = stats["hit"] + stats["miss"]
+        if not total:
+            return
+        logger.info(f"\n🧮 임베딩 캐시 통계:")
+        logger.info(
+            f"   - hit {stats['hit']} / miss {stats['miss']} "
+            f"({stats['hit'] / total * 100:.0f}%), 저장 {stats['write']}, "
+            f"LRU 삭제 {stats['evict']}, 보관 {stats['entries']:,}개"
+        )
+
+
+class CachedEmbeddings(Embeddings):
+    """임베딩 캐시를 먼저 조회하고 miss만 실제 모델로 계산"""
+
+    def __init__(self, model_name: str, factory: Callable[[], Embeddings], cache: EmbeddingCache):
+        self.model_name = model_name
+        self.cache = cache
+        self._factory = factory
+        self._model: Optional[Embeddings] = None
+        self._model_lock = threading.Lock()
+
+    def _underlying(self) -> Embeddings:
+        with self._model_lock:
+            if self._model is None:
+                self._model = self._factory()
+            return self._model
+
+    def _embed(self, texts: List[str], kind: str, compute: Callable[[List[str]], List[List[float]]]) -> List[List[float]]:
+        keys = [embedding_key(self.model_name, kind, text) for text in texts]
+        cached = self.cache.lookup(keys)
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if missing:
+            computed = np.asarray(compute([texts[i] for i in missing]), dtype=np.float32)
+            self.cache.store([keys[i] for i in missing], computed)
+            for i, vector in zip(missing, computed):
+                cached[i] = vector
+        return [vector.tolist() for vector in cached]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts, "doc", lambda batch: self._underlying().embed_documents(batch))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text], "query", lambda batch: [self._underlying().embed_query(batch[0])])[0]
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """질의 여러 개를 한 배치로 임베딩 (miss만 모델 1회 호출)"""
+        def compute(batch: List[str]) -> List[List[float]]:
+            model = self._underlying()
+            if getattr(model, "query_encode_kwargs", None):
+                return [model.embed_query(text) for text in batch]  # 질의 전용 인코딩 설정이 있으면 그대로 사용
+            return model.embed_documents(batch)
+        return self._embed(texts, "query", compute)
+
+
+def cached_embeddings(model_name: str) -> CachedEmbeddings:
+    """HuggingFaceEmbeddings(model_name) + 전역 임베딩 캐시"""
+
+    def factory() -> Embeddings:
+        from langchain_huggingface import HuggingFaceEmbeddings
+        return HuggingFaceEmbeddings(model_name=model_name)
+
+    return CachedEmbeddings(model_name, factory, embedding_cache)
+
+
+# 전역 캐시 (종료 시 인덱스 저장)
+embedding_cache = EmbeddingCache(
+    cache_dir=settings.EMBEDDING_CACHE["dir"],
+    max_entries=settings.EMBEDDING_CACHE["max_entries"],
+    enabled=settings.EMBEDDING_CACHE["enabled"]
+)
+atexit.register(embedding_cache.flush)
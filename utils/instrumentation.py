@@ -0,0 +1,355 @@
+# utils/instrumentation.py
+"""
+파이프라인 계측 (노드별 시간 / CPU / 메모리, 도구별 HTTP, LLM 토큰)
+- instrument_node() / instrument_async_node(): NODE_REGISTRY 노드 래퍼 → wall/CPU 시간, peak RSS 증가분,
+  실행 구간의 HTTP 호출 수·바이트, LLM 토큰 수를 state["node_metrics"]에 기록
+- HTTP: requests HTTPAdapter.send + httpx 전송 계층(openai SDK) 래핑 → 호스트 기준 도구별 집계 (arxiv/github/tavily/trends/openai)
+- LLM: ChatOpenAI(callbacks=[metrics.llm_callback]) → token_usage 집계 (캐시 hit은 0)
+- export(): JSON + Prometheus textfile (outputs/metrics)
+
+※ 병렬 노드(tech + market)는 실행 구간이 겹치므로 HTTP/토큰/CPU 수치가 서로 섞일 수 있음
+"""
+import functools
+import json
+import os
+import threading
+import time
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from config.settings import settings
+from utils.logger import logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 호스트 → 도구 이름
+HTTP_TOOLS = {
+    "export.arxiv.org": "arxiv",
+    "api.github.com": "github",
+    "api.tavily.com": "tavily",
+    "trends.google.com": "trends",
+    "api.openai.com": "openai",
+}
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024  # macOS: bytes, Linux: KB
+
+
+class _TokenCallback(BaseCallbackHandler):
+    """LLM 호출 종료 시 token_usage 집계"""
+
+    def __init__(self, recorder: "MetricsRecorder"):
+        self.recorder = recorder
+
+    def on_llm_end(self, response, **kwargs: Any) -> None:
+        llm_output = response.llm_output or {}
+        usage = llm_output.get("token_usage") or {}
+        self.recorder.record_llm(
+            llm_output.get("model_name", "unknown"),
+            usage.get("prompt_tokens", 0),
+            usage.get("completion_tokens", 0)
+        )
+
+
+class MetricsRecorder:
+    """프로세스 전역 카운터 + 노드별 기록"""
+
+    def __init__(self, export_dir: str):
+        self.export_dir = export_dir
+        self._lock = threading.Lock()
+        self._http = defaultdict(lambda: {"calls": 0, "errors": 0, "bytes_sent": 0, "bytes_received": 0})
+        self._llm = defaultdict(lambda: {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0})
+        self.nodes: Dict[str, Dict] = {}
+        self.llm_callback = _TokenCallback(self)
+        self._http_installed = False
+
+    # ------------------------------------------
+    # 카운터
+    # ------------------------------------------
+    def record_http(self, tool: str, bytes_sent: int, bytes_received: int, error: bool = False) -> None:
+        with self._lock:
+            counts = self._http[tool]
+            counts["calls"] += 1
+            counts["errors"] += int(error)
+            counts["bytes_sent"] += bytes_sent
+            counts["bytes_received"] += bytes_received
+
+    def record_llm(self, model: str, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            counts = self._llm[model]
+            counts["calls"] += 1
+            counts["prompt_tokens"] += prompt_tokens
+            counts["completion_tokens"] += completion_tokens
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {
+                "http": {tool: dict(c) for tool, c in self._http.items()},
+                "llm": {model: dict(c) for model, c in self._llm.items()},
+            }
+
+    # ------------------------------------------
+    # HTTP 계측 (requests / httpx 전역)
+    # ------------------------------------------
+    def install_http_hook(self) -> None:
+        """requests 어댑터 send + httpx 전송 계층 래핑 (1회만)"""
+        if self._http_installed:
+            return
+        self._install_requests_hook()
+        self._install_httpx_hook()
+        self._http_installed = True
+
+    def _install_requests_hook(self) -> None:
+        from requests.adapters import HTTPAdapter
+
+        original_send = HTTPAdapter.send
+        recorder = self
+
+        @functools.wraps(original_send)
+        def send(adapter, request, *args, **kwargs):
+            host = urlparse(request.url).hostname or "unknown"
+            tool = HTTP_TOOLS.get(host, host)
+            body = request.body or b""
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            sent = len(body) if isinstance(body, bytes) else 0  # 스트리밍 업로드는 제외
+            try:
+                response = original_send(adapter, request, *args, **kwargs)
+            except Exception:
+                recorder.record_http(tool, sent, 0, error=True)
+                raise
+            received = response.headers.get("Content-Length")
+            if received is None and not kwargs.get("stream"):
+                received = len(response.content)  # chunked 응답 (Session.send가 어차피 본문을 읽음)
+            received = int(received or 0)
+            recorder.record_http(tool, sent, received, error=response.status_code >= 400)
+            return response
+
+        HTTPAdapter.send = send
+
+    def _install_httpx_hook(self) -> None:
+        """
+        openai SDK(ChatOpenAI)는 requests가 아니라 httpx 사용 → 전송 계층 handle_request 래핑
+        - 응답 본문은 스트리밍으로 읽히므로 받은 바이트는 Content-Length가 있을 때만 집계
+        """
+        try:
+            import httpx
+        except ImportError:  # httpx 없으면 requests 트래픽만 집계
+            return
+        recorder = self
+
+        def request_info(request):
+            tool = HTTP_TOOLS.get(request.url.host, request.url.host or "unknown")
+            return tool, int(request.headers.get("Content-Length") or 0)
+
+        def record(tool, sent, response):
+            received = int(response.headers.get("Content-Length") or 0)
+            recorder.record_http(tool, sent, received, error=response.status_code >= 400)
+
+        original_sync = httpx.HTTPTransport.handle_request
+        original_async = httpx.AsyncHTTPTransport.handle_async_request
+
+        @functools.wraps(original_sync)
+        def handle_request(transport, request):
+            tool, sent = request_info(request)
+            try:
+                response = original_sync(transport, request)
+            except Exception:
+                recorder.record_http(tool, sent, 0, error=True)
+                raise
+            record(tool, sent, response)
+            return response
+
+        @functools.wraps(original_async)
+        async def handle_async_request(transport, request):
+            tool, sent = request_info(request)
+            try:
+                response = await original_async(transport, request)
+            except Exception:
+                recorder.record_http(tool, sent, 0, error=True)
+                raise
+            record(tool, sent, response)
+            return response
+
+        httpx.HTTPTransport.handle_request = handle_request
+        httpx.AsyncHTTPTransport.handle_async_request = handle_async_request
+
+    # ------------------------------------------
+    # 노드 래퍼
+    # ------------------------------------------
+    def _begin(self) -> tuple:
+        return self.snapshot(), _peak_rss_mb(), time.process_time(), time.perf_counter()
+
+    def _end(self, name: str, begun: tuple, status: str) -> Dict:
+        before, rss_before, cpu_started, started = begun
+        record = {
+            "status": status,
+            "wall_seconds": round(time.perf_counter() - started, 3),
+            "cpu_seconds": round(time.process_time() - cpu_started, 3),
+            "peak_rss_delta_mb": round(_peak_rss_mb() - rss_before, 1),
+            **_diff(before, self.snapshot()),
+        }
+        with self._lock:
+            self.nodes[name] = record
+        logger.info(
+            f"⏱️  [{name}] {record['wall_seconds']:.2f}초 (CPU {record['cpu_seconds']:.2f}초), "
+            f"RSS +{record['peak_rss_delta_mb']:.1f}MB, HTTP {record['http_calls']}회, "
+            f"LLM 토큰 {record['prompt_tokens'] + record['completion_tokens']:,}"
+        )
+        return record
+
+    def instrument_node(self, name: str, node_fn: Callable[[Dict], Dict]) -> Callable[[Dict], Dict]:
+        """노드 실행 전후 측정값을 결과의 node_metrics에 추가"""
+
+        @functools.wraps(node_fn)
+        def wrapper(state):
+            begun = self._begin()
+            status = "completed"
+            try:
+                result = node_fn(state)
+            except Exception:
+                status = "failed"
+                raise
+            finally:
+                record = self._end(name, begun, status)
+
+            if isinstance(result, dict):
+                result = {**result, "node_metrics": {name: record}}
+            return result
+
+        return wrapper
+
+    def instrument_async_node(self, name: str, node_fn: Callable[[Dict], Awaitable[Dict]]) -> Callable[[Dict], Awaitable[Dict]]:
+        """비동기 노드용 instrument_node (같은 이벤트 루프의 노드끼리 CPU/HTTP 수치가 섞일 수 있음)"""
+
+        @functools.wraps(node_fn)
+        async def wrapper(state):
+            begun = self._begin()
+            status = "completed"
+            try:
+                result = await node_fn(state)
+            except Exception:
+                status = "failed"
+                raise
+            finally:
+                record = self._end(name, begun, status)
+
+            if isinstance(result, dict):
+                result = {**result, "node_metrics": {name: record}}
+            return result
+
+        return wrapper
+
+    # ------------------------------------------
+    # 내보내기
+    # ------------------------------------------
+    def export(self, run_id: Optional[str] = None) -> Dict[str, str]:
+        """JSON + Prometheus textfile 저장, 경로 반환"""
+        os.makedirs(self.export_dir, exist_ok=True)
+        totals = self.snapshot()
+        with self._lock:
+            nodes = {name: dict(record) for name, record in self.nodes.items()}
+
+        payload = {
+            "run_id": run_id,
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+            "nodes": nodes,
+            **totals,
+        }
+        json_path = os.path.join(self.export_dir, "run_metrics.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+        prom_path = os.path.join(self.export_dir, "ai_trends.prom")
+        tmp_path = f"{prom_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_prometheus_text(nodes, totals))
+        os.replace(tmp_path, prom_path)  # textfile collector가 부분 파일을 읽지 않도록
+
+        return {"json": json_path, "prometheus": prom_path}
+
+    def log_summary(self) -> None:
+        with self._lock:
+            nodes = dict(self.nodes)
+        if not nodes:
+            return
+        logger.info(f"\n⏱️  노드별 실행 시간:")
+        for name, record in sorted(nodes.items(), key=lambda kv: kv[1]["wall_seconds"], reverse=True):
+            logger.info(
+                f"   - {name:24s}: {record['wall_seconds']:7.2f}초 "
+                f"(CPU {record['cpu_seconds']:.2f}초, HTTP {record['http_calls']}회, "
+                f"토큰 {record['prompt_tokens'] + record['completion_tokens']:,})"
+            )
+
+
+def _diff(before: Dict, after: Dict) -> Dict:
+    """실행 구간의 HTTP/LLM 카운터 증가분"""
+    http_by_tool = {}
+    for tool, counts in after["http"].items():
+        prev = before["http"].get(tool, {})
+        delta = {k: v - prev.get(k, 0) for k, v in counts.items()}
+        if delta["calls"]:
+            http_by_tool[tool] = delta
+
+    prompt_tokens = completion_tokens = 0
+    for model, counts in after["llm"].items():
+        prev = before["llm"].get(model, {})
+        prompt_tokens += counts["prompt_tokens"] - prev.get("prompt_tokens", 0)
+        completion_tokens += counts["completion_tokens"] - prev.get("completion_tokens", 0)
+
+    return {
+        "http_calls": sum(d["calls"] for d in http_by_tool.values()),
+        "http_by_tool": http_by_tool,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+    }
+
+
+def _prometheus_text(nodes: Dict[str, Dict], totals: Dict[str, Dict]) -> str:
+    lines = []
+
+    def metric(name: str, kind: str, help_text: str, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}")
+
+    metric("ai_trends_node_wall_seconds", "gauge", "Node wall-clock time",
+           [({"node": n}, r["wall_seconds"]) for n, r in nodes.items()])
+    metric("ai_trends_node_cpu_seconds", "gauge", "Process CPU time during node",
+           [({"node": n}, r["cpu_seconds"]) for n, r in nodes.items()])
+    metric("ai_trends_node_peak_rss_delta_mb", "gauge", "Peak RSS growth during node",
+           [({"node": n}, r["peak_rss_delta_mb"]) for n, r in nodes.items()])
+    metric("ai_trends_node_llm_tokens", "gauge", "LLM tokens used during node",
+           [({"node": n, "kind": kind}, r[f"{kind}_tokens"])
+            for n, r in nodes.items() for kind in ("prompt", "completion")])
+    metric("ai_trends_http_requests_total", "counter", "Outbound HTTP requests per tool",
+           [({"tool": t}, c["calls"]) for t, c in totals["http"].items()])
+    metric("ai_trends_http_errors_total", "counter", "Outbound HTTP errors per tool",
+           [({"tool": t}, c["errors"]) for t, c in totals["http"].items()])
+    metric("ai_trends_http_bytes_total", "counter", "Outbound HTTP bytes per tool",
+           [({"tool": t, "direction": d}, c[f"bytes_{d}"])
+            for t, c in totals["http"].items() for d in ("sent", "received")])
+    metric("ai_trends_llm_tokens_total", "counter", "LLM tokens per model",
+           [({"model": m, "kind": kind}, c[f"{kind}_tokens"])
+            for m, c in totals["llm"].items() for kind in ("prompt", "completion")])
+
+    return "\n".join(lines) + "\n"
+
+
+# 전역 계측기
+metrics = MetricsRecorder(export_dir=settings.METRICS_DIR)
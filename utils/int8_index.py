@@ -0,0 +1,280 @@
+# utils/int8_index.py
+"""
+int8 양자화 벡터 인덱스 (RAG 콜드 스타트용 Chroma 대체 백엔드)
+- 청크 임베딩을 L2 정규화 후 행별 스케일로 int8 양자화 → .npy 메모리 맵 (float32 대비 1/4 크기)
+- 로드 = meta.json + np.load(mmap_mode="r") → 수 ms, 검색 때 필요한 행만 디스크에서 읽음
+- 검색: 코사인 유사도 (int8 행 × 스케일 · 정규화 질의), 전수 검색 또는 IVF(k-means 리스트 nprobe개만)
+- 청크 본문/메타데이터는 docs.jsonl + 오프셋 배열 → 상위 k개만 읽음
+- Int8VectorStore: langchain VectorStore 인터페이스 (읽기 전용, build_vectorstore.py가 Chroma에서 내보냄)
+
+파일 구성 (index_dir):
+  meta.json          버전 / 차원 / 개수 / IVF 리스트 수
+  vectors.npy        (N, D) int8
+  scales.npy         (N,) float32
+  chunk_ids.json     행 번호 → 청크 ID
+  docs.jsonl         행별 {"text", "metadata"}, doc_offsets.npy (N+1,) int64 바이트 오프셋
+  ivf_centroids.npy  (L, D) float32, ivf_rows.npy (N,) 리스트별로 모은 행 번호, ivf_offsets.npy (L+1,)
+"""
+import json
+import os
+import shutil
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+FORMAT_VERSION = 1
+SEARCH_BLOCK = 65536   # 전수 검색 때 한 번에 읽는 행 수 (메모리 상한)
+KMEANS_SAMPLE = 50000
+KMEANS_ITERATIONS = 10
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def quantize(vectors) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, D) float → 정규화 후 행별 스케일 int8 양자화 (codes, scales)"""
+    vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales = np.where(scales == 0, 1.0, scales).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+# ==========================================
+# 인덱스 생성
+# ==========================================
+def _kmeans(vectors: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """구면 k-means (코사인) → (nlist, D) 정규화 중심"""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), nlist, replace=False)].copy()
+    for _ in range(KMEANS_ITERATIONS):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        for c in range(nlist):
+            members = vectors[assign == c]
+            if len(members):
+                centroids[c] = members.mean(axis=0)
+            else:
+                centroids[c] = vectors[rng.integers(len(vectors))]  # 빈 리스트는 임의 점으로 재시작
+        centroids = _normalize(centroids)
+    return centroids.astype(np.float32)
+
+
+def _build_ivf(index_dir: str, codes: np.ndarray, scales: np.ndarray, nlist: int) -> None:
+    n = len(codes)
+    sample_rows = np.random.default_rng(0).choice(n, min(n, KMEANS_SAMPLE), replace=False)
+    sample = np.asarray(codes[sample_rows], dtype=np.float32) * scales[sample_rows, None]
+    centroids = _kmeans(_normalize(sample), nlist)
+
+    assign = np.empty(n, dtype=np.int32)
+    for start in range(0, n, SEARCH_BLOCK):
+        block = np.asarray(codes[start:start + SEARCH_BLOCK], dtype=np.float32)
+        assign[start:start + SEARCH_BLOCK] = np.argmax(block @ centroids.T, axis=1)
+
+    rows = np.argsort(assign, kind="stable").astype(np.int32)
+    offsets = np.zeros(nlist + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(assign, minlength=nlist))
+    np.save(os.path.join(index_dir, "ivf_centroids.npy"), centroids)
+    np.save(os.path.join(index_dir, "ivf_rows.npy"), rows)
+    np.save(os.path.join(index_dir, "ivf_offsets.npy"), offsets)
+
+
+def build_int8_index(
+    batches: Iterable[Tuple[List[str], Any, List[str], List[Dict]]],
+    count: int,
+    index_dir: str,
+    ivf_min_vectors: int = 100000
+) -> Dict:
+    """
+    (ids, embeddings, texts, metadatas) 배치 스트림 → index_dir에 int8 인덱스 저장
+
+    Args:
+        count: 전체 청크 수 (vectors.npy를 미리 할당)
+        ivf_min_vectors: 이 개수 이상이면 IVF 리스트(√N개) 생성, 미만이면 전수 검색
+    """
+    tmp_dir = f"{index_dir}.tmp"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+
+    codes = scales = None
+    chunk_ids: List[str] = []
+    offsets = [0]
+    with open(os.path.join(tmp_dir, "docs.jsonl"), "wb") as docs_file:
+        for ids, embeddings, texts, metadatas in batches:
+            batch_codes, batch_scales = quantize(embeddings)
+            if codes is None:
+                codes = np.lib.format.open_memmap(
+                    os.path.join(tmp_dir, "vectors.npy"), mode="w+", dtype=np.int8, shape=(count, batch_codes.shape[1])
+                )
+                scales = np.empty(count, dtype=np.float32)
+            start = len(chunk_ids)
+            codes[start:start + len(ids)] = batch_codes
+            scales[start:start + len(ids)] = batch_scales
+            chunk_ids.extend(ids)
+            for text, metadata in zip(texts, metadatas):
+                line = json.dumps({"text": text, "metadata": metadata or {}}, ensure_ascii=False).encode("utf-8") + b"\n"
+                docs_file.write(line)
+                offsets.append(offsets[-1] + len(line))
+
+    if codes is None or len(chunk_ids) != count:
+        shutil.rmtree(tmp_dir)
+        raise ValueError(f"청크 수 불일치 (예상 {count}, 실제 {len(chunk_ids)})")
+
+    codes.flush()
+    np.save(os.path.join(tmp_dir, "scales.npy"), scales)
+    np.save(os.path.join(tmp_dir, "doc_offsets.npy"), np.asarray(offsets, dtype=np.int64))
+    with open(os.path.join(tmp_dir, "chunk_ids.json"), "w", encoding="utf-8") as f:
+        json.dump(chunk_ids, f)
+
+    nlist = int(np.sqrt(count)) if count >= ivf_min_vectors else 0
+    if nlist:
+        _build_ivf(tmp_dir, codes, scales, nlist)
+    dim = codes.shape[1]
+    del codes
+
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": FORMAT_VERSION, "dim": dim, "count": count, "nlist": nlist, "metric": "cosine"}, f)
+
+    if os.path.exists(index_dir):
+        shutil.rmtree(index_dir)
+    os.replace(tmp_dir, index_dir)
+
+    size = sum(os.path.getsize(os.path.join(index_dir, name)) for name in os.listdir(index_dir))
+    return {"count": count, "dim": dim, "nlist": nlist, "bytes": size}
+
+
+# ==========================================
+# 검색
+# ==========================================
+class Int8Index:
+    """메모리 맵 int8 인덱스 (생성자에서 meta + 배열 매핑만 수행)"""
+
+    def __init__(self, index_dir: str, nprobe: int = 16):
+        self.index_dir = index_dir
+        self.nprobe = nprobe
+        path = lambda name: os.path.join(index_dir, name)
+        with open(path("meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"int8 인덱스 형식 버전 불일치 ({self.meta.get('version')})")
+        self.codes = np.load(path("vectors.npy"), mmap_mode="r")
+        self.scales = np.load(path("scales.npy"), mmap_mode="r")
+        self.doc_offsets = np.load(path("doc_offsets.npy"), mmap_mode="r")
+        with open(path("chunk_ids.json"), "r", encoding="utf-8") as f:
+            self.chunk_ids: List[str] = json.load(f)
+        if self.meta["nlist"]:
+            self.centroids = np.load(path("ivf_centroids.npy"))
+            self.ivf_rows = np.load(path("ivf_rows.npy"), mmap_mode="r")
+            self.ivf_offsets = np.load(path("ivf_offsets.npy"))
+        self._row_of: Optional[Dict[str, int]] = None
+        self._docs_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.meta["count"]
+
+    @staticmethod
+    def exists(index_dir: str) -> bool:
+        return os.path.exists(os.path.join(index_dir, "meta.json"))
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """IVF면 가까운 nprobe개 리스트의 행, 전수 검색이면 None"""
+        if not self.meta["nlist"]:
+            return None
+        lists = np.argsort(-(self.centroids @ query))[:self.nprobe]
+        return np.sort(np.concatenate([self.ivf_rows[self.ivf_offsets[l]:self.ivf_offsets[l + 1]] for l in lists]))
+
+    def search(self, vector, k: int = 5) -> List[Tuple[int, float]]:
+        """질의 벡터 → 상위 k개 [(행 번호, 코사인 유사도)]"""
+        query = _normalize(np.asarray(vector, dtype=np.float32)[None, :])[0]
+        rows = self._candidate_rows(query)
+
+        if rows is None:
+            scores = np.empty(len(self), dtype=np.float32)
+            for start in range(0, len(self), SEARCH_BLOCK):
+                block = np.asarray(self.codes[start:start + SEARCH_BLOCK], dtype=np.float32)
+                scores[start:start + len(block)] = (block @ query) * self.scales[start:start + len(block)]
+            rows = np.arange(len(self))
+        else:
+            scores = (np.asarray(self.codes[rows], dtype=np.float32) @ query) * self.scales[rows]
+
+        k = min(k, len(scores))
+        if not k:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(rows[i]), float(scores[i])) for i in top]
+
+    def document(self, row: int) -> Document:
+        start, end = int(self.doc_offsets[row]), int(self.doc_offsets[row + 1])
+        with self._docs_lock, open(os.path.join(self.index_dir, "docs.jsonl"), "rb") as f:
+            f.seek(start)
+            record = json.loads(f.read(end - start))
+        return Document(id=self.chunk_ids[row], page_content=record["text"], metadata=record["metadata"])
+
+    def row_of(self, chunk_id: str) -> Optional[int]:
+        if self._row_of is None:
+            self._row_of = {cid: i for i, cid in enumerate(self.chunk_ids)}
+        return self._row_of.get(chunk_id)
+
+
+class Int8VectorStore(VectorStore):
+    """Int8Index를 langchain VectorStore로 노출 (읽기 전용, Chroma와 같은 검색/조회 메서드)"""
+
+    def __init__(self, index_dir: str, embedding: Embeddings, nprobe: int = 16):
+        self.index = Int8Index(index_dir, nprobe=nprobe)
+        self._embedding = embedding
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def _select_relevance_score_fn(self):
+        return lambda score: score  # 이미 코사인 유사도
+
+    # 검색
+    def search_by_vectors(self, vectors: List[List[float]], k: int = 4) -> List[List[Tuple[Document, float]]]:
+        return [
+            [(self.index.document(row), score) for row, score in self.index.search(vector, k)]
+            for vector in vectors
+        ]
+
+    def similarity_search_by_vector_with_relevance_scores(self, embedding: List[float], k: int = 4, **kwargs: Any):
+        return self.search_by_vectors([embedding], k)[0]
+
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any):
+        return self.similarity_search_by_vector_with_relevance_scores(self._embedding.embed_query(query), k)
+
+    def _similarity_search_with_relevance_scores(self, query: str, k: int = 4, **kwargs: Any):
+        return self.similarity_search_with_score(query, k)
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_relevance_scores(embedding, k)]
+
+    # 조회 (Chroma.get 형식)
+    def get(self, ids: Optional[List[str]] = None, include: Optional[List[str]] = None, **kwargs: Any) -> Dict:
+        rows = [self.index.row_of(chunk_id) for chunk_id in ids] if ids is not None else range(len(self.index))
+        docs = [self.index.document(row) for row in rows if row is not None]
+        return {
+            "ids": [doc.id for doc in docs],
+            "documents": [doc.page_content for doc in docs],
+            "metadatas": [doc.metadata for doc in docs],
+        }
+
+    # 쓰기는 build_vectorstore.py가 Chroma에서 내보내는 방식만 지원
+    def add_texts(self, texts, metadatas=None, **kwargs: Any) -> List[str]:
+        raise NotImplementedError("Int8VectorStore는 읽기 전용입니다 (scripts/build_vectorstore.py로 생성)")
+
+    @classmethod
+    def from_texts(cls, texts, embedding, metadatas=None, **kwargs: Any):
+        raise NotImplementedError("Int8VectorStore는 읽기 전용입니다 (scripts/build_vectorstore.py로 생성)")
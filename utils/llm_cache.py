@@ -0,0 +1,162 @@
+# utils/llm_cache.py
+"""
+LLM 응답 캐시 (SQLite, 체크포인트 DB와 같은 디렉토리)
+- 키: 모델/파라미터 문자열(llm_string) 해시 + 프롬프트 해시
+- langchain BaseCache 구현 → ChatOpenAI(cache=llm_cache)로 사용
+- 용량 상한 초과 시 오래 안 쓴 순서로 삭제 (settings.LLM_CACHE["max_size_mb"])
+- enabled=False면 조회/저장 모두 건너뜀 (--no-llm-cache)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import sys
+from typing import Any, Optional, Sequence
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+
+from config.settings import settings
+from utils.logger import logger
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SQLiteLLMCache(BaseCache):
+    """모델 + 프롬프트 해시 기반 LLM 응답 캐시"""
+
+    def __init__(self, db_path: str, max_size_mb: float, enabled: bool = True):
+        self.db_path = db_path
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn = None
+        self._stats = {"hit": 0, "miss": 0, "write": 0}
+
+    # ------------------------------------------
+    # 연결 (첫 사용 시 생성)
+    # ------------------------------------------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    llm_hash TEXT NOT NULL,
+                    prompt_hash TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (llm_hash, prompt_hash)
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache (last_access)")
+            self._conn.commit()
+        return self._conn
+
+    # ------------------------------------------
+    # BaseCache 인터페이스
+    # ------------------------------------------
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Any]]:
+        if not self.enabled:
+            return None
+        key = (_sha256(llm_string), _sha256(prompt))
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?", key
+            ).fetchone()
+            if row is None:
+                self._stats["miss"] += 1
+                return None
+            conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE llm_hash = ? AND prompt_hash = ?",
+                (time.time(), *key)
+            )
+            conn.commit()
+            self._stats["hit"] += 1
+
+        try:
+            return [loads(generation) for generation in json.loads(row[0])]
+        except Exception as e:
+            logger.warning(f"   ⚠️ LLM 캐시 역직렬화 실패 → 재요청: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Any]) -> None:
+        if not self.enabled:
+            return
+        payload = json.dumps([dumps(generation) for generation in return_val])
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (_sha256(llm_string), _sha256(prompt), payload, len(payload.encode("utf-8")), now, now)
+            )
+            conn.commit()
+            self._stats["write"] += 1
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    # ------------------------------------------
+    # 정리 / 통계
+    # ------------------------------------------
+    def evict(self) -> int:
+        """용량 상한 초과분을 오래 안 쓴 순서로 삭제"""
+        if not os.path.exists(self.db_path):
+            return 0
+        with self._lock:
+            conn = self._connection()
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            rows = conn.execute(
+                "SELECT llm_hash, prompt_hash, size FROM llm_cache ORDER BY last_access"
+            ).fetchall()
+            for llm_hash, prompt_hash, size in rows:
+                if total <= self.max_bytes:
+                    break
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?",
+                    (llm_hash, prompt_hash)
+                )
+                total -= size
+                removed += 1
+            conn.commit()
+            conn.execute("VACUUM")
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        total = stats["hit"] + stats["miss"]
+        if not total:
+            return
+        logger.info(f"\n🧠 LLM 캐시 통계:")
+        logger.info(
+            f"   - hit {stats['hit']} / miss {stats['miss']} "
+            f"({stats['hit'] / total * 100:.0f}%), 저장 {stats['write']}"
+        )
+
+
+# 전역 캐시
+llm_cache = SQLiteLLMCache(
+    db_path=settings.LLM_CACHE["db_path"],
+    max_size_mb=settings.LLM_CACHE["max_size_mb"],
+    enabled=settings.LLM_CACHE["enabled"]
+)
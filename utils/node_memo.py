@@ -0,0 +1,245 @@
+# utils/node_memo.py
+"""
+노드 결과 재사용 (SQLite, 체크포인트 DB와 같은 디렉토리)
+- 지문: 노드가 읽는 GraphState 필드 + 관련 Settings 항목 + 입력 파일 내용 + 노드 로직 모듈 소스의 sha256
+  (대상/입력 정의는 config/workflow_config.py MEMO_NODES)
+- 같은 지문의 결과가 있으면 노드를 실행하지 않고 저장된 결과 반환 → thread_id가 달라도 재사용
+- blob 참조 필드(papers 등)는 참조 dict(sha256)만 해시 → 큰 데이터 로드 없음
+- 저장 조건: step_* 가 모두 "completed"이고 error_log가 늘지 않은 결과만 (부분 실패 결과는 재사용 안 함)
+- 노드별 유효 기간(settings.NODE_MEMO["ttl_hours"]), 개수 상한 초과 시 오래 안 쓴 순서로 삭제
+- enabled=False면 조회/저장 모두 건너뜀 (--no-memo)
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import threading
+import time
+import sys
+from typing import Any, Awaitable, Callable, Dict, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from utils.logger import logger
+
+# 재사용 결과에서 제외하는 필드 (누적 필드 / 실행마다 새로 측정)
+EXCLUDED_FIELDS = ("error_log", "node_metrics")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class NodeMemo:
+    """입력 지문 → 노드 결과 저장소"""
+
+    def __init__(self, db_path: str, max_entries: int, ttl_hours: Dict[str, float], enabled: bool = True):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_hours = ttl_hours
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn = None
+        self._source_hashes: Dict[str, str] = {}
+        self._stats = {"hit": 0, "miss": 0, "write": 0}
+
+    # ------------------------------------------
+    # 연결 (첫 사용 시 생성)
+    # ------------------------------------------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS node_memo (
+                    node TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (node, fingerprint)
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_node_memo_access ON node_memo (last_access)")
+            self._conn.commit()
+        return self._conn
+
+    # ------------------------------------------
+    # 지문
+    # ------------------------------------------
+    def _source_hash(self, module: str) -> str:
+        """모듈 소스 해시 (import 없이 파일만 읽음, 프로세스 내 캐시)"""
+        if module not in self._source_hashes:
+            spec = importlib.util.find_spec(module)
+            origin = spec.origin if spec else None
+            if origin and os.path.exists(origin):
+                with open(origin, "rb") as f:
+                    self._source_hashes[module] = _sha256(f.read())
+            else:
+                self._source_hashes[module] = "missing"
+        return self._source_hashes[module]
+
+    def fingerprint(self, spec: Dict, state: Dict) -> str:
+        """노드 입력 지문 (spec: MEMO_NODES 항목)"""
+        files = {}
+        for path in spec.get("files", []):
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    files[path] = _sha256(f.read())
+            else:
+                files[path] = None
+
+        payload = {
+            "state": {key: state.get(key) for key in spec.get("state", [])},
+            "settings": {name: getattr(settings, name) for name in spec.get("settings", [])},
+            "files": files,
+            "modules": {module: self._source_hash(module) for module in spec.get("modules", [])},
+        }
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return _sha256(raw.encode("utf-8"))
+
+    # ------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------
+    def lookup(self, node: str, fingerprint: str) -> Optional[Dict]:
+        ttl = self.ttl_hours.get(node, self.ttl_hours["default"]) * 3600
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, created_at FROM node_memo WHERE node = ? AND fingerprint = ?",
+                (node, fingerprint)
+            ).fetchone()
+            if row is None or time.time() - row[1] > ttl:
+                self._stats["miss"] += 1
+                return None
+            conn.execute(
+                "UPDATE node_memo SET last_access = ? WHERE node = ? AND fingerprint = ?",
+                (time.time(), node, fingerprint)
+            )
+            conn.commit()
+            self._stats["hit"] += 1
+        return json.loads(row[0])
+
+    @staticmethod
+    def reusable(state: Dict, result: Any) -> bool:
+        """완료되었고 새 오류가 없는 결과만 저장"""
+        if not isinstance(result, dict):
+            return False
+        steps = [value for key, value in result.items() if key.startswith("step_")]
+        if not steps or any(step != "completed" for step in steps):
+            return False
+        return len(result.get("error_log") or []) <= len(state.get("error_log") or [])
+
+    def store(self, node: str, fingerprint: str, state: Dict, result: Any) -> bool:
+        if not self.reusable(state, result):
+            return False
+        try:
+            payload = json.dumps({k: v for k, v in result.items() if k not in EXCLUDED_FIELDS}, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"   ⚠️ [{node}] 결과 직렬화 불가 → 재사용 저장 생략: {e}")
+            return False
+
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO node_memo VALUES (?, ?, ?, ?, ?)",
+                (node, fingerprint, payload, now, now)
+            )
+            # 개수 상한 초과분은 오래 안 쓴 순서로 삭제
+            conn.execute(
+                "DELETE FROM node_memo WHERE rowid IN "
+                "(SELECT rowid FROM node_memo ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            conn.commit()
+            self._stats["write"] += 1
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM node_memo")
+            conn.commit()
+
+    # ------------------------------------------
+    # 노드 래퍼
+    # ------------------------------------------
+    def _try_lookup(self, name: str, spec: Dict, state: Dict) -> tuple:
+        """(지문, 저장된 결과 또는 None), 조회 실패 시 (None, None)"""
+        try:
+            fingerprint = self.fingerprint(spec, state)
+            cached = self.lookup(name, fingerprint)
+        except (OSError, sqlite3.Error, ValueError) as e:
+            logger.warning(f"⚠️ [{name}] 결과 재사용 조회 실패 → 노드 실행: {e}")
+            return None, None
+        if cached is not None:
+            logger.info(f"♻️  [{name}] 입력 변경 없음 → 이전 결과 재사용 ({fingerprint[:12]})")
+        return fingerprint, cached
+
+    def _try_store(self, name: str, fingerprint: Optional[str], state: Dict, result: Any) -> None:
+        if fingerprint is None:
+            return
+        try:
+            self.store(name, fingerprint, state, result)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ [{name}] 결과 저장 실패: {e}")
+
+    def wrap(self, name: str, node_fn: Callable[[Dict], Dict], spec: Dict) -> Callable[[Dict], Dict]:
+        """지문이 같으면 저장된 결과 반환, 아니면 실행 후 저장"""
+
+        def wrapper(state):
+            if not self.enabled:
+                return node_fn(state)
+            fingerprint, cached = self._try_lookup(name, spec, state)
+            if cached is not None:
+                return cached
+            result = node_fn(state)
+            self._try_store(name, fingerprint, state, result)
+            return result
+
+        wrapper.__name__ = getattr(node_fn, "__name__", name)
+        wrapper.__doc__ = getattr(node_fn, "__doc__", None)
+        return wrapper
+
+    def wrap_async(self, name: str, node_fn: Callable[[Dict], Awaitable[Dict]], spec: Dict) -> Callable[[Dict], Awaitable[Dict]]:
+        """비동기 노드용 wrap (SQLite 조회/저장은 짧아서 이벤트 루프에서 바로 실행)"""
+
+        async def wrapper(state):
+            if not self.enabled:
+                return await node_fn(state)
+            fingerprint, cached = self._try_lookup(name, spec, state)
+            if cached is not None:
+                return cached
+            result = await node_fn(state)
+            self._try_store(name, fingerprint, state, result)
+            return result
+
+        wrapper.__name__ = getattr(node_fn, "__name__", name)
+        wrapper.__doc__ = getattr(node_fn, "__doc__", None)
+        return wrapper
+
+    # ------------------------------------------
+    # 통계
+    # ------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        total = stats["hit"] + stats["miss"]
+        if not total:
+            return
+        logger.info(f"\n♻️  노드 결과 재사용 통계:")
+        logger.info(f"   - 재사용 {stats['hit']} / 실행 {stats['miss']}, 저장 {stats['write']}")
+
+
+# 전역 저장소
+node_memo = NodeMemo(
+    db_path=settings.NODE_MEMO["db_path"],
+    max_entries=settings.NODE_MEMO["max_entries"],
+    ttl_hours=settings.NODE_MEMO["ttl_hours"],
+    enabled=settings.NODE_MEMO["enabled"]
+)
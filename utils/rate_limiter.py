@@ -0,0 +1,71 @@
+# utils/rate_limiter.py
+"""
+소스별 공유 토큰 버킷 Rate Limiter
+- 예약(reservation) 방식: 락은 토큰 계산에만 잡고, 대기는 락 밖에서 수행
+- asyncio 코루틴(acquire)과 일반 스레드(acquire_sync) 양쪽에서 같은 버킷 공유 가능
+- 이벤트 루프에 묶이지 않으므로 asyncio.run()을 여러 번 호출해도 재사용 가능
+"""
+import asyncio
+import threading
+import time
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (rate: 초당 토큰 수, burst: 최대 누적 토큰 수)
+
+    예) arXiv 공식 가이드 "3초당 1회" → TokenBucket(rate=1/3, burst=1)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = max(int(burst), 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._mutex = threading.Lock()
+
+    def _reserve(self, tokens: float = 1.0) -> float:
+        """토큰을 예약하고, 사용 가능해질 때까지 기다려야 할 시간(초)을 반환"""
+        with self._mutex:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens  # 음수가 되면 그만큼 미래 토큰을 예약한 상태
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """코루틴용 토큰 획득"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: float = 1.0) -> None:
+        """스레드/동기 코드용 토큰 획득"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+
+# ============================================
+# 🔒 소스별 전역 버킷 (프로세스 내 공유)
+# ============================================
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(source: str) -> TokenBucket:
+    """settings.RATE_LIMITS[source] 기반 공유 버킷 반환"""
+    with _buckets_lock:
+        if source not in _buckets:
+            conf = settings.RATE_LIMITS.get(source, {"rate": 1.0, "burst": 1})
+            _buckets[source] = TokenBucket(rate=conf["rate"], burst=conf.get("burst", 1))
+        return _buckets[source]
@@ -0,0 +1,84 @@
+# utils/repo_matcher.py
+"""
+키워드 → GitHub 저장소 매칭 인덱스 (Aho-Corasick)
+- 기존 조건과 동일: 키워드(소문자)가 이름 또는 설명의 부분 문자열이거나, 저장소 keywords와 정확히 일치
+- 모든 키워드로 오토마톤 1개를 만들고, 저장소 텍스트를 1번만 훑어 전체 매칭을 계산
+- 비용: O(키워드 길이 합 + 저장소 텍스트 길이 합 + 매칭 수)
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class AhoCorasick:
+    """다중 패턴 부분 문자열 검색 (겹치는 매칭 포함)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        if pattern not in self._out[node]:
+            self._out[node].append(pattern)
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """text에 부분 문자열로 등장하는 패턴 집합"""
+        found = set()
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class RepoMatcher:
+    """저장소 목록을 한 번 색인해 여러 키워드의 관련 저장소를 조회"""
+
+    def __init__(self, repos: List[Dict], keywords: Iterable[str]):
+        self.repos = repos
+        patterns = {keyword.lower() for keyword in keywords if keyword}
+        automaton = AhoCorasick(patterns)
+
+        # 키워드(소문자) → 저장소 인덱스 (원본 순서 유지)
+        self._postings: Dict[str, List[int]] = {pattern: [] for pattern in patterns}
+        for idx, repo in enumerate(repos):
+            matched = automaton.find(repo.get("name", "").lower())
+            matched |= automaton.find(repo.get("description", "").lower())
+            matched |= {k_lower for k in repo.get("keywords", []) if (k_lower := (k or "").lower()) in patterns}
+            for pattern in matched:
+                self._postings[pattern].append(idx)
+
+    def related(self, keyword: str) -> List[Dict]:
+        """키워드와 매칭되는 저장소 (입력 순서)"""
+        return [self.repos[idx] for idx in self._postings.get(keyword.lower(), [])]
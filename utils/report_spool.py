@@ -0,0 +1,129 @@
+# utils/report_spool.py
+"""
+보고서 섹션 spool (섹션 단위 체크포인트)
+- 섹션이 완성될 때마다 sections.jsonl에 {"name", "content"} 한 줄 append (flush + fsync)
+- 같은 spool 디렉토리로 다시 실행하면 완료된 섹션은 다시 만들지 않음 (중단된 보고서 이어서 생성)
+- 쓰다 만 마지막 줄(비정상 종료)은 열 때 잘라냄
+- assemble(): 레이아웃 순서대로 섹션을 1개씩 읽어 Markdown 파일에 스트리밍 기록 (전체 문자열을 메모리에 만들지 않음)
+- 상태(체크포인트)에는 보고서 파일 참조 dict만 저장 → 내용은 read_report()로 로드
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import sys
+from typing import Dict, List, Optional, Tuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logger import logger
+
+LOG_NAME = "sections.jsonl"
+
+# 레이아웃 항목: ("text", 고정 문자열) 또는 ("section", 섹션 이름)
+LayoutItem = Tuple[str, str]
+
+
+class ReportSpool:
+    """sections.jsonl 기반 섹션 저장소 (스레드 안전 append)"""
+
+    def __init__(self, spool_dir: str):
+        self.spool_dir = spool_dir
+        self.log_path = os.path.join(spool_dir, LOG_NAME)
+        self._lock = threading.Lock()
+        os.makedirs(spool_dir, exist_ok=True)
+        self._offsets: Dict[str, Tuple[int, int]] = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """완료된 섹션의 (오프셋, 길이), 깨진 마지막 줄은 잘라냄"""
+        offsets = {}
+        if not os.path.exists(self.log_path):
+            return offsets
+
+        valid_end = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning("   ⚠️ 보고서 spool 마지막 섹션 손상 → 해당 섹션부터 다시 생성")
+                    break
+                offsets[record["name"]] = (valid_end, len(line))
+                valid_end += len(line)
+
+        if valid_end < os.path.getsize(self.log_path):
+            with open(self.log_path, "r+b") as f:
+                f.truncate(valid_end)
+        return offsets
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append(self, name: str, content: str) -> None:
+        """섹션 1개 기록 (fsync 후 완료로 표시)"""
+        line = (json.dumps({"name": name, "content": content}, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            with open(self.log_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._offsets[name] = (offset, len(line))
+
+    def read(self, name: str) -> str:
+        offset, length = self._offsets[name]
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))["content"]
+
+    def assemble(self, layout: List[LayoutItem], path: str, overrides: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        레이아웃 순서대로 Markdown 파일 작성 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            layout: [("text", 문자열) | ("section", 이름)]
+            path: 출력 Markdown 경로
+            overrides: spool에 없는 섹션 내용 (생성 실패 시 대체 섹션 등)
+
+        Returns:
+            보고서 파일 참조 {"path", "chars", "bytes", "sha256", "sections"}
+        """
+        overrides = overrides or {}
+        digest = hashlib.sha256()
+        chars = size = sections = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        # 바이트로 기록 (텍스트 모드의 줄바꿈 변환이 없어야 bytes / sha256이 디스크 파일과 일치)
+        with open(tmp_path, "wb") as out:
+            for kind, value in layout:
+                if kind == "section":
+                    text = overrides[value] if value in overrides else self.read(value)
+                    sections += 1
+                else:
+                    text = value
+                encoded = text.encode("utf-8")
+                out.write(encoded)
+                digest.update(encoded)
+                chars += len(text)
+                size += len(encoded)
+        os.replace(tmp_path, path)
+
+        return {"path": path, "chars": chars, "bytes": size, "sha256": digest.hexdigest(), "sections": sections}
+
+    def discard(self) -> None:
+        """보고서 완성 후 spool 삭제"""
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+
+def read_report(ref: Optional[Dict]) -> str:
+    """상태의 보고서 파일 참조 → Markdown 내용 (없으면 빈 문자열)"""
+    if not ref or not ref.get("path") or not os.path.exists(ref["path"]):
+        return ""
+    with open(ref["path"], "r", encoding="utf-8", newline="") as f:
+        return f.read()
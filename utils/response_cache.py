@@ -0,0 +1,264 @@
+# utils/response_cache.py
+"""
+수집 도구 공용 디스크 응답 캐시 (data/raw/cache)
+- 키: 소스 + 정규화된 요청 파라미터의 SHA-256
+- 소스별 TTL (settings.CACHE["ttl_hours"]) + 전체 용량 상한(LRU 정리)
+- HTTP 응답은 ETag / Last-Modified 저장 → 만료 시 조건부 재검증(304)
+- 실행 종료 시 소스별 hit/miss 카운터 보고
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import sys
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from utils.logger import logger
+
+
+def normalize_params(value: Any) -> Any:
+    """요청 파라미터 정규화 (문자열 공백/대소문자, dict 키 순서)"""
+    if isinstance(value, str):
+        return " ".join(value.split()).lower()
+    if isinstance(value, dict):
+        return {str(k): normalize_params(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [normalize_params(v) for v in value]
+    return value
+
+
+class ResponseCache:
+    """소스별 TTL + 용량 상한을 가진 JSON 파일 캐시"""
+
+    def __init__(self, root: str, ttl_hours: Dict[str, float], max_size_mb: float, enabled: bool = True):
+        self.root = root
+        self.ttl_hours = ttl_hours
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {"hit": 0, "miss": 0, "revalidated": 0, "write": 0})
+
+    # ------------------------------------------
+    # 키 / 경로
+    # ------------------------------------------
+    def key(self, source: str, params: Dict) -> str:
+        raw = json.dumps(
+            {"source": source, "params": normalize_params(params)},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, source: str, key: str) -> str:
+        return os.path.join(self.root, source, f"{key}.json")
+
+    def _count(self, source: str, field: str) -> None:
+        with self._lock:
+            self._stats[source][field] += 1
+
+    def _is_fresh(self, source: str, entry: Dict) -> bool:
+        ttl = self.ttl_hours.get(source, self.ttl_hours.get("default", 24)) * 3600
+        return time.time() - entry.get("stored_at", 0) < ttl
+
+    # ------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------
+    def lookup(self, source: str, params: Dict) -> Optional[Dict]:
+        """만료 여부와 관계없이 저장된 엔트리 반환 (카운터 미반영)"""
+        if not self.enabled:
+            return None
+        path = self._path(source, self.key(source, params))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        entry["fresh"] = self._is_fresh(source, entry)
+        return entry
+
+    def get(self, source: str, params: Dict) -> Optional[Any]:
+        """유효한(TTL 이내) 캐시 payload 반환, 없으면 None"""
+        if not self.enabled:
+            return None
+        entry = self.lookup(source, params)
+        if entry is None or not entry["fresh"]:
+            self._count(source, "miss")
+            return None
+
+        self._count(source, "hit")
+        try:
+            os.utime(self._path(source, self.key(source, params)))  # LRU 기록
+        except OSError:
+            pass
+        return entry["payload"]
+
+    def put(
+        self,
+        source: str,
+        params: Dict,
+        payload: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """payload 저장 (원자적 교체)"""
+        if not self.enabled:
+            return
+        key = self.key(source, params)
+        path = self._path(source, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        entry = {
+            "source": source,
+            "params": params,
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "payload": payload,
+        }
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+            self._count(source, "write")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"   ⚠️ 캐시 저장 실패 ({source}): {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_or_fetch(self, source: str, params: Dict, fetch_fn: Callable[[], Any]) -> Any:
+        """캐시 hit이면 반환, miss면 fetch_fn() 실행 후 저장"""
+        cached = self.get(source, params)
+        if cached is not None:
+            return cached
+        payload = fetch_fn()
+        self.put(source, params, payload)
+        return payload
+
+    # ------------------------------------------
+    # 조건부 재검증 (HTTP)
+    # ------------------------------------------
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """만료된 엔트리의 ETag/Last-Modified → If-None-Match/If-Modified-Since"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidated(self, source: str, params: Dict, entry: Dict) -> Any:
+        """304 Not Modified → stored_at 갱신 후 기존 payload 반환"""
+        self._count(source, "revalidated")
+        self.put(source, params, entry["payload"], entry.get("etag"), entry.get("last_modified"))
+        return entry["payload"]
+
+    def http_get(
+        self,
+        session,
+        source: str,
+        url: str,
+        params: Dict,
+        headers: Optional[Dict] = None,
+        timeout: float = 30,
+        on_response: Optional[Callable[[Any], None]] = None
+    ) -> str:
+        """
+        requests 세션 GET + 캐시 (payload: 응답 본문 문자열)
+        - 유효한 엔트리가 있으면 요청 없이 반환
+        - 만료된 엔트리가 있으면 조건부 요청, 304면 재사용
+        - on_response: 모든 응답에 대해 상태 확인 전에 호출 (rate limit 헤더 처리 등)
+        """
+        cache_params = {"url": url, **params}
+        entry = self.lookup(source, cache_params)
+        if entry is not None and entry["fresh"]:
+            return entry["payload"]
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(self.conditional_headers(entry))
+
+        response = session.get(url, params=params, headers=request_headers, timeout=timeout)
+        if on_response is not None:
+            on_response(response)
+        if response.status_code == 304 and entry is not None:
+            return self.revalidated(source, cache_params, entry)
+
+        response.raise_for_status()
+        self.put(
+            source, cache_params, response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified")
+        )
+        return response.text
+
+    # ------------------------------------------
+    # 정리 / 통계
+    # ------------------------------------------
+    def evict(self) -> int:
+        """만료 엔트리 삭제 후 용량 상한 초과분을 오래 안 쓴 순서로 삭제"""
+        if not os.path.exists(self.root):
+            return 0
+
+        files = []
+        for dirpath, _, filenames in os.walk(self.root):
+            source = os.path.basename(dirpath)
+            ttl = self.ttl_hours.get(source, self.ttl_hours.get("default", 24)) * 3600
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path, ttl))
+
+        removed = 0
+        now = time.time()
+        kept = []
+        for mtime, size, path, ttl in files:
+            # 재검증 가능성을 위해 TTL의 2배까지는 보관
+            if now - mtime > ttl * 2:
+                os.remove(path)
+                removed += 1
+            else:
+                kept.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in kept)
+        for mtime, size, path in sorted(kept):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+
+        return removed
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {source: dict(counts) for source, counts in self._stats.items()}
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        if not stats:
+            return
+        logger.info(f"\n🗄️  응답 캐시 통계:")
+        for source, counts in sorted(stats.items()):
+            total = counts["hit"] + counts["miss"]
+            rate = counts["hit"] / total * 100 if total else 0.0
+            logger.info(
+                f"   - {source:8s}: hit {counts['hit']} / miss {counts['miss']} "
+                f"({rate:.0f}%), 재검증 {counts['revalidated']}, 저장 {counts['write']}"
+            )
+
+
+# 전역 캐시
+response_cache = ResponseCache(
+    root=settings.CACHE["dir"],
+    ttl_hours=settings.CACHE["ttl_hours"],
+    max_size_mb=settings.CACHE["max_size_mb"],
+    enabled=settings.CACHE["enabled"]
+)
@@ -1,21 +1,20 @@
 # utils/scoring.py
-"""점수 계산 유틸리티"""
+"""점수 계산 유틸리티 (스칼라 버전, 배치 계산은 utils.scoring_engine)"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.scoring_engine import (
+    LEGACY_MATURITY, maturity_scores, opportunity_scores, final_scores
+)
 
 def calculate_maturity_score(paper_count: int, github_stars: int, num_products: int) -> float:
     """기술 성숙도 점수 (0~100)"""
-    product_ratio = min(num_products / max(paper_count / 100, 1), 1.0)
-    github_score = min(github_stars / 100000, 1.0)
-    
-    score = (0.5 * product_ratio + 0.5 * github_score) * 100
-    return round(score, 1)
+    return float(maturity_scores([paper_count], [github_stars], [num_products], LEGACY_MATURITY)[0])
 
 def calculate_opportunity_score(tam_usd: int, cagr: float, gov_support: bool) -> float:
     """시장 기회 점수 (0~100)"""
-    tam_score = min(tam_usd / 1_000_000_000, 1.0) * 40
-    growth_score = min(cagr / 0.5, 1.0) * 30
-    gov_score = 30 if gov_support else 0
-    
-    return round(tam_score + growth_score + gov_score, 1)
+    return float(opportunity_scores([tam_usd], [cagr], [gov_support])[0])
 
 def calculate_final_score(
     tech_score: float,
@@ -23,18 +22,5 @@ def calculate_final_score(
     growth_rate: float,
     competition: float
 ) -> float:
-    """최종 트렌드 점수 (0~100)"""
-    # 가중치
-    w_tech = 0.25
-    w_market = 0.35
-    w_growth = 0.25
-    w_comp = 0.15
-    
-    score = (
-        w_tech * tech_score +
-        w_market * market_score +
-        w_growth * (growth_rate * 100) -
-        w_comp * competition
-    )
-    
-    return round(score, 1)
\ No newline at end of file
+    """최종 트렌드 점수 (0~100) - 가중치: scoring_engine.FINAL_WEIGHTS"""
+    return float(final_scores([tech_score], [market_score], [growth_rate], [competition])[0])
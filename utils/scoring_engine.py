@@ -0,0 +1,149 @@
+# utils/scoring_engine.py
+"""
+컬럼 단위(NumPy) 점수 계산 엔진
+- 성숙도 / 기회 / 최종 / 테마 점수와 경쟁 강도를 배열 단위로 한 번에 계산
+- 기존 스칼라 함수와 결과가 비트 단위로 같도록 연산 순서와 반올림 방식을 맞춤
+  · 산술: 기존 식과 같은 순서의 float64 연산
+  · 반올림: Python round()와 같은 결과 (np.round는 x*10 오차로 경계값에서 달라질 수 있어 보정)
+- 스칼라 함수(tech_node / cross_node / utils.scoring)는 이 엔진의 1개짜리 호출로 위임
+"""
+import os
+import sys
+from typing import Dict, Iterable, Optional, Sequence
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from config.keywords import COMPETITION_MAP
+
+# 성숙도 공식 파라미터
+TECH_MATURITY = {"paper_divisor": 80.0, "stars_cap": 50000.0, "w_product": 0.6, "w_github": 0.4}   # tech_node (B2B 제품화)
+LEGACY_MATURITY = {"paper_divisor": 100, "stars_cap": 100000, "w_product": 0.5, "w_github": 0.5}   # utils.scoring
+
+# 테마 점수 가중치 (기술, 시장, 성장률, 경쟁) - 경쟁은 패널티
+THEME_WEIGHTS = (0.25, 0.35, 0.25, -0.15)
+
+# 최종 트렌드 점수 가중치 (utils.scoring.calculate_final_score)
+FINAL_WEIGHTS = {"tech": 0.25, "market": 0.35, "growth": 0.25, "competition": 0.15}
+
+
+def _arr(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def round_like_python(values, ndigits: int = 1) -> np.ndarray:
+    """
+    Python round(x, ndigits)와 같은 결과의 배열 반올림
+    - 대부분은 np.round와 같고, x*10^n이 .5 경계에 아주 가까운 값만 Python round로 재계산
+    """
+    values = _arr(values)
+    rounded = np.round(values, ndigits)
+    scaled = values * (10.0 ** ndigits)
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        flat_values = values[near_tie]
+        rounded[near_tie] = [round(float(v), ndigits) for v in flat_values]
+    return rounded
+
+
+# ==========================================
+# 성숙도 / 기회 / 최종 점수
+# ==========================================
+def maturity_scores(
+    paper_count,
+    github_stars,
+    num_repos,
+    params: Optional[Dict] = None
+) -> np.ndarray:
+    """
+    기술 성숙도 (0~100)
+    = (w_product × min(repos / max(papers / divisor, 1), 1) + w_github × min(stars / cap, 1)) × 100
+    """
+    params = params or TECH_MATURITY
+    paper_count, github_stars, num_repos = _arr(paper_count), _arr(github_stars), _arr(num_repos)
+
+    denom = np.maximum(paper_count / params["paper_divisor"], 1.0)
+    product_ratio = np.minimum(num_repos / denom, 1.0)
+    github_score = np.minimum(github_stars / params["stars_cap"], 1.0)
+
+    score = (params["w_product"] * product_ratio + params["w_github"] * github_score) * 100.0
+    return round_like_python(score, 1)
+
+
+def maturity_penalty_factors(num_repos, github_stars, min_repos: int, min_stars: int) -> np.ndarray:
+    """tech_node 경미한 패널티 (레포 < min_repos ×0.90, Stars < min_stars ×0.92)"""
+    num_repos, github_stars = _arr(num_repos), _arr(github_stars)
+    factor = np.where(num_repos < min_repos, 1.0 * 0.90, 1.0)
+    return np.where(github_stars < min_stars, factor * 0.92, factor)
+
+
+def opportunity_scores(tam_usd, cagr, gov_support) -> np.ndarray:
+    """시장 기회 점수 (0~100) = TAM 40 + 성장률 30 + 정부 지원 30"""
+    tam_score = np.minimum(_arr(tam_usd) / 1_000_000_000, 1.0) * 40
+    growth_score = np.minimum(_arr(cagr) / 0.5, 1.0) * 30
+    gov_score = np.where(np.asarray(gov_support, dtype=bool), 30.0, 0.0)
+    return round_like_python(tam_score + growth_score + gov_score, 1)
+
+
+def final_scores(tech_score, market_score, growth_rate, competition) -> np.ndarray:
+    """최종 트렌드 점수 = 0.25 기술 + 0.35 시장 + 0.25 성장률(%) - 0.15 경쟁"""
+    w = FINAL_WEIGHTS
+    score = (
+        w["tech"] * _arr(tech_score) +
+        w["market"] * _arr(market_score) +
+        w["growth"] * (_arr(growth_rate) * 100) -
+        w["competition"] * _arr(competition)
+    )
+    return round_like_python(score, 1)
+
+
+# ==========================================
+# 테마 점수 (cross_node)
+# ==========================================
+def theme_scores(avg_tech, avg_market, avg_cagr, competition, weights=THEME_WEIGHTS) -> np.ndarray:
+    """
+    테마 종합 점수 = w0 기술 + w1 시장 + w2 min(CAGR×100/50, 100) + w3 경쟁, 0 미만은 0
+
+    weights: (4,) 이면 결과 shape (N,), (W, 4) 이면 가중치 조합별 (W, N)
+    """
+    weights = _arr(weights)
+    growth = np.minimum(_arr(avg_cagr) * 100 / 50, 100)
+    columns = (_arr(avg_tech), _arr(avg_market), growth, _arr(competition))
+
+    if weights.ndim == 2:
+        w = [weights[:, i:i + 1] for i in range(4)]  # (W, 1) → 테마 축으로 broadcast
+    else:
+        w = list(weights)
+
+    score = w[0] * columns[0] + w[1] * columns[1] + w[2] * columns[2] + w[3] * columns[3]
+    return round_like_python(np.maximum(score, 0), 1)
+
+
+# ==========================================
+# 경쟁 강도
+# ==========================================
+def _competition_one(tech_name: str, market_name: str) -> float:
+    tech_lower = tech_name.lower()
+    market_lower = market_name.lower()
+
+    max_score = 50.0  # 기본값
+    for key, score in COMPETITION_MAP.items():
+        if key.lower() in tech_lower:
+            max_score = max(max_score, score)
+
+    if "sme" in market_lower or "enterprise" in market_lower:
+        max_score = min(max_score + 5, 100)
+
+    return float(max_score)
+
+
+def competition_scores(tech_names: Sequence[str], market_names: Optional[Iterable[str]] = None) -> np.ndarray:
+    """경쟁 강도 (0~100), 같은 (기술, 시장) 조합은 1번만 계산"""
+    market_names = list(market_names) if market_names is not None else [""] * len(tech_names)
+    memo = {}
+    out = np.empty(len(tech_names), dtype=np.float64)
+    for i, pair in enumerate(zip(tech_names, market_names)):
+        if pair not in memo:
+            memo[pair] = _competition_one(*pair)
+        out[i] = memo[pair]
+    return out
@@ -0,0 +1,175 @@
+# utils/translator.py
+"""
+RAG 질의 번역 (한국어 → 영어)
+- 질의 → 번역 결과를 응답 캐시(source="translation")에 저장 → 같은 질의는 LLM 호출 없음
+- ChatOpenAI 클라이언트 1개 재사용, 캐시 miss 질의는 JSON 배열 1번 호출로 일괄 번역
+- backend="offline"(또는 OPENAI_API_KEY 없음)이면 네트워크 없이 용어집 치환으로 번역 (테스트용)
+- ASCII 질의는 그대로 반환
+"""
+import json
+import os
+import re
+import sys
+import threading
+from typing import List, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from utils.logger import logger
+from utils.response_cache import response_cache
+
+CACHE_SOURCE = "translation"
+
+BATCH_PROMPT = (
+    "Translate each Korean text in the JSON array below into English, preserving technical "
+    "and analytical meaning. Reply with only a JSON array of strings in the same order "
+    "and of the same length.\n\n{payload}"
+)
+
+# 오프라인 번역 용어집 (RAG 질의에 자주 쓰는 표현, 긴 표현 우선 치환)
+OFFLINE_GLOSSARY = {
+    "산업별 적용 사례": "industry use cases",
+    "성공 요인": "success factors",
+    "주요 도전과제": "key challenges",
+    "도전과제": "challenges",
+    "예상되는 주요 변화": "expected major changes",
+    "투자 및 시장 전망": "investment and market outlook",
+    "시장 전망": "market outlook",
+    "구체적인 사례와 수치": "concrete examples and figures",
+    "트렌드": "trends",
+    "분석": "analysis",
+    "기술": "technology",
+    "시장": "market",
+    "기업": "companies",
+    "산업": "industry",
+    "투자": "investment",
+    "전망": "outlook",
+    "향후": "next",
+    "5년": "5 years",
+    "년": "",
+    "생성형": "generative",
+    "인공지능": "AI",
+    "자동화": "automation",
+    "일자리": "jobs",
+    "노동": "labor",
+    "생산성": "productivity",
+}
+_HANGUL = re.compile(r"[가-힣ㄱ-ㆎ]+")
+
+
+def offline_translate(text: str) -> str:
+    """네트워크 없는 근사 번역: 용어집 치환 후 남은 한글 제거 (영문 기술명은 유지)"""
+    for korean in sorted(OFFLINE_GLOSSARY, key=len, reverse=True):
+        text = text.replace(korean, f" {OFFLINE_GLOSSARY[korean]} ")
+    text = _HANGUL.sub(" ", text)
+    return " ".join(text.split())
+
+
+class QueryTranslator:
+    """캐시 + 일괄 번역기"""
+
+    def __init__(self, model: str, backend: str = "llm", max_batch: int = 16):
+        self.model = model
+        self.backend = backend
+        self.max_batch = max_batch
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def offline(self) -> bool:
+        return self.backend == "offline" or not settings.OPENAI_API_KEY
+
+    def _llm(self):
+        """ChatOpenAI 클라이언트 (첫 사용 시 1번만 생성)"""
+        with self._lock:
+            if self._client is None:
+                from langchain_openai import ChatOpenAI
+                from utils.llm_cache import llm_cache
+                from utils.instrumentation import metrics
+                self._client = ChatOpenAI(
+                    model=self.model,
+                    temperature=0,
+                    openai_api_key=settings.OPENAI_API_KEY,
+                    cache=llm_cache,
+                    callbacks=[metrics.llm_callback]
+                )
+            return self._client
+
+    def _cache_params(self, text: str) -> dict:
+        backend = "offline" if self.offline else self.model
+        return {"text": text, "backend": backend}
+
+    # ------------------------------------------
+    # 번역
+    # ------------------------------------------
+    def translate(self, query: str) -> str:
+        return self.translate_many([query])[0]
+
+    def translate_many(self, queries: List[str]) -> List[str]:
+        """질의 목록 번역 (순서 유지), 캐시 miss만 일괄 번역"""
+        results: List[Optional[str]] = []
+        pending = []
+        for query in queries:
+            if query.isascii() or query in pending:
+                results.append(query if query.isascii() else None)
+                continue
+            cached = response_cache.get(CACHE_SOURCE, self._cache_params(query))
+            results.append(cached)
+            if cached is None:
+                pending.append(query)
+
+        if pending:
+            translated = {}
+            for start in range(0, len(pending), self.max_batch):
+                batch = pending[start:start + self.max_batch]
+                translated.update(zip(batch, self._translate_batch(batch)))
+            results = [
+                translated.get(query, query) if result is None else result
+                for query, result in zip(queries, results)
+            ]
+        return results
+
+    def _translate_batch(self, texts: List[str]) -> List[str]:
+        if self.offline:
+            translations = [offline_translate(text) for text in texts]
+        else:
+            translations = self._translate_llm(texts)
+
+        for text, translation in zip(texts, translations):
+            if translation is not None:
+                response_cache.put(CACHE_SOURCE, self._cache_params(text), translation)
+        # 실패한 질의는 원문으로 진행 (캐시에 남기지 않음)
+        return [translation or text for text, translation in zip(texts, translations)]
+
+    def _translate_llm(self, texts: List[str]) -> List[Optional[str]]:
+        """JSON 배열 1번 호출, 형식이 어긋나면 질의별 호출로 대체"""
+        llm = self._llm()
+        if len(texts) > 1:
+            try:
+                response = llm.invoke(BATCH_PROMPT.format(payload=json.dumps(texts, ensure_ascii=False)))
+                content = response.content.strip()
+                content = content[content.find("["):content.rfind("]") + 1]
+                parsed = json.loads(content)
+                if isinstance(parsed, list) and len(parsed) == len(texts) and all(isinstance(p, str) for p in parsed):
+                    return [p.strip() for p in parsed]
+                logger.warning(f"⚠️ 일괄 번역 응답 형식 불일치 → 질의별 번역")
+            except Exception as e:
+                logger.warning(f"⚠️ 일괄 번역 실패 → 질의별 번역: {e}")
+
+        translations = []
+        for text in texts:
+            try:
+                prompt = f"Translate the following Korean text into English, preserving technical and analytical meaning:\n\n{text}"
+                translations.append(llm.invoke(prompt).content.strip())
+            except Exception as e:
+                logger.error(f"⚠️ 질의 번역 실패 (원문으로 진행): {e}")
+                translations.append(None)
+        return translations
+
+
+# 전역 번역기
+translator = QueryTranslator(
+    model=settings.TRANSLATION["model"],
+    backend=settings.TRANSLATION["backend"],
+    max_batch=settings.TRANSLATION["max_batch"]
+)
@@ -0,0 +1,125 @@
+# utils/weight_sweep.py
+"""
+테마 점수 가중치 민감도 분석 (cross_node 랭킹 안정성)
+- 가중치 벡터 (기술, 시장, 성장률, 경쟁 패널티) 수천 개를 격자 또는 Monte-Carlo로 생성
+- scoring_engine.theme_scores로 (가중치 × 테마) 점수 행렬을 한 번에 계산 → 랭킹 통계
+- 수집 / LLM 호출 없음 (저장된 tech_trends, market_trends만 사용)
+"""
+import itertools
+import os
+import sys
+from typing import Dict, List, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from utils.scoring_engine import THEME_WEIGHTS, theme_scores
+
+# 비교용 이름 있는 가중치 (경쟁은 패널티이므로 음수)
+NAMED_WEIGHTS = {
+    "current": THEME_WEIGHTS,                 # cross_node 현재 가중치
+    "readme": (0.20, 0.25, 0.25, -0.15),      # README 평가 기준 (B2B 적합성 → 성장률 항목에 대응)
+}
+
+
+def sample_weights(mode: str = "monte_carlo", samples: int = 5000, step: float = 0.05, seed: int = 42) -> np.ndarray:
+    """
+    가중치 행렬 (W, 4) 생성 - 4개 항목 크기의 합은 1, 경쟁 항목은 음수
+
+    mode:
+        "monte_carlo": Dirichlet(1,1,1,1) 균등 샘플 samples개
+        "grid": step 간격 단체(simplex) 격자 전체
+    """
+    if mode == "grid":
+        ticks = int(round(1 / step))
+        magnitudes = np.array([
+            (a, b, c, ticks - a - b - c)
+            for a, b, c in itertools.product(range(ticks + 1), repeat=3)
+            if a + b + c <= ticks
+        ], dtype=np.float64) / ticks
+    elif mode == "monte_carlo":
+        magnitudes = np.random.default_rng(seed).dirichlet(np.ones(4), size=samples)
+    else:
+        raise ValueError(f"알 수 없는 스윕 모드: {mode} (grid | monte_carlo)")
+
+    return magnitudes * np.array([1.0, 1.0, 1.0, -1.0])
+
+
+def rank_matrix(scores: np.ndarray) -> np.ndarray:
+    """
+    점수 행렬 (W, N) → 순위 행렬 (W, N), 1위가 1
+    - 동점은 입력 순서 우선 (cross_node의 안정 정렬과 동일)
+    """
+    order = np.argsort(-scores, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, scores.shape[1] + 1)[None, :], axis=1)
+    return ranks
+
+
+def sweep_theme_weights(
+    theme_inputs: Dict[str, Dict],
+    weights: np.ndarray,
+    top_k: int = 5,
+    baseline: Optional[tuple] = None
+) -> Dict:
+    """
+    가중치 조합별 테마 랭킹 안정성 통계
+
+    Args:
+        theme_inputs: cross_node.theme_score_inputs() 결과
+        weights: (W, 4) 가중치 행렬
+        top_k: Top-K 포함 확률 기준
+        baseline: 비교 기준 가중치 (기본: 현재 THEME_WEIGHTS)
+    """
+    names: List[str] = list(theme_inputs)
+    columns = [
+        [theme_inputs[name][field] for name in names]
+        for field in ("avg_tech", "avg_market", "avg_cagr", "competition")
+    ]
+    baseline = baseline or THEME_WEIGHTS
+
+    baseline_scores = theme_scores(*columns, weights=baseline)
+    baseline_ranks = rank_matrix(baseline_scores[None, :])[0]
+    baseline_top = baseline_ranks <= top_k
+
+    scores = theme_scores(*columns, weights=weights)   # (W, N)
+    ranks = rank_matrix(scores)
+    top_mask = ranks <= top_k
+
+    themes = {}
+    for j, name in enumerate(names):
+        theme_ranks = ranks[:, j]
+        themes[name] = {
+            "baseline_rank": int(baseline_ranks[j]),
+            "baseline_score": float(baseline_scores[j]),
+            "mean_rank": round(float(theme_ranks.mean()), 3),
+            "std_rank": round(float(theme_ranks.std()), 3),
+            "min_rank": int(theme_ranks.min()),
+            "max_rank": int(theme_ranks.max()),
+            "p_same_rank": round(float(np.mean(theme_ranks == baseline_ranks[j])), 4),
+            "p_top1": round(float(np.mean(theme_ranks == 1)), 4),
+            f"p_top{top_k}": round(float(np.mean(top_mask[:, j])), 4),
+            "rank_distribution": {
+                int(r): int(c) for r, c in zip(*np.unique(theme_ranks, return_counts=True))
+            },
+        }
+
+    same_order = np.all(ranks == baseline_ranks[None, :], axis=1)
+    same_top_set = np.all(top_mask == baseline_top[None, :], axis=1)
+
+    return {
+        "num_weights": int(len(weights)),
+        "num_themes": len(names),
+        "top_k": top_k,
+        "baseline_weights": [float(w) for w in baseline],
+        "p_same_order": round(float(same_order.mean()), 4),
+        f"p_same_top{top_k}_set": round(float(same_top_set.mean()), 4),
+        "named": {
+            label: dict(zip(
+                names,
+                (int(r) for r in rank_matrix(theme_scores(*columns, weights=w)[None, :])[0])
+            ))
+            for label, w in NAMED_WEIGHTS.items()
+        },
+        "themes": dict(sorted(themes.items(), key=lambda kv: kv[1]["baseline_rank"])),
+    }